@@ -0,0 +1,97 @@
+"""Benchmark season queries of the analytics store over synthetic gifts.
+
+Fills a throwaway database with N gifts (default 100k, ~10 components and
+~25 log entries each) through AnalyticsStore.export and times the queries
+used by scripts/query_analytics.py.
+
+Usage:
+    uv run python scripts/bench_analytics.py
+    uv run python scripts/bench_analytics.py --gifts 10000 --db /tmp/analytics.db
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from elfactory.core.state import Component, ManufacturingLogEntry, WorkshopState
+from elfactory.services.analytics_store import AnalyticsStore
+
+ARTISANS = [
+    "3d_printer_elf", "woodworker_elf", "blacksmith_elf", "painter_elf", "mechanic_elf",
+    "electronics_elf", "fabric_elf", "glass_elf", "polish_elf", "decal_elf",
+]
+STATUSES = ["completed"] * 90 + ["degraded"] * 5 + ["cancelled"] * 3 + ["failed"] * 2
+
+
+def synthetic_gift(i: int, rng: random.Random) -> WorkshopState:
+    created = datetime(2025, 12, 1) + timedelta(seconds=i * 20)
+    finished = created + timedelta(seconds=rng.lognormvariate(5.5, 0.4))
+    components = [
+        Component(
+            id=f"part_{j}", type="part", material="PLA", dimensions="10x10x10cm",
+            details="", created_by=rng.choice(ARTISANS), timestamp=created,
+        )
+        for j in range(rng.randint(5, 15))
+    ]
+    log = [
+        ManufacturingLogEntry(agent=c.created_by, action="build", details="", timestamp=created)
+        for c in components
+    ] * 2
+    return WorkshopState(
+        gift_id=f"GIFT-{i:07d}",
+        status=rng.choice(STATUSES),
+        components=components,
+        manufacturing_log=log,
+        created_at=created,
+        updated_at=finished,
+    )
+
+
+def timed(fn, repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Analytics store benchmark")
+    parser.add_argument("--gifts", type=int, default=100_000)
+    parser.add_argument("--db", default="", help="Database path (default: a temporary file)")
+    args = parser.parse_args()
+
+    db = Path(args.db) if args.db else Path(tempfile.mkdtemp()) / "analytics.db"
+    store = AnalyticsStore(db)
+    rng = random.Random(42)
+
+    started = time.perf_counter()
+    for i in range(args.gifts):
+        store.export(synthetic_gift(i, rng))
+    export_s = time.perf_counter() - started
+    print(f"exported {args.gifts} gifts in {export_s:.1f}s ({export_s / args.gifts * 1000:.2f} ms/gift) -> {db}")
+
+    store.export(synthetic_gift(0, random.Random(0)))  # re-export keeps rollups consistent
+    rollup = dict(store.query("SELECT agent, components FROM agent_stats"))
+    detail = dict(store.query("SELECT created_by, COUNT(*) FROM components GROUP BY created_by"))
+    consistent = rollup == detail
+
+    for label, fn in (
+        ("season summary", store.season_summary),
+        ("busiest agents", store.busiest_agents),
+        ("gifts per day", store.gifts_per_day),
+        ("p95 latency", lambda: store.latency_percentile(0.95)),
+    ):
+        print(f"{label:<16} {timed(fn):8.2f} ms")
+    print(f"{'✓' if consistent else '✗'} agent rollups match component rows")
+    return 0 if consistent else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
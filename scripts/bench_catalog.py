@@ -0,0 +1,82 @@
+"""Benchmark local product catalog lookups over a synthetic catalog.
+
+Builds N products (default 1M) with names, categories, age ranges and
+prices, optionally writes them as JSONL, and times typical online-shopper
+queries with and without age/price filters.
+
+Usage:
+    uv run python scripts/bench_catalog.py
+    uv run python scripts/bench_catalog.py --items 200000 --write /tmp/catalog.jsonl
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+
+from elfactory.services.product_catalog import ProductCatalog
+
+BRANDS = ["LEGO", "Playmobil", "Hasbro", "Mattel", "Ravensburger", "Clementoni", "Nintendo", "Sony", "Chicco", "Hot Wheels"]
+THEMES = ["Star Wars", "Harry Potter", "Frozen", "Pokemon", "Minecraft", "dinosauri", "unicorno", "spazio", "pirati", "fattoria"]
+KINDS = ["set costruzioni", "puzzle 1000 pezzi", "peluche", "gioco da tavolo", "videogioco", "libro", "macchinina", "bambola", "robot", "kit scienza"]
+CATEGORIES = ["costruzioni", "puzzle", "peluche", "giochi da tavolo", "videogiochi", "libri", "veicoli", "bambole", "robotica", "scienza"]
+QUERIES = [
+    ("LEGO Star Wars", None, None),
+    ("peluche unicorno", 4, None),
+    ("puzzle Harry Potter", 10, 30.0),
+    ("videogioco Pokemon Nintendo", 8, 60.0),
+    ("kit scienza spazio", 9, None),
+    ("robot dinosauri", None, 50.0),
+]
+
+
+def synthetic_items(n: int, seed: int = 42):
+    rng = random.Random(seed)
+    for i in range(n):
+        k = rng.randrange(len(KINDS))
+        age_min = rng.choice([0, 3, 4, 6, 8, 10, 12])
+        yield {
+            "id": f"SKU{i:08d}",
+            "name": f"{rng.choice(BRANDS)} {rng.choice(THEMES)} {KINDS[k]} {i % 997}",
+            "category": CATEGORIES[k],
+            "age_min": age_min,
+            "age_max": age_min + rng.choice([4, 6, 99]),
+            "price": round(rng.uniform(5, 150), 2),
+            "url": f"https://shop.example/p/{i}",
+            "retailer": rng.choice(["Amazon", "Toys Center", "Feltrinelli", "MediaWorld"]),
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Product catalog benchmark")
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--write", default="", help="Also write the catalog as JSONL to this path")
+    args = parser.parse_args()
+
+    if args.write:
+        with open(args.write, "w", encoding="utf-8") as f:
+            for item in synthetic_items(args.items):
+                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+        started = time.perf_counter()
+        catalog = ProductCatalog.load(args.write)
+    else:
+        started = time.perf_counter()
+        catalog = ProductCatalog(synthetic_items(args.items))
+    print(f"built index over {len(catalog)} products in {time.perf_counter() - started:.1f}s "
+          f"({len(catalog.index)} words)")
+
+    for query, age, max_price in QUERIES:
+        times = []
+        for _ in range(10):
+            started = time.perf_counter()
+            results = catalog.search(query, age=age, max_price=max_price)
+            times.append((time.perf_counter() - started) * 1000)
+        best = results[0]["name"] if results else "-"
+        print(f"{query!r:32} age={age!s:4} max_price={max_price!s:5} {statistics.median(times):7.2f} ms  {best}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
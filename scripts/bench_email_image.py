@@ -0,0 +1,86 @@
+"""Compare response email size and encode time with the original and the email-sized gift image.
+
+A synthetic 1024x1024 PNG (gradients plus noise, sized like a DALL-E image)
+stands in for a generated gift; pass --image to use a real one. For each
+variant it reports the MIME message size, the request payload when sent as
+a base64 "raw" field versus a media upload, and the time to prepare it.
+
+Usage:
+    uv run --extra images python scripts/bench_email_image.py
+    uv run --extra images python scripts/bench_email_image.py --image logs/images/GIFT-1.png --format webp
+"""
+
+import argparse
+import base64
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from elfactory.services.email_images import email_variant, thumbnail
+from elfactory.services.outbox import MEDIA_UPLOAD_MIN_BYTES, build_message
+
+HTML = "<html><body><p>Caro bambino, ecco il tuo regalo!</p>[IMAGE_PLACEHOLDER]</body></html>"
+
+
+def synthetic_png(path: Path, side: int = 1024) -> None:
+    from PIL import Image
+
+    y, x = np.mgrid[0:side, 0:side] / side
+    rgb = np.stack([x, y, (x + y) / 2], axis=-1) * 200
+    rgb += np.random.default_rng(0).normal(0, 12, rgb.shape)
+    Image.fromarray(np.clip(rgb, 0, 255).astype(np.uint8)).save(path, format="PNG")
+
+
+def measure(label: str, image: Path, prepare_seconds: float) -> None:
+    start = time.perf_counter()
+    raw = build_message("child@example.com", "Il tuo regalo", HTML, str(image))
+    encoded = len(base64.urlsafe_b64encode(raw))
+    encode_ms = (time.perf_counter() - start) * 1000
+    upload = "media" if len(raw) >= MEDIA_UPLOAD_MIN_BYTES else "raw"
+    sent = len(raw) if upload == "media" else encoded
+    print(f"{label:<10} image {image.stat().st_size:>9,} B  message {len(raw):>9,} B  "
+          f"raw field {encoded:>9,} B  sent ({upload}) {sent:>9,} B  "
+          f"prepare {prepare_seconds * 1000:7.1f} ms  build {encode_ms:6.1f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Email image size benchmark")
+    parser.add_argument("--image", default="", help="Gift image (default: synthetic 1024x1024 PNG)")
+    parser.add_argument("--max-side", type=int, default=768)
+    parser.add_argument("--max-bytes", type=int, default=150_000)
+    parser.add_argument("--format", default="jpeg", choices=["jpeg", "webp"])
+    args = parser.parse_args()
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("✗ Pillow is not installed (uv sync --extra images)", file=sys.stderr)
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "GIFT-BENCH.png"
+        if args.image:
+            source.write_bytes(Path(args.image).read_bytes())
+        else:
+            synthetic_png(source)
+
+        measure("original", source, 0.0)
+        start = time.perf_counter()
+        variant = email_variant(source, args.max_side, args.max_bytes, args.format)
+        cold = time.perf_counter() - start
+        measure("email", variant, cold)
+
+        start = time.perf_counter()
+        email_variant(source, args.max_side, args.max_bytes, args.format)
+        print(f"cached variant lookup {(time.perf_counter() - start) * 1000:.2f} ms")
+        start = time.perf_counter()
+        thumb = thumbnail(source)
+        print(f"thumbnail {thumb.stat().st_size:,} B in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""Import-time benchmark with regression budgets.
+
+Runs `python -X importtime -c "import <module>"` several times in fresh
+interpreters and compares the median cumulative import time of each module
+with its budget. Also checks that heavy dependencies are not imported.
+Exits with status 1 if any budget is exceeded.
+
+Usage:
+    uv run python scripts/bench_import_time.py
+    uv run python scripts/bench_import_time.py --runs 10 --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# module -> (budget in ms, modules that must not be imported)
+BUDGETS = {
+    "elfactory.core": (50, ["elfactory.core.orchestrator", "datapizza", "openai", "googleapiclient"]),
+    "elfactory.tools": (50, ["elfactory.tools.email_tools", "openai", "googleapiclient"]),
+    "elfactory.tools.state_tools": (600, ["openai", "googleapiclient", "google_auth_oauthlib"]),
+}
+
+
+def import_profile(module: str) -> tuple[dict[str, int], set[str]]:
+    """
+    Profile `import module` in a fresh interpreter.
+
+    Returns:
+        Cumulative import time (us) of module and of everything it imported,
+        and the set of all modules loaded by the interpreter
+    """
+    env = {k: v for k, v in os.environ.items() if k != "OPENAI_API_KEY"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cum, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(cum), depth))
+
+    # Children are printed before their parent; the target's subtree is the run
+    # of nested entries just before its top-level line (interpreter startup
+    # imports come earlier and are excluded).
+    end = max(i for i, (name, _, depth) in enumerate(entries) if depth == 0)
+    start = end
+    while start > 0 and entries[start - 1][2] > 0:
+        start -= 1
+    cumulative = {name: cum for name, cum, _ in entries[start:end + 1]}
+    return cumulative, {name for name, _, _ in entries}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import-time regression check")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per module (median is used)")
+    parser.add_argument("--top", type=int, default=0, help="Show the N slowest imports per module")
+    args = parser.parse_args()
+
+    failed = False
+    for module, (budget_ms, forbidden) in BUDGETS.items():
+        runs = [import_profile(module) for _ in range(args.runs)]
+        median_ms = statistics.median(r[0][module] for r in runs) / 1000
+        imported = runs[0][1]
+        leaked = [m for m in forbidden if m in imported]
+
+        ok = median_ms <= budget_ms and not leaked
+        failed |= not ok
+        print(f"{'✓' if ok else '✗'} import {module:<30} {median_ms:8.1f} ms (budget {budget_ms} ms)")
+        if leaked:
+            print(f"    unexpected imports: {', '.join(leaked)}")
+        if args.top:
+            slowest = sorted(runs[0][0].items(), key=lambda kv: kv[1], reverse=True)[1:args.top + 1]
+            for name, us in slowest:
+                print(f"    {us / 1000:8.1f} ms  {name}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Compare worker memory: pre-forked workers vs. independent processes.
+
+Linux only (reads /proc/<pid>/smaps_rollup). No API calls are made; the
+agents are only built. Usage:
+
+    OPENAI_API_KEY=dummy uv run python scripts/bench_prefork_memory.py --workers 4
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+from elfactory.core.prefork import PreforkPool
+
+INDEPENDENT_WORKER = """
+import sys, time
+t = time.monotonic()
+from elfactory.core.orchestrator import get_orchestrator
+get_orchestrator()
+print(f"{time.monotonic() - t:.3f}", flush=True)
+sys.stdin.read()
+"""
+
+
+def memory_kb(pid: int) -> dict[str, int]:
+    """Rss, Pss and private (USS) memory of a process, in kB."""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:", "Private_Clean:", "Private_Dirty:"):
+                values[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": values["Rss"],
+        "pss": values["Pss"],
+        "uss": values["Private_Clean"] + values["Private_Dirty"],
+    }
+
+
+def ping(task: dict) -> dict:
+    return {"ok": True, "served_at": time.monotonic()}
+
+
+def summarize(label: str, pids: list[int], ready_s: float) -> None:
+    stats = [memory_kb(pid) for pid in pids]
+    n = len(stats)
+    print(f"{label:<22} ready {ready_s * 1000:8.1f} ms   "
+          f"avg RSS {sum(s['rss'] for s in stats) / n / 1024:7.1f} MB   "
+          f"avg PSS {sum(s['pss'] for s in stats) / n / 1024:7.1f} MB   "
+          f"avg USS {sum(s['uss'] for s in stats) / n / 1024:7.1f} MB   "
+          f"total PSS {sum(s['pss'] for s in stats) / 1024:7.1f} MB")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    # Pre-forked: build once, fork, time until every worker has served a task
+    pool = PreforkPool(args.workers, ping)
+    pool.start()
+    forked_at = time.monotonic()
+    for i in range(args.workers):
+        pool.submit({"id": str(i)})
+    results = []
+    while len(results) < args.workers:
+        results.extend(pool.results(timeout=5))
+    prefork_ready = max(r["served_at"] for r in results) - forked_at
+    summarize("pre-forked workers", pool.pids, prefork_ready)
+
+    # Independent processes: each imports and builds the agents itself
+    started = time.monotonic()
+    procs = [
+        subprocess.Popen([sys.executable, "-c", INDEPENDENT_WORKER],
+                         stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        for _ in range(args.workers)
+    ]
+    for proc in procs:
+        proc.stdout.readline()
+    independent_ready = time.monotonic() - started
+    summarize("independent processes", [p.pid for p in procs], independent_ready)
+
+    for proc in procs:
+        proc.stdin.close()
+        proc.wait()
+    pool.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
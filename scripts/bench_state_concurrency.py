@@ -0,0 +1,160 @@
+"""Benchmark concurrent WorkshopState writers against read_project_state-style readers.
+
+Simulates artisans writing components and log entries to one gift while
+managers serialize the whole state. Compares the lock-striped state
+(readers snapshot, then dump without locks) with a single coarse lock held
+during serialization, and checks that no write is lost or reordered.
+
+Usage:
+    uv run python scripts/bench_state_concurrency.py
+    uv run python scripts/bench_state_concurrency.py --artisans 20 --parts 50 --readers 4
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+
+from elfactory.core.state import WorkshopState
+
+
+class CoarseLockedState:
+    """Baseline: one lock for every write and for the full serialization."""
+
+    def __init__(self, state: WorkshopState):
+        self.state = state
+        self.lock = threading.Lock()
+
+    def write(self, component: dict, agent: str) -> None:
+        with self.lock:
+            self.state.add_component(component)
+            self.state.log_action(agent, "build", component["id"])
+
+    def read(self) -> str:
+        with self.lock:
+            return self.state.model_dump_json(indent=2)
+
+
+class StripedState:
+    """The state's own mutation API and snapshot()."""
+
+    def __init__(self, state: WorkshopState):
+        self.state = state
+
+    def write(self, component: dict, agent: str) -> None:
+        self.state.add_component(component)
+        self.state.log_action(agent, "build", component["id"])
+
+    def read(self) -> str:
+        return self.state.snapshot().model_dump_json(indent=2)
+
+
+def prefill(state: WorkshopState, components: int) -> None:
+    """Give the state a realistic size so that serialization is not trivial."""
+    for i in range(components):
+        state.add_component(component(f"existing_{i}", "prefill"))
+        state.log_action("prefill", "build", f"existing_{i}")
+
+
+def component(component_id: str, agent: str) -> dict:
+    return {
+        "id": component_id,
+        "type": "part",
+        "material": "red PLA",
+        "dimensions": "15x10x5cm",
+        "details": "benchmark component " * 5,
+        "created_by": agent,
+    }
+
+
+def run(wrapper, artisans: int, parts: int, readers: int) -> dict:
+    write_latencies: list[float] = []
+    reads = 0
+    stop = threading.Event()
+    lock = threading.Lock()
+    barrier = threading.Barrier(artisans + readers + 1)
+
+    def artisan(index: int) -> None:
+        agent = f"artisan_{index}"
+        local = []
+        barrier.wait()
+        for part in range(parts):
+            started = time.perf_counter()
+            wrapper.write(component(f"{agent}_{part}", agent), agent)
+            local.append(time.perf_counter() - started)
+        with lock:
+            write_latencies.extend(local)
+
+    def reader() -> None:
+        nonlocal reads
+        count = 0
+        barrier.wait()
+        while not stop.is_set():
+            wrapper.read()
+            count += 1
+        with lock:
+            reads += count
+
+    writers = [threading.Thread(target=artisan, args=(i,)) for i in range(artisans)]
+    reader_threads = [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in writers + reader_threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in writers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    for thread in reader_threads:
+        thread.join()
+
+    write_latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "writes_per_s": len(write_latencies) / elapsed,
+        "reads_per_s": reads / elapsed,
+        "p50_ms": statistics.median(write_latencies) * 1000,
+        "p99_ms": write_latencies[int(len(write_latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def check_integrity(state: WorkshopState, artisans: int, parts: int, prefilled: int) -> bool:
+    """Every write is present once, and each artisan's writes are in order."""
+    if len(state.components) != prefilled + artisans * parts:
+        return False
+    if len(state.manufacturing_log) != prefilled + artisans * parts:
+        return False
+    for index in range(artisans):
+        agent = f"artisan_{index}"
+        ids = [c.id for c in state.components if c.created_by == agent]
+        if ids != [f"{agent}_{part}" for part in range(parts)]:
+            return False
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="WorkshopState concurrency benchmark")
+    parser.add_argument("--artisans", type=int, default=20, help="Concurrent writer threads")
+    parser.add_argument("--parts", type=int, default=50, help="Components written per artisan")
+    parser.add_argument("--readers", type=int, default=2, help="Concurrent read_project_state threads")
+    parser.add_argument("--prefill", type=int, default=200, help="Components already in the state")
+    args = parser.parse_args()
+
+    ok = True
+    for label, wrapper_cls in (("coarse lock", CoarseLockedState), ("lock-striped", StripedState)):
+        state = WorkshopState(gift_id="GIFT-BENCH", gift_request="benchmark")
+        prefill(state, args.prefill)
+        result = run(wrapper_cls(state), args.artisans, args.parts, args.readers)
+        intact = check_integrity(state, args.artisans, args.parts, args.prefill)
+        ok &= intact
+        print(f"{label:<13} {result['elapsed'] * 1000:8.1f} ms   "
+              f"writes/s {result['writes_per_s']:9.0f}   reads/s {result['reads_per_s']:7.1f}   "
+              f"write p50 {result['p50_ms']:7.3f} ms   p99 {result['p99_ms']:7.3f} ms   "
+              f"{'✓ intact' if intact else '✗ lost or reordered writes'}")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""Microbenchmark of state record construction, writes and serialization.
+
+Compares the validated pydantic models WorkshopState used to build for every
+component and log entry with the slotted records of the internal write path,
+over N components and N log entries (default 10k each). Writes are measured
+detached and with an event log attached as GiftSession attaches it (metrics
+and persistence to a temporary directory); the baseline then builds a
+validated event with a JSON dump of the record for every write, as the
+previous event log did. The event writer thread is held back during the
+attached writes and its persistence time is reported separately. Both
+sides of every dump use compact JSON.
+
+Usage:
+    uv run python scripts/bench_state_writes.py
+    uv run python scripts/bench_state_writes.py -n 50000 --repeat 7
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+from pydantic_core import to_json
+
+from elfactory.config import settings
+from elfactory.core.events import EventLog, EventPersistence, EventStore, EventWriter, MetricsProjection
+from elfactory.core.state import Component, ManufacturingLogEntry, WorkshopState
+
+
+class ValidatedComponent(BaseModel):
+    """The previous pydantic Component."""
+    id: str
+    type: str
+    material: str
+    dimensions: str
+    details: str
+    created_by: str
+    status: str = "completed"
+    timestamp: datetime = Field(default_factory=datetime.now)
+
+
+class ValidatedLogEntry(BaseModel):
+    """The previous pydantic ManufacturingLogEntry."""
+    timestamp: datetime = Field(default_factory=datetime.now)
+    agent: str
+    action: str
+    details: str
+
+
+class ValidatedState(BaseModel):
+    """The record lists of the previous WorkshopState."""
+    components: list[ValidatedComponent] = Field(default_factory=list)
+    manufacturing_log: list[ValidatedLogEntry] = Field(default_factory=list)
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+
+class ValidatedEvent(BaseModel):
+    """The previous pydantic StateEvent."""
+    seq: int
+    type: str
+    timestamp: datetime = Field(default_factory=datetime.now)
+    data: dict[str, Any]
+
+
+class PausedWriter(EventWriter):
+    """Event writer whose thread only starts with the final close(), to time the write path on its own."""
+
+    def __init__(self):
+        super().__init__()
+        self.paused = True
+
+    def _put(self, job: tuple) -> None:
+        if self.paused:
+            self._jobs.put(job)
+        else:
+            super()._put(job)
+
+
+def component_data(i: int) -> dict:
+    return {
+        "id": f"component_{i}",
+        "type": "wheel",
+        "material": "red PLA",
+        "dimensions": "diameter 3cm",
+        "details": "printed at 0.2mm layer height with 20% infill",
+        "created_by": "3d_printer_elf",
+    }
+
+
+def log_data(i: int) -> dict:
+    return {"agent": "3d_printer_elf", "action": "printing", "details": f"printed component_{i}"}
+
+
+def median_ms(repeat: int, fn) -> float:
+    """Median wall time of fn over repeat runs, in ms."""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="State write path microbenchmark")
+    parser.add_argument("-n", type=int, default=10_000, help="Components and log entries")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (median)")
+    args = parser.parse_args()
+    n = args.n
+
+    components = [component_data(i) for i in range(n)]
+    entries = [log_data(i) for i in range(n)]
+
+    validated = ValidatedState(
+        components=[ValidatedComponent(**c) for c in components],
+        manufacturing_log=[ValidatedLogEntry(**e) for e in entries],
+    )
+    fast = WorkshopState(gift_id="GIFT-BENCH")
+    fast.add_components(components, entries)
+
+    def fill_validated() -> None:
+        state = ValidatedState()
+        for entry in entries:
+            state.manufacturing_log.append(ValidatedLogEntry(**entry))
+            state.updated_at = datetime.now()
+        for component in components:
+            state.components.append(ValidatedComponent(**component))
+            state.updated_at = datetime.now()
+
+    def fill_validated_attached() -> None:
+        state, events = ValidatedState(), []
+        for entry in entries:
+            record = ValidatedLogEntry(**entry)
+            state.manufacturing_log.append(record)
+            events.append(ValidatedEvent(seq=len(events), type="action_logged", data=record.model_dump(mode="json")))
+            state.updated_at = datetime.now()
+        for component in components:
+            record = ValidatedComponent(**component)
+            state.components.append(record)
+            events.append(ValidatedEvent(seq=len(events), type="component_added", data=record.model_dump(mode="json")))
+            state.updated_at = datetime.now()
+
+    def fill_state(state: WorkshopState | None = None) -> None:
+        state = state or WorkshopState(gift_id="GIFT-BENCH")
+        for entry in entries:
+            state.log_action(**entry)
+        state.add_components(components, [])
+
+    write_ms, persist_ms = [], []
+
+    def attached(directory: str) -> None:
+        writer = PausedWriter()
+        state = WorkshopState(gift_id="GIFT-BENCH")
+        log = EventLog(state.gift_id)
+        log.subscribe(MetricsProjection())
+        persistence = EventPersistence(EventStore(directory), state.gift_id, settings.event_snapshot_interval, writer)
+        log.subscribe(persistence)
+        log.start(state)
+        started = time.perf_counter()
+        fill_state(state)
+        write_ms.append((time.perf_counter() - started) * 1000)
+        writer.paused = False
+        started = time.perf_counter()
+        persistence.close()
+        persist_ms.append((time.perf_counter() - started) * 1000)
+
+    rows = [
+        ("construct components",
+         median_ms(args.repeat, lambda: [ValidatedComponent(**c) for c in components]),
+         median_ms(args.repeat, lambda: [Component(**c) for c in components])),
+        ("construct log entries",
+         median_ms(args.repeat, lambda: [ValidatedLogEntry(**e) for e in entries]),
+         median_ms(args.repeat, lambda: [ManufacturingLogEntry(**e) for e in entries])),
+        ("dump JSON (whole state)",
+         median_ms(args.repeat, lambda: validated.model_dump_json()),
+         median_ms(args.repeat, lambda: fast.snapshot().model_dump_json())),
+        ("read_project_state (agent_view)",
+         median_ms(args.repeat, lambda: validated.model_dump_json()),
+         median_ms(args.repeat, lambda: to_json(
+             fast.agent_view(settings.agent_log_tail, settings.agent_log_details_chars)
+         ).decode())),
+        ("state writes, detached",
+         median_ms(args.repeat, fill_validated),
+         median_ms(args.repeat, fill_state)),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        for _ in range(args.repeat):
+            attached(tmp)
+    rows.append(("state writes, event log attached",
+                 median_ms(args.repeat, fill_validated_attached), statistics.median(write_ms)))
+
+    print(f"{n} components + {n} log entries, median of {args.repeat} runs")
+    print(f"{'':<32} {'validated':>11} {'fast path':>11} {'speedup':>8}")
+    for label, before, after in rows:
+        print(f"{label:<32} {before:9.1f}ms {after:9.1f}ms {before / after:7.1f}x")
+    print(f"attached: the event writer thread then persists the events in {statistics.median(persist_ms):.1f}ms, "
+          f"in the background and off the state locks")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
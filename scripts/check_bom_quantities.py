@@ -0,0 +1,57 @@
+"""Check the bill-of-materials quantity parser on the formats artisans write.
+
+Units must start with a letter, thousands separators and simple fractions
+must be read as one amount, and dimensions ("10 x 20 cm") or codes like
+"A4" must not be taken as a quantity.
+
+Usage:
+    uv run python scripts/check_bom_quantities.py
+"""
+
+import sys
+
+from elfactory.services.bom_planner import parse_quantity
+
+CASES = [
+    ("250 g", (250.0, "g")),
+    ("1,5 kg", (1500.0, "g")),
+    ("0.125 kg", (125.0, "g")),
+    ("2-3 m", (3000.0, "mm")),
+    ("x4", (4.0, "pcs")),
+    ("2x", (2.0, "pcs")),
+    ("10 pz", (10.0, "pcs")),
+    ("2 sheets", (2.0, "sheets")),
+    ("3 m²", (3_000_000.0, "mm2")),
+    ("1 000 g", (1000.0, "g")),
+    ("1.000 g", (1000.0, "g")),
+    ("1,000 g", (1000.0, "g")),
+    ("1,000.5 g", (1000.5, "g")),
+    ("1/2 kg", (500.0, "g")),
+    ("1 1/2 l", (1500.0, "ml")),
+    ("10 x 20 cm", (1.0, "pcs")),
+    ("20x10x8cm", (1.0, "pcs")),
+    ("10cm x 20cm", (1.0, "pcs")),
+    ("4 pcs, 10x20 cm", (4.0, "pcs")),
+    ("A4 sheet", (1.0, "pcs")),
+    ("M3 screws x 8", (8.0, "pcs")),
+    ("some glue", (1.0, "pcs")),
+]
+
+
+def main() -> int:
+    failures = [
+        f"parse_quantity({text!r}) is {parse_quantity(text)}, expected {expected}"
+        for text, expected in CASES
+        if parse_quantity(text) != expected
+    ]
+
+    if failures:
+        for failure in failures:
+            print(f"✗ {failure}")
+        return 1
+    print(f"✓ {len(CASES)} quantities parsed as expected")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
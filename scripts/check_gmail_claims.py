@@ -0,0 +1,126 @@
+"""Check the Gmail claim protocol with several monitors sharing a fake mailbox.
+
+Runs N monitor threads, each with its own GmailService and owner label, over
+one FakeGmailApi holding letters and spam. Every letter must be processed by
+exactly one monitor and end labelled done and read; some processing fails
+once to exercise the failed label and the retry. Two more checks cover
+letters every contender yielded: they must not stay hidden behind the
+processing label without an owner.
+
+Usage:
+    uv run python scripts/check_gmail_claims.py
+    uv run python scripts/check_gmail_claims.py --monitors 8 --letters 200 --latency 0.002
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+from elfactory.services.fake_gmail import FakeGmailApi
+from elfactory.services.gmail_service import GmailService
+
+QUERY = "subject:letterina"
+
+
+def run_monitor(gmail: GmailService, processed: Counter, fail_once: set, lock: threading.Lock, idle_polls: int):
+    """Poll, claim, process and complete until the mailbox has been empty for idle_polls polls."""
+    idle = 0
+    while idle < idle_polls:
+        messages = gmail.get_unread_messages(max_results=10, query=f"{QUERY} {gmail.claim_query()}")
+        claimed = gmail.claim([m["id"] for m in messages])
+        idle = 0 if messages else idle + 1
+        done, failed = [], []
+        for message_id in claimed:
+            with lock:
+                processed[message_id] += 1
+                should_fail = message_id in fail_once
+                fail_once.discard(message_id)
+            time.sleep(random.uniform(0, 0.002))
+            (failed if should_fail else done).append(message_id)
+        gmail.complete(done, ok=True)
+        gmail.complete(failed, ok=False)
+
+
+class StaleReadGmail(GmailService):
+    """Monitor whose rereads keep seeing a contender's claim that was already withdrawn (stale reads)."""
+
+    def _contested(self, message_id: str, own_name: str | None) -> bool:
+        return True
+
+
+def check_orphans() -> list[str]:
+    """Letters yielded by every contender end up claimable again; returns the failures."""
+    failures = []
+    api = FakeGmailApi()
+    first, second = GmailService(service=api, owner="monitor-a"), GmailService(service=api, owner="monitor-b")
+    processing = first.processing_label
+
+    # Both contenders saw each other's claim and yielded
+    letter = api.add_message("letterina", "Caro Babbo Natale")
+    if StaleReadGmail(service=api, owner="monitor-c").claim([letter]) or processing in api.label_names(letter):
+        failures.append("letter yielded by both contenders kept the processing label")
+
+    # A contender crashed after yielding: the sweep of any monitor clears the orphan
+    orphan = api.add_message("letterina", "Caro Babbo Natale, di nuovo")
+    second.modify_labels([orphan], add=[second.label_id(processing)])
+    first.release_stale_claims()
+    visible = api._list(f"{QUERY} is:unread {first.claim_query()}", 10).get("messages", [])
+    if orphan not in {m["id"] for m in visible}:
+        failures.append("release_stale_claims left an unowned letter hidden")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Gmail claim protocol check")
+    parser.add_argument("--monitors", type=int, default=4)
+    parser.add_argument("--letters", type=int, default=100)
+    parser.add_argument("--spam", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.001, help="Seconds per fake API call")
+    args = parser.parse_args()
+
+    api = FakeGmailApi(latency=args.latency)
+    letters = [api.add_message("letterina", f"Caro Babbo Natale, vorrei il regalo {i}") for i in range(args.letters)]
+    for i in range(args.spam):
+        api.add_message("Offerta speciale", f"Sconto {i}%")
+    fail_once = set(random.Random(0).sample(letters, args.letters // 10))
+    failures = len(fail_once)
+
+    processed: Counter = Counter()
+    lock = threading.Lock()
+    monitors = [GmailService(service=api, owner=f"monitor-{i}") for i in range(args.monitors)]
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(target=run_monitor, args=(gmail, processed, fail_once, lock, 3)) for gmail in monitors
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    # Each letter runs once, plus once more for each injected failure
+    expected = Counter({message_id: 1 for message_id in letters})
+    expected.update(set(random.Random(0).sample(letters, args.letters // 10)))
+    wrong = {message_id: n for message_id, n in processed.items() if n != expected[message_id]}
+    missing = [message_id for message_id in letters if message_id not in processed]
+    not_done = [m for m in letters if "elfactory-done" not in api.label_names(m) or "UNREAD" in api.label_names(m)]
+
+    print(f"{args.monitors} monitors, {args.letters} letters ({failures} failing once), {args.spam} spam "
+          f"in {elapsed:.2f}s")
+    print("API calls: " + ", ".join(f"{method}={n}" for method, n in sorted(api.calls.items())))
+    if wrong or missing or not_done:
+        print(f"✗ processed wrong number of times: {len(wrong)}, never: {len(missing)}, not done: {len(not_done)}")
+        return 1
+    orphans = check_orphans()
+    if orphans:
+        print("\n".join(f"✗ {failure}" for failure in orphans))
+        return 1
+    print("✓ every letter processed by exactly one monitor at a time and labelled done; no orphaned claims")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
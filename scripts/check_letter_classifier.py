@@ -0,0 +1,72 @@
+"""Check the letter pre-classifier on short letters, long letters and spam.
+
+Every letter to Santa below must score as a gift request with the default
+weights, including the very short ones children often send, and every spam
+or unrelated mail must not. A letter held for review must drop out of the
+monitor's query until the review label is removed.
+
+Usage:
+    uv run python scripts/check_letter_classifier.py
+"""
+
+import sys
+
+from elfactory.services.fake_gmail import FakeGmailApi
+from elfactory.services.gmail_service import GmailService
+from elfactory.services.letter_classifier import LetterClassifier
+
+LETTERS = [
+    ("letterina", "un robot"),
+    ("letterina", "I want a robot"),
+    ("letterina", "una bambola per favore"),
+    ("letterina per babbo natale", "vorrei la bici"),
+    ("Letterina", "Lego!"),
+    ("letterina", "Caro Babbo Natale, mi chiamo Luca, ho 7 anni e abito a Torino. Quest'anno sono stato buono "
+                  "e vorrei un trenino di legno con tre vagoni. Un abbraccio, Luca"),
+    ("letterina from Emma", "Dear Santa, my name is Emma and I'm eight years old. I have been good this year. "
+                            "Could you bring me a telescope to look at the stars? Love, Emma"),
+]
+NOT_LETTERS = [
+    ("letterina - offerta speciale", "Sconto del 50% solo oggi! Clicca qui: https://promo.example.com "
+                                     "per disiscriviti dalla newsletter"),
+    ("letterina", "WINNER!!! click here https://a.example https://b.example to claim 1000€"),
+    ("Re: fattura letterina", "In allegato la fattura del mese, bonifico entro il 30. Verifica il tuo account."),
+    ("Newsletter", "Il nostro webinar SEO: unsubscribe https://news.example.com"),
+]
+
+
+def main() -> int:
+    classifier = LetterClassifier()
+    failures = []
+    for subject, body in LETTERS:
+        letter = classifier.classify(subject, body)
+        if not letter.is_gift_request:
+            failures.append(f"letter scored {letter.score:.2f} ({', '.join(letter.reasons)}): {body[:40]!r}")
+    for subject, body in NOT_LETTERS:
+        letter = classifier.classify(subject, body)
+        if letter.is_gift_request:
+            failures.append(f"spam scored {letter.score:.2f} ({', '.join(letter.reasons)}): {subject!r}")
+
+    api = FakeGmailApi()
+    gmail = GmailService(service=api, owner="monitor-a")
+    held = api.add_message("letterina", "ciao")
+    query = f"subject:letterina {gmail.claim_query()}"
+    gmail.flag_for_review([held])
+    if gmail.get_unread_messages(query=query):
+        failures.append("a letter held for review is still listed by the monitor's query")
+    if gmail.review_label not in api.label_names(held) or "UNREAD" not in api.label_names(held):
+        failures.append(f"held letter labels are {api.label_names(held)}")
+    gmail.modify_labels([held], remove=[gmail.label_id(gmail.review_label)])
+    if [m["id"] for m in gmail.get_unread_messages(query=query)] != [held]:
+        failures.append("a letter released from review is not listed again")
+
+    if failures:
+        for failure in failures:
+            print(f"✗ {failure}")
+        return 1
+    print(f"✓ {len(LETTERS)} letters accepted, {len(NOT_LETTERS)} other mails rejected; review holds and releases")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
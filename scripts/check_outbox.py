@@ -0,0 +1,88 @@
+"""Check that email delivery outcomes survive an outbox restart.
+
+Queues two response emails on a throwaway database with a transport that
+fails the first attempt of each. The first gift's session is open while its
+email goes out, so the outcome also lands in its WorkshopState. The second
+gift's session closes while its email is in flight: its state must be left
+untouched and the outbox table must hold the outcome. A new Outbox on the
+same file then stands in for a restarted process and must report both
+gifts' delivery history and status.
+
+Usage:
+    uv run python scripts/check_outbox.py
+"""
+
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+from elfactory.core.state import WorkshopState
+from elfactory.services.outbox import Outbox
+from elfactory.tools.state_tools import active_gifts
+
+
+class FlakyTransport:
+    """Fails every other call: with no retry delay each message fails once, then is sent."""
+
+    def __init__(self):
+        self.calls = 0
+        self.open = threading.Event()
+        self.open.set()
+
+    def __call__(self, raw: bytes) -> str:
+        self.open.wait()
+        self.calls += 1
+        if self.calls % 2:
+            raise ConnectionError("connection reset")
+        return f"gmail-{self.calls // 2}"
+
+
+def main() -> int:
+    failures: list[str] = []
+
+    def expect(condition: bool, message: str) -> None:
+        if not condition:
+            failures.append(message)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "outbox.db"
+        live = WorkshopState(gift_id="GIFT-LIVE", gift_request="check")
+        closed = WorkshopState(gift_id="GIFT-CLOSED", gift_request="check")
+        transport = FlakyTransport()
+        outbox = Outbox(path, transport=transport, retry_base_seconds=0.0)
+        active_gifts.update({live.gift_id: live, closed.gift_id: closed})
+        try:
+            live_id = outbox.enqueue("child@example.com", "Il tuo regalo", "<p>ciao</p>", state=live)
+            expect(outbox.flush(), "GIFT-LIVE not flushed")
+            # The second gift's session closes while its email waits on the transport
+            transport.open.clear()
+            closed_id = outbox.enqueue("child@example.com", "Un altro regalo", "<p>ciao</p>", state=closed)
+        finally:
+            active_gifts.pop(live.gift_id, None)
+            active_gifts.pop(closed.gift_id, None)
+        transport.open.set()
+        expect(outbox.flush(), "GIFT-CLOSED not flushed")
+        expect(live.email_delivery == "sent", f"live state email_delivery is {live.email_delivery!r}")
+        expect(any(e.action == "email_retrying" for e in live.manufacturing_log), "live state has no retry entry")
+        expect(closed.email_delivery == "queued" and not any(e.agent == "email_outbox" for e in closed.manufacturing_log),
+               "the closed session's state was written after it closed")
+
+        restarted = Outbox(path)
+        for gift_id, outbox_id in (("GIFT-LIVE", live_id), ("GIFT-CLOSED", closed_id)):
+            history = [(d["outbox_id"], d["status"]) for d in restarted.deliveries(gift_id)]
+            expect(history == [(outbox_id, "queued"), (outbox_id, "retrying"), (outbox_id, "sent")],
+                   f"{gift_id} history after restart is {history}")
+            row = restarted.status(outbox_id) or {}
+            expect(row.get("status") == "sent" and row.get("gmail_id"), f"{gift_id} status after restart is {row}")
+
+    if failures:
+        for failure in failures:
+            print(f"✗ {failure}")
+        return 1
+    print("✓ delivery status and history survive a restart; closed sessions are left untouched")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""Check that the pre-fork pool recovers from a worker that dies mid-task.
+
+One task kills its worker with SIGKILL, as the OOM killer would. The pool
+must report that task as failed, finish the others, fork a replacement
+worker and keep serving new tasks.
+
+Usage:
+    uv run python scripts/check_prefork_recovery.py
+"""
+
+import os
+import signal
+import sys
+import time
+
+from elfactory.core.prefork import PreforkPool
+
+
+def handler(task: dict) -> dict:
+    if task["id"] == "crash":
+        os.kill(os.getpid(), signal.SIGKILL)
+    time.sleep(0.1)
+    return {"ok": True}
+
+
+def collect(pool: PreforkPool, timeout: float = 20.0) -> dict[str, bool]:
+    outcomes = {}
+    deadline = time.monotonic() + timeout
+    while pool.in_flight and time.monotonic() < deadline:
+        outcomes.update({result["task_id"]: result["ok"] for result in pool.results(timeout=0.5)})
+    return outcomes
+
+
+def main() -> int:
+    pool = PreforkPool(2, handler)
+    pool.start()
+    failures = []
+    try:
+        for task_id in ("a", "crash", "b", "c"):
+            pool.submit({"id": task_id})
+        outcomes = collect(pool)
+        if outcomes != {"a": True, "crash": False, "b": True, "c": True}:
+            failures.append(f"outcomes {outcomes}, still in flight {pool.in_flight}")
+        pids = pool.pids
+        pool.submit({"id": "after"})
+        if collect(pool) != {"after": True} or len(pids) != 2:
+            failures.append(f"pool did not keep serving after the crash (workers {pids})")
+    finally:
+        pool.stop()
+
+    if failures:
+        for failure in failures:
+            print(f"✗ {failure}")
+        return 1
+    print("✓ the lost task was reported failed and a new worker replaced the dead one")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
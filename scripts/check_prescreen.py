@@ -0,0 +1,81 @@
+"""Check the quality pre-screen on partial builds and online purchases.
+
+A gift whose artisans built fewer components than their BOM lines call for
+must escalate, as must an online purchase without a safety or age rating
+or rated for other ages. A complete build and a rated, age-appropriate
+purchase must pass.
+
+Usage:
+    uv run python scripts/check_prescreen.py
+"""
+
+import sys
+
+from elfactory.core.quality_prescreen import age_range, prescreen
+from elfactory.core.state import WorkshopState
+
+BOM = [
+    {"name": "wheels", "material_type": "oak wood", "quantity": "4 pcs", "specifications": "5cm",
+     "artisan": "carpenter_elf"},
+    {"name": "body", "material_type": "oak wood", "quantity": "500 g", "specifications": "20cm",
+     "artisan": "carpenter_elf"},
+    {"name": "paint", "material_type": "acrylic paint", "quantity": "50 ml", "specifications": "red",
+     "artisan": "painter_elf"},
+]
+
+
+def built(parts: dict[str, int]) -> WorkshopState:
+    state = WorkshopState(gift_id="GIFT-CHECK", gift_request="wooden car")
+    state.set_child_info({"name": "Luca", "age": 8})
+    state.set_field("manufacturing_decision", "manufattura")
+    state.set_field("bill_of_materials", BOM)
+    for artisan, count in parts.items():
+        for n in range(count):
+            state.add_component({"id": f"{artisan}_{n}", "type": "part", "material": "oak wood",
+                                 "dimensions": "20x10x8cm", "details": "", "created_by": artisan})
+    return state
+
+
+def purchased(age_rating: str, certifications: list[str]) -> WorkshopState:
+    state = WorkshopState(gift_id="GIFT-CHECK", gift_request="LEGO set")
+    state.set_child_info({"name": "Luca", "age": 8})
+    state.set_field("manufacturing_decision", "acquisto_online")
+    state.set_field("purchase", {"product_name": "LEGO City 60337", "product_url": "https://example.com/60337",
+                                 "price": "39.99 EUR", "age_rating": age_rating,
+                                 "safety_certifications": certifications})
+    return state
+
+
+CASES = [
+    ("complete build", built({"carpenter_elf": 5, "painter_elf": 1}), True),
+    ("partial build", built({"carpenter_elf": 2, "painter_elf": 1}), False),
+    ("artisan built nothing", built({"carpenter_elf": 5}), False),
+    ("rated purchase", purchased("7+", ["CE", "EN71"]), True),
+    ("purchase without safety rating", purchased("7+", []), False),
+    ("purchase without age rating", purchased("", ["CE"]), False),
+    ("purchase rated for older children", purchased("12+", ["CE"]), False),
+    ("purchase not recorded", purchased("", []).model_copy(update={"purchase": {}}), False),
+]
+
+
+def main() -> int:
+    failures = []
+    for name, state, should_pass in CASES:
+        result = prescreen(state.snapshot())
+        if result.passed != should_pass:
+            failures.append(f"{name}: {'passed' if result.passed else 'escalated'} ({'; '.join(result.reasons)})")
+    for rating, expected in (("8+", (8.0, float("inf"))), ("3-12 anni", (3.0, 12.0)), ("18m+", (1.5, float("inf"))),
+                             ("n/a", None)):
+        if age_range(rating) != expected:
+            failures.append(f"age_range({rating!r}) is {age_range(rating)}, expected {expected}")
+
+    if failures:
+        for failure in failures:
+            print(f"✗ {failure}")
+        return 1
+    print(f"✓ {len(CASES)} pre-screen cases decided as expected")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
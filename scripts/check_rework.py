@@ -0,0 +1,102 @@
+"""Check that a targeted rework survives failing and overrunning artisans.
+
+One artisan fixes its component, the other raises: the fixed component is
+replaced, the failed one goes back to its previous status, an issue names
+the failure and the latency is recorded. An artisan still running at the
+gift deadline must be cut off through the delegation path and raise
+BudgetExceededError, with the same bookkeeping.
+
+Usage:
+    uv run python scripts/check_rework.py
+"""
+
+import asyncio
+import sys
+import time
+
+from datapizza.tools import Tool
+from elfactory.core.budget import BudgetExceededError, GiftBudget, active_budgets
+from elfactory.core.state import WorkshopState
+from elfactory.tools.rework_tools import register_rework_artisans, request_rework
+from elfactory.tools.state_tools import active_gifts, current_gift_id
+
+
+class FakeArtisan:
+    """Stands in for an artisan agent; run() is its whole turn."""
+
+    def __init__(self, name, run):
+        self.name = name
+        self.run = run
+
+    def as_tool(self) -> Tool:
+        return Tool(func=self.run, name=self.name, description=self.name)
+
+
+def component(component_id: str, created_by: str, details: str = "") -> dict:
+    return {"id": component_id, "type": "part", "material": "oak wood", "dimensions": "20x10x8cm",
+            "details": details, "created_by": created_by}
+
+
+async def fixes(task: str) -> str:
+    active_gifts[current_gift_id.get()].add_component(component("wheels", "painter_elf", "repainted"))
+    return "repainted the wheels"
+
+
+async def fails(task: str) -> str:
+    raise RuntimeError("model unavailable")
+
+
+async def overruns(task: str) -> str:
+    await asyncio.sleep(5)
+    return "too late"
+
+
+def gift(gift_id: str, deadline_seconds: float) -> WorkshopState:
+    state = WorkshopState(gift_id=gift_id, gift_request="wooden car")
+    state.add_component(component("body", "carpenter_elf"))
+    state.add_component(component("wheels", "painter_elf"))
+    active_gifts[gift_id] = state
+    active_budgets[gift_id] = GiftBudget(gift_id=gift_id, deadline=time.monotonic() + deadline_seconds,
+                                         max_llm_calls=100, max_tokens=1_000_000)
+    current_gift_id.set(gift_id)
+    return state
+
+
+def main() -> int:
+    failures = []
+    rework = request_rework.func
+
+    register_rework_artisans([FakeArtisan("carpenter_elf", fails), FakeArtisan("painter_elf", fixes)])
+    state = gift("GIFT-PARTIAL", 30.0)
+    reply = asyncio.run(rework(["body", "wheels"], "sand the edges"))
+    statuses = {c.id: (c.status, c.details) for c in state.components}
+    if statuses != {"body": ("completed", ""), "wheels": ("completed", "repainted")}:
+        failures.append(f"partial rework left components {statuses}")
+    if "carpenter_elf: ✗ failed" not in reply or not any("carpenter_elf failed" in i.description for i in state.issues):
+        failures.append(f"the failed artisan is not reported: {reply!r}")
+    if not state.rework_latency_seconds:
+        failures.append("partial rework latency not recorded")
+
+    register_rework_artisans([FakeArtisan("carpenter_elf", overruns)])
+    state = gift("GIFT-DEADLINE", 0.3)
+    started = time.monotonic()
+    try:
+        asyncio.run(rework(["body"], "sand the edges"))
+        failures.append("an artisan running past the deadline did not raise BudgetExceededError")
+    except BudgetExceededError:
+        pass
+    if time.monotonic() - started > 2:
+        failures.append("the rework was not cut off at the gift deadline")
+    if state.components[0].status != "completed" or not state.issues or not state.rework_latency_seconds:
+        failures.append(f"deadline rework left {state.components[0].status!r}, issues {state.issues}")
+
+    if failures:
+        for failure in failures:
+            print(f"✗ {failure}")
+        return 1
+    print("✓ failed and overrunning artisans leave the components reset, an issue and the latency recorded")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
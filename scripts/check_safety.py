@@ -0,0 +1,74 @@
+"""Run the deterministic safety rules over the whole season.
+
+Usage:
+    uv run python scripts/check_safety.py
+    uv run python scripts/check_safety.py --severity high --limit 50
+    uv run python scripts/check_safety.py --synthetic 100000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import asdict
+from pathlib import Path
+
+from elfactory.core.dimensions import dimension_fields
+from elfactory.services.analytics_store import AnalyticsStore
+from elfactory.services.safety_rules import ComponentColumns, check_components
+
+DIMENSIONS = ["15x10x5cm", "diameter 3cm", "2x2x1cm", "10cm rod, 5mm diameter", "30 cm tall", "same as original"]
+MATERIALS = ["part red PLA", "wheel oak wood", "lens glass", "panel acrylic glass", "pack AA battery", "cell CR2032 battery", "toy magnet"]
+
+
+def synthetic_columns(gifts: int, seed: int = 42) -> ComponentColumns:
+    rng = random.Random(seed)
+    gift_ids, component_ids, ages, extents, materials = [], [], [], [], []
+    for g in range(gifts):
+        age = rng.choice([None, *range(1, 13)])
+        for c in range(rng.randint(5, 15)):
+            fields = dimension_fields(rng.choice(DIMENSIONS))
+            gift_ids.append(f"GIFT-{g:07d}")
+            component_ids.append(f"part_{c}")
+            ages.append(age)
+            extents.append((fields["max_mm"], fields["mid_mm"], fields["min_mm"]))
+            materials.append(rng.choice(MATERIALS))
+    return ComponentColumns(gift_ids, component_ids, ages, extents, materials)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Season-wide child-safety rule check")
+    parser.add_argument("--db", default=os.environ.get("ANALYTICS_DB") or "logs/analytics.db", help="Analytics database")
+    parser.add_argument("--severity", choices=["high", "medium", "unknown"], default=None)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--synthetic", type=int, default=0, metavar="GIFTS", help="Use N synthetic gifts instead of the db")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        columns = synthetic_columns(args.synthetic)
+    else:
+        if not Path(args.db).exists():
+            print(f"✗ No analytics database at {args.db}")
+            return 1
+        columns = ComponentColumns.from_analytics_store(AnalyticsStore(args.db))
+
+    started = time.perf_counter()
+    findings = check_components(columns)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if args.severity:
+        findings = [f for f in findings if f.severity == args.severity]
+
+    print(json.dumps({
+        "components": len(columns),
+        "findings_by_rule": Counter(f.rule for f in findings),
+        "findings": [asdict(f) for f in findings[: args.limit]],
+    }, indent=2, ensure_ascii=False))
+    print(f"(rules over {len(columns)} components: {elapsed_ms:.1f} ms)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
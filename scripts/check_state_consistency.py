@@ -0,0 +1,104 @@
+"""Check that bulk component writes are seen whole by concurrent readers.
+
+Artisan threads register parts with add_components() (components plus their
+log entries in one update) while reader threads take snapshot() and
+agent_view() copies. Every copy must hold exactly the same bulk-written
+component IDs in its components and in its manufacturing log; a copy showing
+one without the other means the update was not atomic.
+
+Usage:
+    uv run python scripts/check_state_consistency.py
+    uv run python scripts/check_state_consistency.py --artisans 16 --batches 200 --readers 4
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+from elfactory.core.state import WorkshopState
+
+
+def batch(agent: str, index: int, size: int) -> tuple[list[dict], list[dict]]:
+    ids = [f"{agent}_{index}_{part}" for part in range(size)]
+    components = [
+        {"id": component_id, "type": "part", "material": "red PLA", "dimensions": "2x2x1cm",
+         "details": "", "created_by": agent, "status": "completed"}
+        for component_id in ids
+    ]
+    entries = [{"agent": agent, "action": "build", "details": component_id} for component_id in ids]
+    return components, entries
+
+
+def mismatch(component_ids: set[str], logged_ids: set[str]) -> str:
+    missing_log, missing_components = component_ids - logged_ids, logged_ids - component_ids
+    if missing_log or missing_components:
+        return f"{len(missing_log)} components without log entry, {len(missing_components)} log entries without component"
+    return ""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="WorkshopState bulk write consistency check")
+    parser.add_argument("--artisans", type=int, default=8)
+    parser.add_argument("--batches", type=int, default=100, help="add_components() calls per artisan")
+    parser.add_argument("--size", type=int, default=5, help="Components per call")
+    parser.add_argument("--readers", type=int, default=2)
+    args = parser.parse_args()
+
+    # Switch threads far more often than the default 5 ms, to hit the window between two locks
+    sys.setswitchinterval(1e-6)
+    state = WorkshopState(gift_id="GIFT-CHECK", gift_request="consistency check")
+    stop = threading.Event()
+    failures: list[str] = []
+    reads = 0
+    lock = threading.Lock()
+
+    def artisan(index: int) -> None:
+        agent = f"artisan_{index}"
+        for n in range(args.batches):
+            state.add_components(*batch(agent, n, args.size))
+
+    def reader(use_view: bool) -> None:
+        nonlocal reads
+        count = 0
+        while not stop.is_set():
+            if use_view:
+                view = state.agent_view(log_tail=10**9, details_chars=100)
+                components = {c["id"] for c in view["components"]}
+                logged = {entry["details"] for entry in view["manufacturing_log"]}
+            else:
+                copy = state.snapshot()
+                components = {c.id for c in copy.components}
+                logged = {entry.details for entry in copy.manufacturing_log}
+            problem = mismatch(components, logged)
+            count += 1
+            if problem:
+                with lock:
+                    failures.append(problem)
+        with lock:
+            reads += count
+
+    readers = [threading.Thread(target=reader, args=(i % 2 == 1,)) for i in range(args.readers)]
+    writers = [threading.Thread(target=artisan, args=(i,)) for i in range(args.artisans)]
+    started = time.perf_counter()
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    written = args.artisans * args.batches * args.size
+    final = mismatch({c.id for c in state.components}, {e.details for e in state.manufacturing_log})
+    print(f"{written} components in {args.artisans * args.batches} bulk writes, {reads} reads in {elapsed:.2f}s")
+    if failures or final or len(state.components) != written:
+        print(f"✗ {len(failures)} inconsistent reads ({failures[0] if failures else final})")
+        return 1
+    print("✓ every read saw components and their log entries together")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
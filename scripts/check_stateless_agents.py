@@ -0,0 +1,49 @@
+"""Check that every agent factory builds a stateless agent.
+
+The orchestrator's agents are shared by every gift, so each run must start
+from an empty conversation. Every Agent(...) call under src/elfactory must
+pass stateless=True and no memory=.
+
+Usage:
+    uv run python scripts/check_stateless_agents.py
+"""
+
+import ast
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src" / "elfactory"
+
+
+def agent_calls(path: Path):
+    for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"), str(path))):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "Agent":
+            yield node
+
+
+def main() -> int:
+    failures = []
+    checked = 0
+    for path in sorted(SRC.rglob("*.py")):
+        for call in agent_calls(path):
+            checked += 1
+            keywords = {keyword.arg: keyword.value for keyword in call.keywords}
+            where = f"{path.relative_to(SRC.parent)}:{call.lineno}"
+            stateless = keywords.get("stateless")
+            if not (isinstance(stateless, ast.Constant) and stateless.value is True):
+                failures.append(f"{where}: Agent() without stateless=True")
+            if "memory" in keywords:
+                failures.append(f"{where}: Agent() with a base memory")
+
+    if not checked:
+        failures.append(f"no Agent() calls found under {SRC}")
+    if failures:
+        for failure in failures:
+            print(f"✗ {failure}")
+        return 1
+    print(f"✓ {checked} agent factories build stateless agents")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""Check that every tool registered on an agent has a JSON-serializable schema.
+
+Builds the orchestrator, then serializes each agent's tools the way the LLM
+client sends them. A schema holding jsonref proxies (e.g. from a pydantic
+model annotation) fails here instead of on the first LLM call of a gift.
+
+Usage:
+    uv run python scripts/check_tool_schemas.py
+"""
+
+import json
+import sys
+
+from elfactory.core.orchestrator import get_orchestrator
+
+
+def main() -> int:
+    orchestrator = get_orchestrator()
+    failures, checked = [], 0
+    for agent in orchestrator.agents:
+        convert = getattr(agent._client, "_convert_tools", None)
+        for agent_tool in agent._tools:
+            checked += 1
+            try:
+                payload = json.dumps(convert(agent_tool) if convert else agent_tool.schema)
+            except (TypeError, ValueError) as e:
+                failures.append(f"{agent.name}.{agent_tool.name}: {e}")
+                continue
+            if '"$ref"' in payload:
+                failures.append(f"{agent.name}.{agent_tool.name}: unresolved $ref")
+
+    print(f"{checked} tools on {len(orchestrator.agents)} agents")
+    if failures:
+        for failure in failures:
+            print(f"✗ {failure}")
+        return 1
+    print("✓ every tool schema serializes to plain JSON")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,43 +4,123 @@ This script continuously monitors Gmail for new gift requests
 and triggers the workshop workflow when emails arrive.
 """
 
+import argparse
 import time
 import logging
+from collections import Counter
 from datetime import datetime
 
 from elfactory.services.gmail_service import GmailService
 from elfactory.core.orchestrator import process_gift_request
+from elfactory.services.letter_classifier import LetterClassification, get_letter_classifier
 from elfactory.utils import setup_logging
 
 
 # Configuration
 CHECK_INTERVAL = 60  # seconds between checks
+MAX_ATTEMPTS = 3  # Failed attempts at a letter before it is held for review
 VERBOSE = True  # Print detailed logs
+LETTER_KEYWORD = "letterina"  # Required in the subject of gift requests
+GMAIL_QUERY = f"subject:{LETTER_KEYWORD}"  # Applied by Gmail, so other mail is never listed
+
+
+def classify_letter(message: dict) -> LetterClassification | None:
+    """
+    Decide locally whether an email is a gift request.
+
+    The subject must contain the keyword "letterina"; the local classifier
+    then scores subject and body, so spam that carries the keyword is skipped
+    without any LLM call, and extracts the child's name, age and city.
+
+    Args:
+        message: Email message dictionary
+
+    Returns:
+        The classification, or None without the keyword
+    """
+    subject = message.get("subject", "")
+    if LETTER_KEYWORD not in subject.lower():
+        return None
+    return get_letter_classifier().classify(subject, message.get("body", ""))
+
+
+def should_fetch(message: dict, seen: set) -> bool:
+    """
+    Decide from the headers alone whether to download a message's body.
+
+    Args:
+        message: Headers-only message (subject, from, date)
+        seen: Ids already handled or in progress
+
+    Returns:
+        True for new messages with the keyword in the subject
+    """
+    return message["id"] not in seen and LETTER_KEYWORD in message.get("subject", "").lower()
 
 
 def is_gift_request(message: dict) -> bool:
     """
     Determine if an email is a gift request.
 
-    Checks if the subject contains the keyword "letterina".
-
     Args:
         message: Email message dictionary
 
     Returns:
         True if this is a gift request, False otherwise
     """
-    subject = message.get("subject", "").lower()
-    return "letterina" in subject
+    letter = classify_letter(message)
+    return letter is not None and letter.is_gift_request
+
+
+def describe_skip(message: dict, letter: LetterClassification | None) -> str:
+    """One-line reason why a message was skipped."""
+    if letter is None:
+        return f"Skipped email without 'letterina' keyword: {message['subject']}"
+    return (f"Held for review, email scored {letter.score:.2f} ({', '.join(letter.reasons)}): "
+            f"{message['subject']}")
+
+
+def triage(gmail: GmailService, messages: list[dict], processed_ids: set) -> dict[str, tuple]:
+    """
+    Split fetched messages into gift requests and the rest.
+
+    Messages with the keyword that score below the threshold are labelled
+    for review rather than dropped, so a letter the classifier misjudges
+    is never lost. Every message not returned is added to processed_ids.
+
+    Args:
+        gmail: GmailService instance
+        messages: Messages with their bodies
+        processed_ids: Ids already handled in this run
+
+    Returns:
+        Message id -> (message, classification) of the gift requests
+    """
+    letters, review = {}, []
+    for message in messages:
+        if message["id"] in processed_ids:
+            continue
+        letter = classify_letter(message)
+        if letter is not None and letter.is_gift_request:
+            letters[message["id"]] = (message, letter)
+            continue
+        processed_ids.add(message["id"])
+        if letter is not None:
+            review.append(message["id"])
+        if VERBOSE:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] {describe_skip(message, letter)}")
+    gmail.flag_for_review(review)
+    return letters
 
 
-def process_email(gmail: GmailService, message: dict):
+def process_email(gmail: GmailService, message: dict, child_info: dict | None = None):
     """
     Process a single gift request email.
 
     Args:
         gmail: GmailService instance
         message: Email message to process
+        child_info: Child details extracted by the letter classifier
     """
     print()
     print("=" * 60)
@@ -71,7 +151,7 @@ def process_email(gmail: GmailService, message: dict):
         # Extract sender email for response
         sender_email = message.get('from', '')
 
-        state = process_gift_request(email_content, sender_email)
+        state = process_gift_request(email_content, sender_email, child_info)
 
         print()
         print("=" * 60)
@@ -82,8 +162,8 @@ def process_email(gmail: GmailService, message: dict):
         print("=" * 60)
         print()
 
-        # Mark email as read
-        gmail.mark_as_read(message["id"])
+        # Release the claim: labelled done and marked as read
+        gmail.complete([message["id"]], ok=True)
         if VERBOSE:
             print(f"✓ Email marked as read")
 
@@ -91,8 +171,124 @@ def process_email(gmail: GmailService, message: dict):
         print()
         print(f"Error processing gift request: {e}")
         print()
-        # Don't mark as read if processing failed
+        # Labelled failed and left unread
         # Will retry on next check
+        gmail.complete([message["id"]], ok=False)
+
+
+def process_gift_task(task: dict) -> dict:
+    """
+    Process one gift request inside a pre-forked worker.
+
+    Args:
+        task: Dict with the message id, body, sender and extracted child info
+
+    Returns:
+        Result dict sent back to the parent
+    """
+    state = process_gift_request(task["body"], task["from"], task.get("child_info"))
+    print(f"[worker] {state.gift_id}: {state.status}")
+    # A gift that ends "failed" has been handled (as in process_email); only errors are retried
+    return {"ok": True, "gift_id": state.gift_id, "status": state.status}
+
+
+def monitor_loop_prefork(gmail: GmailService, workers: int):
+    """
+    Monitoring loop that dispatches gift requests to pre-forked workers.
+
+    The parent builds the agents once and forks the workers, which share them
+    copy-on-write. The parent only polls Gmail and marks messages as read when
+    a worker reports success. A letter whose processing raised, or killed its
+    worker, is retried on later checks up to MAX_ATTEMPTS times, then held
+    for review.
+
+    Args:
+        gmail: GmailService instance
+        workers: Number of worker processes
+    """
+    from elfactory.core.prefork import PreforkPool
+
+    started = time.monotonic()
+    pool = PreforkPool(workers, process_gift_task)
+    pool.start()
+
+    print()
+    print(f"Elfactory Email Monitor Started ({workers} pre-forked workers, "
+          f"ready in {time.monotonic() - started:.1f}s)")
+    print("=" * 60)
+    print(f"Checking for new emails every {CHECK_INTERVAL} seconds")
+    print("Press Ctrl+C to stop")
+    print("=" * 60)
+    print()
+
+    processed_ids = set()
+    failures: Counter = Counter()
+
+    try:
+        while True:
+            try:
+                results = pool.results()
+                done = [result["task_id"] for result in results if result.get("ok")]
+                failed = [result["task_id"] for result in results if not result.get("ok")]
+                gmail.complete(done, ok=True)
+                gmail.complete(failed, ok=False)
+                held = []
+                for result in results:
+                    if result.get("ok"):
+                        failures.pop(result["task_id"], None)
+                        print(f"✓ {result.get('gift_id')} done by worker {result['worker']}: {result.get('status')}")
+                        continue
+                    failures[result["task_id"]] += 1
+                    attempt = failures[result["task_id"]]
+                    print(f"✗ Message {result['task_id']} failed (attempt {attempt}/{MAX_ATTEMPTS}): "
+                          f"{result.get('error', result.get('status'))}")
+                    if attempt < MAX_ATTEMPTS:
+                        # Left unread and retried on a later check
+                        processed_ids.discard(result["task_id"])
+                    else:
+                        held.append(result["task_id"])
+                        failures.pop(result["task_id"])
+                gmail.flag_for_review(held)
+
+                messages = gmail.get_unread_messages(
+                    max_results=10,
+                    query=f"{GMAIL_QUERY} {gmail.claim_query()}",
+                    accept=lambda m: should_fetch(m, processed_ids) and m["id"] not in pool.in_flight,
+                )
+                letters = triage(gmail, messages, processed_ids)
+
+                # Another monitor may be polling the same mailbox
+                for message_id in gmail.claim(list(letters)):
+                    message, letter = letters[message_id]
+                    processed_ids.add(message_id)
+                    print(f"New gift request from {message['from']}: {message['subject']} (score {letter.score:.2f})")
+                    pool.submit({
+                        "id": message_id, "body": message["body"], "from": message["from"],
+                        "child_info": letter.child_info,
+                    })
+
+                if len(processed_ids) > 1000:
+                    processed_ids = set(list(processed_ids)[-1000:])
+
+                time.sleep(CHECK_INTERVAL)
+
+            except KeyboardInterrupt:
+                raise
+            except Exception as e:
+                print(f"Error in monitor loop: {e}")
+                print(f"Retrying in {CHECK_INTERVAL} seconds...")
+                time.sleep(CHECK_INTERVAL)
+
+    except KeyboardInterrupt:
+        print()
+        print("=" * 60)
+        print("Monitor stopped by user, waiting for workers...")
+        print("=" * 60)
+        pool.stop()
+        results = pool.results()
+        gmail.complete([r["task_id"] for r in results if r.get("ok")], ok=True)
+        # Unfinished letters are released for the next run or another monitor
+        gmail.complete([r["task_id"] for r in results if not r.get("ok")] + list(pool.in_flight), ok=False)
 
 
 def monitor_loop(gmail: GmailService):
@@ -117,21 +313,20 @@ def monitor_loop(gmail: GmailService):
     while True:
         try:
             # Check for unread messages
-            messages = gmail.get_unread_messages(max_results=10)
+            messages = gmail.get_unread_messages(
+                max_results=10,
+                query=f"{GMAIL_QUERY} {gmail.claim_query()}",
+                accept=lambda m: should_fetch(m, processed_ids),
+            )
 
             # Filter for gift requests and unprocessed messages
-            for message in messages:
-                if message["id"] in processed_ids:
-                    continue
-
-                if is_gift_request(message):
-                    process_email(gmail, message)
-                    processed_ids.add(message["id"])
-                else:
-                    # Not a gift request, skip it (leave unread)
-                    if VERBOSE:
-                        print(f"[{datetime.now().strftime('%H:%M:%S')}] Skipped email without 'letterina' keyword: {message['subject']}")
-                    processed_ids.add(message["id"])
+            letters = triage(gmail, messages, processed_ids)
+
+            # Only letters claimed by this monitor; others are being processed elsewhere
+            for message_id in gmail.claim(list(letters)):
+                message, letter = letters[message_id]
+                process_email(gmail, message, letter.child_info)
+                processed_ids.add(message_id)
 
             # Clean up old processed IDs (keep last 1000)
             if len(processed_ids) > 1000:
@@ -158,6 +353,13 @@ def monitor_loop(gmail: GmailService):
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Monitor Gmail for gift requests")
+    parser.add_argument(
+        "--workers", type=int, default=0,
+        help="Number of pre-forked worker processes (0 = process in this process)",
+    )
+    args = parser.parse_args()
+
     logger = setup_logging()
 
     try:
@@ -167,9 +369,15 @@ def main():
         gmail = GmailService()
         logger.info("Gmail service initialized")
         print("✓ Gmail service initialized")
+        released = gmail.release_stale_claims()
+        if released:
+            print(f"✓ Released {released} messages claimed by a previous run ({gmail.owner})")
 
         # Start monitoring
-        monitor_loop(gmail)
+        if args.workers > 0:
+            monitor_loop_prefork(gmail, args.workers)
+        else:
+            monitor_loop(gmail)
 
     except FileNotFoundError as e:
         print()
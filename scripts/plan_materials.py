@@ -0,0 +1,78 @@
+"""Season material demand and artisan capacity from the analytics store.
+
+Usage:
+    uv run python scripts/plan_materials.py
+    uv run python scripts/plan_materials.py --by day material unit --limit 20
+    uv run python scripts/plan_materials.py --capacity woodworker_elf=40 --default-capacity 60
+    uv run python scripts/plan_materials.py --synthetic 500000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from elfactory.services.analytics_store import AnalyticsStore
+from elfactory.services.bom_planner import BomTable
+
+ARTISANS = [
+    "3d_printer_elf", "woodworker_elf", "blacksmith_elf", "painter_elf", "mechanic_elf",
+    "electronics_elf", "fabric_elf", "glass_elf", "polish_elf", "decal_elf",
+]
+MATERIALS = [
+    "PLA", "red PLA filament", "oak wood", "Legno di faggio", "steel sheet", "acrylic paint",
+    "cotton fabric", "AA battery", "LED strip", "M3 screws", "tempered glass", "vinyl sticker",
+]
+QUANTITIES = ["1", "2x", "x4", "250 g", "1,5 kg", "2-3 m", "30 cm", "500 ml", "0.5 l", "10 pz", "2 sheets"]
+
+
+def synthetic_columns(lines: int, seed: int = 42) -> tuple[list[str], list[str], list[str], list[str]]:
+    rng = random.Random(seed)
+    days = [(date(2025, 11, 1) + timedelta(days=d)).isoformat() for d in range(55)]
+    return (
+        rng.choices(days, k=lines),
+        rng.choices(ARTISANS, k=lines),
+        rng.choices(MATERIALS, k=lines),
+        rng.choices(QUANTITIES, k=lines),
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Aggregate bill-of-materials demand for the season")
+    parser.add_argument("--db", default=os.environ.get("ANALYTICS_DB") or "logs/analytics.db", help="Analytics database")
+    parser.add_argument("--by", nargs="+", default=["material", "unit"], choices=["day", "artisan", "material", "unit"])
+    parser.add_argument("--limit", type=int, default=15)
+    parser.add_argument("--capacity", nargs="*", default=[], metavar="ARTISAN=LINES", help="BOM lines per day")
+    parser.add_argument("--default-capacity", type=float, default=float("inf"))
+    parser.add_argument("--synthetic", type=int, default=0, metavar="LINES", help="Use N synthetic lines instead of the db")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.synthetic:
+        columns = synthetic_columns(args.synthetic)
+        started = time.perf_counter()
+        table = BomTable(*columns)
+    else:
+        if not Path(args.db).exists():
+            print(f"✗ No analytics database at {args.db}")
+            return 1
+        table = BomTable.from_analytics_store(AnalyticsStore(args.db))
+    loaded_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    demand = table.demand(tuple(args.by))
+    capacity = dict(item.split("=", 1) for item in args.capacity)
+    plan = table.capacity_plan({k: float(v) for k, v in capacity.items()}, args.default_capacity)
+    aggregate_ms = (time.perf_counter() - started) * 1000
+
+    print(json.dumps({"demand": demand[: args.limit], **plan}, indent=2, ensure_ascii=False))
+    print(f"({len(table)} lines: load {loaded_ms:.1f} ms, aggregate {aggregate_ms:.1f} ms)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""Query the season analytics store.
+
+Usage:
+    uv run python scripts/query_analytics.py summary
+    uv run python scripts/query_analytics.py agents --limit 5
+    uv run python scripts/query_analytics.py days --limit 7
+    uv run python scripts/query_analytics.py sql "SELECT status, COUNT(*) FROM gifts GROUP BY status"
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from elfactory.services.analytics_store import AnalyticsStore
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Season analytics over all processed gifts")
+    parser.add_argument("--db", default=os.environ.get("ANALYTICS_DB") or "logs/analytics.db", help="Analytics database")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("summary", help="Gift count, statuses, components per gift, latency percentiles")
+    agents = sub.add_parser("agents", help="Busiest artisans")
+    agents.add_argument("--limit", type=int, default=10)
+    days = sub.add_parser("days", help="Gifts per day")
+    days.add_argument("--limit", type=int, default=30)
+    sql = sub.add_parser("sql", help="Run a custom query (tables: gifts, components, actions, issues, agent_stats)")
+    sql.add_argument("query")
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"✗ No analytics database at {args.db}")
+        return 1
+    store = AnalyticsStore(args.db)
+
+    started = time.perf_counter()
+    if args.command == "summary":
+        result = store.season_summary()
+    elif args.command == "agents":
+        result = store.busiest_agents(args.limit)
+    elif args.command == "days":
+        result = store.gifts_per_day(args.limit)
+    else:
+        result = store.query(args.query)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    print(f"({elapsed_ms:.1f} ms)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Rebuild a gift's state from its persisted event log.
+
+Usage:
+    uv run python scripts/replay_gift.py GIFT-20251201-ABCD1234
+    uv run python scripts/replay_gift.py GIFT-20251201-ABCD1234 --until 40 --events
+    uv run python scripts/replay_gift.py GIFT-20251201-ABCD1234 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from elfactory.core.events import EventStore, MetricsProjection, replay
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay a gift's event log")
+    parser.add_argument("gift_id", help="Gift ID (e.g., GIFT-20251201-ABCD1234)")
+    parser.add_argument("--dir", default=os.environ.get("EVENT_LOG_DIR") or "logs/events", help="Event log directory")
+    parser.add_argument("--until", type=int, default=None, help="Stop after this event sequence number")
+    parser.add_argument("--events", action="store_true", help="Print the event timeline")
+    parser.add_argument("--json", action="store_true", help="Print the rebuilt state as JSON")
+    args = parser.parse_args()
+
+    store = EventStore(args.dir)
+    try:
+        state = replay(args.gift_id, store, until_seq=args.until)
+    except FileNotFoundError as e:
+        print(f"✗ {e}")
+        return 1
+
+    _, events = store.load(args.gift_id)
+    if args.until is not None:
+        events = [event for event in events if event.seq <= args.until]
+
+    if args.json:
+        print(state.model_dump_json(indent=2))
+        return 0
+
+    if args.events:
+        for event in events:
+            data = json.dumps(event.data, ensure_ascii=False)
+            print(f"#{event.seq:<4} {event.timestamp:%H:%M:%S} {event.type:<25} {data[:100]}")
+        print()
+
+    metrics = MetricsProjection()
+    for event in events:
+        metrics(event)
+
+    print(state.to_summary())
+    print(json.dumps(metrics.as_dict(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Run online-shopper product searches, optionally recording them for offline use.
+
+Usage:
+    uv run python scripts/search_products.py "LEGO Star Wars" "Nintendo Switch Mario Kart"
+    uv run python scripts/search_products.py --canned logs/canned_search.json "peluche unicorno"
+    uv run python scripts/search_products.py --record logs/canned_search.json "Harry Potter libro"
+
+The first pass shows live (or canned) latency, the second the cached one.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from elfactory.services.product_search import CannedBackend, DuckDuckGoBackend, ProductSearch
+from elfactory.services.ttl_cache import TTLCache
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cached, parallel product search")
+    parser.add_argument("queries", nargs="+")
+    parser.add_argument("--region", default=os.environ.get("SEARCH_REGION") or "it-it")
+    parser.add_argument("--canned", default=os.environ.get("SEARCH_CANNED_PATH") or "", help="Offline results file")
+    parser.add_argument("--record", default="", help="Add the results to this canned results file")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    backend = CannedBackend(args.canned) if args.canned else DuckDuckGoBackend()
+    search = ProductSearch(backend, TTLCache(None, 3600, 1000), args.region, max_results=8, max_workers=args.workers)
+
+    for label in ("first", "cached"):
+        started = time.perf_counter()
+        results = search.search_many(args.queries)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"{label:<7} {len(args.queries)} queries in {elapsed_ms:8.1f} ms", file=sys.stderr)
+
+    for query, items in results.items():
+        print(f"## {query}")
+        for item in items if isinstance(items, list) else []:
+            print(f"- {item['title']} <{item['href']}>")
+        if isinstance(items, str):
+            print(f"✗ {items}")
+
+    if args.record:
+        path = Path(args.record)
+        canned = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        canned.update({query: items for query, items in results.items() if isinstance(items, list)})
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(canned, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"✓ Recorded {len(results)} queries to {path}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Fit and evaluate the local letter pre-classifier on labelled emails.
+
+The input is JSONL, one email per line: {"subject": ..., "body": ..., "label": 1|0}
+(1 = letter to Santa). Fitted weights are written as JSON for LETTER_CLASSIFIER_PATH.
+
+Usage:
+    uv run python scripts/train_letter_classifier.py data/letters.jsonl --evaluate
+    uv run python scripts/train_letter_classifier.py data/letters.jsonl --out logs/letter_classifier.json
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from elfactory.services.letter_classifier import (
+    DEFAULT_WEIGHTS,
+    FEATURES,
+    LetterClassifier,
+    extract_child_details,
+    letter_features,
+)
+
+
+def feature_matrix(emails: list[dict]) -> np.ndarray:
+    rows = []
+    for email in emails:
+        name, age, _ = extract_child_details(email["body"])
+        features = letter_features(email.get("subject", ""), email["body"], name, age)
+        rows.append([features[name] for name in FEATURES])
+    return np.array(rows, dtype=np.float64)
+
+
+def fit(x: np.ndarray, y: np.ndarray, l2: float, epochs: int, rate: float) -> dict[str, float]:
+    """Logistic regression by gradient descent, starting from the default weights."""
+    w = np.array([DEFAULT_WEIGHTS[name] for name in FEATURES])
+    b = DEFAULT_WEIGHTS["bias"]
+    for _ in range(epochs):
+        p = 1 / (1 + np.exp(-(x @ w + b)))
+        error = p - y
+        w -= rate * (x.T @ error / len(y) + l2 * w)
+        b -= rate * error.mean()
+    return {"bias": round(float(b), 4), **{name: round(float(v), 4) for name, v in zip(FEATURES, w)}}
+
+
+def report(label: str, classifier: LetterClassifier, emails: list[dict]) -> None:
+    predicted = [classifier.classify(e.get("subject", ""), e["body"]).is_gift_request for e in emails]
+    actual = [bool(e["label"]) for e in emails]
+    tp = sum(p and a for p, a in zip(predicted, actual))
+    fp = sum(p and not a for p, a in zip(predicted, actual))
+    fn = sum(a and not p for p, a in zip(predicted, actual))
+    accuracy = sum(p == a for p, a in zip(predicted, actual)) / max(len(emails), 1)
+    print(f"{label:<10} {len(emails):5} emails  accuracy {accuracy:.3f}  "
+          f"precision {tp / max(tp + fp, 1):.3f}  recall {tp / max(tp + fn, 1):.3f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Letter pre-classifier training")
+    parser.add_argument("emails", help="Labelled emails (JSONL)")
+    parser.add_argument("--out", default="", help="Write the fitted weights to this path")
+    parser.add_argument("--evaluate", action="store_true", help="Only evaluate the default weights")
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--holdout", type=float, default=0.2, help="Share of emails kept for evaluation")
+    parser.add_argument("--l2", type=float, default=0.01)
+    parser.add_argument("--epochs", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=0.5)
+    args = parser.parse_args()
+
+    lines = Path(args.emails).read_text(encoding="utf-8").splitlines()
+    emails = [json.loads(line) for line in lines if line.strip()]
+    default = LetterClassifier(threshold=args.threshold)
+    if args.evaluate:
+        report("default", default, emails)
+        return 0
+
+    random.Random(0).shuffle(emails)
+    split = int(len(emails) * (1 - args.holdout))
+    train, holdout = emails[:split], emails[split:]
+    weights = fit(feature_matrix(train), np.array([float(e["label"]) for e in train]), args.l2, args.epochs, args.rate)
+    fitted = LetterClassifier(weights, threshold=args.threshold)
+
+    for label, classifier in (("default", default), ("fitted", fitted)):
+        report(label, classifier, holdout or train)
+    print(json.dumps(weights, indent=2))
+
+    if args.out:
+        path = Path(args.out)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"weights": weights, "threshold": args.threshold}, indent=2), encoding="utf-8")
+        print(f"✓ Wrote weights to {path}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,12 @@
 """Airbrush Elf - Applies precision paint finishes and gradients."""
 
 from datapizza.agents import Agent
-from datapizza.clients.openai import OpenAIClient
-from elfactory.config import settings
+from elfactory.services.llm_client import create_llm_client
+from elfactory.agents.artisans.common import MULTI_PART_INSTRUCTIONS
 from elfactory.tools import (
     read_project_state,
     write_component,
+    write_components,
 
     log_manufacturing_action,
 )
@@ -70,21 +71,20 @@ GUIDELINES:
 
 def create_airbrush_elf() -> Agent:
     """Create the Airbrush Artist Elf agent."""
-    client = OpenAIClient(
-        api_key=settings.openai_api_key,
-        model=settings.openai_model,
-    )
+    client = create_llm_client()
 
     agent = Agent(
         name="airbrush_elf",
         client=client,
-        system_prompt=AIRBRUSH_SYSTEM_PROMPT,
+        system_prompt=AIRBRUSH_SYSTEM_PROMPT + MULTI_PART_INSTRUCTIONS,
         tools=[
             read_project_state,
             write_component,
+            write_components,
         
             log_manufacturing_action,
         ],
+        stateless=True,
     )
 
     return agent
@@ -1,11 +1,12 @@
 """Battery Elf - Installs power systems and battery management."""
 
 from datapizza.agents import Agent
-from datapizza.clients.openai import OpenAIClient
-from elfactory.config import settings
+from elfactory.services.llm_client import create_llm_client
+from elfactory.agents.artisans.common import MULTI_PART_INSTRUCTIONS
 from elfactory.tools import (
     read_project_state,
     write_component,
+    write_components,
 
     log_manufacturing_action,
 )
@@ -35,21 +36,20 @@ SAFETY:
 
 def create_battery_elf() -> Agent:
     """Create the Battery Specialist Elf agent."""
-    client = OpenAIClient(
-        api_key=settings.openai_api_key,
-        model=settings.openai_model,
-    )
+    client = create_llm_client()
 
     agent = Agent(
         name="battery_elf",
         client=client,
-        system_prompt=BATTERY_SYSTEM_PROMPT,
+        system_prompt=BATTERY_SYSTEM_PROMPT + MULTI_PART_INSTRUCTIONS,
         tools=[
             read_project_state,
             write_component,
+            write_components,
         
             log_manufacturing_action,
         ],
+        stateless=True,
     )
 
     return agent
@@ -0,0 +1,12 @@
+"""Prompt fragments shared by the artisan elves."""
+
+MULTI_PART_INSTRUCTIONS = """
+
+MULTIPLE PARTS:
+When your task produces more than one part, register them all with ONE call to
+write_components() instead of calling write_component() and
+log_manufacturing_action() once per part. Each entry has component_id,
+component_type, material, dimensions, details and the action to log
+(e.g., "printing"). The manufacturing log is written for you.
+Use write_component() only for a single part.
+"""
@@ -1,8 +1,7 @@
 """Librarian Elf - Manages technical specifications and materials knowledge."""
 
 from datapizza.agents import Agent
-from datapizza.clients.openai import OpenAIClient
-from elfactory.config import settings
+from elfactory.services.llm_client import create_llm_client
 from elfactory.tools import (
     read_project_state,
 
@@ -46,10 +45,7 @@ GUIDELINES:
 
 def create_librarian_elf() -> Agent:
     """Create the Librarian Elf agent."""
-    client = OpenAIClient(
-        api_key=settings.openai_api_key,
-        model=settings.openai_model,
-    )
+    client = create_llm_client()
 
     agent = Agent(
         name="librarian_elf",
@@ -60,6 +56,7 @@ def create_librarian_elf() -> Agent:
         
             log_manufacturing_action,
         ],
+        stateless=True,
     )
 
     return agent
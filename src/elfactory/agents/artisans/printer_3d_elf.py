@@ -1,11 +1,12 @@
 """3D Printer Elf - Creates components using 3D printing technology."""
 
 from datapizza.agents import Agent
-from datapizza.clients.openai import OpenAIClient
-from elfactory.config import settings
+from elfactory.services.llm_client import create_llm_client
+from elfactory.agents.artisans.common import MULTI_PART_INSTRUCTIONS
 from elfactory.tools import (
     read_project_state,
     write_component,
+    write_components,
     log_manufacturing_action,
 )
 
@@ -39,20 +40,19 @@ GUIDELINES:
 
 def create_3d_printer_elf() -> Agent:
     """Create the 3D Printer Elf agent."""
-    client = OpenAIClient(
-        api_key=settings.openai_api_key,
-        model=settings.openai_model,
-    )
+    client = create_llm_client()
 
     agent = Agent(
         name="3d_printer_elf",
         client=client,
-        system_prompt=PRINTER_3D_SYSTEM_PROMPT,
+        system_prompt=PRINTER_3D_SYSTEM_PROMPT + MULTI_PART_INSTRUCTIONS,
         tools=[
             read_project_state,
             write_component,
+            write_components,
             log_manufacturing_action,
         ],
+        stateless=True,
     )
 
     return agent
@@ -1,9 +1,8 @@
 """Design Manager - Feasibility analysis and blueprint creation."""
 
 from datapizza.agents import Agent
-from datapizza.clients.openai import OpenAIClient
-from elfactory.config import settings
-from elfactory.tools import read_project_state, update_status, log_manufacturing_action
+from elfactory.services.llm_client import create_llm_client
+from elfactory.tools import read_project_state, update_status, log_manufacturing_action, set_design
 from elfactory.models import DesignOutput
 
 
@@ -43,8 +42,10 @@ ARTISAN SELECTION:
 WORKFLOW:
 1. Use read_project_state()
 2. Make design decision
-3. Use log_manufacturing_action() to record decision
-4. CRITICAL: MUST DELEGATE to next agent:
+3. Use set_design() to save feasibility, decision, blueprint and bill of materials
+   (one BOM line per material and artisan, quantity with unit: "250 g", "4 pcs", "1.2 m")
+4. Use log_manufacturing_action() to record decision
+5. CRITICAL: MUST DELEGATE to next agent:
    - If decision is "manufattura" → call production_manager
    - If decision is "acquisto_online" → call online_shopper_elf
 
@@ -61,10 +62,7 @@ GUIDELINES:
 
 def create_design_manager() -> Agent:
     """Create the Design Manager agent with structured output."""
-    client = OpenAIClient(
-        api_key=settings.openai_api_key,
-        model=settings.openai_model,
-    )
+    client = create_llm_client()
 
     agent = Agent(
         name="design_manager",
@@ -74,7 +72,9 @@ def create_design_manager() -> Agent:
             read_project_state,
             update_status,
             log_manufacturing_action,
+            set_design,
         ],
+        stateless=True,
     )
 
     return agent
@@ -1,8 +1,7 @@
 """Logistics Manager - Handles packaging, wrapping, and gift cards."""
 
 from datapizza.agents import Agent
-from datapizza.clients.openai import OpenAIClient
-from elfactory.config import settings
+from elfactory.services.llm_client import create_llm_client
 from elfactory.tools import read_project_state, update_status, log_manufacturing_action
 from elfactory.models.logistics_output import LogisticsOutput
 
@@ -61,10 +60,7 @@ GUIDELINES:
 
 def create_logistics_manager() -> Agent:
     """Create the Logistics Manager agent with structured output."""
-    client = OpenAIClient(
-        api_key=settings.openai_api_key,
-        model=settings.openai_model,
-    )
+    client = create_llm_client()
 
     agent = Agent(
         name="logistics_manager",
@@ -75,6 +71,7 @@ def create_logistics_manager() -> Agent:
             update_status,
             log_manufacturing_action,
         ],
+        stateless=True,
     )
 
     return agent
@@ -1,8 +1,7 @@
 """Production Manager - Coordinates artisan elves to build the gift."""
 
 from datapizza.agents import Agent
-from datapizza.clients.openai import OpenAIClient
-from elfactory.config import settings
+from elfactory.services.llm_client import create_llm_client
 from elfactory.tools import read_project_state, update_status, log_manufacturing_action
 from elfactory.models.production_output import ProductionOutput
 
@@ -53,10 +52,7 @@ GUIDELINES:
 
 def create_production_manager() -> Agent:
     """Create the Production Manager agent with structured output."""
-    client = OpenAIClient(
-        api_key=settings.openai_api_key,
-        model=settings.openai_model,
-    )
+    client = create_llm_client()
 
     agent = Agent(
         name="production_manager",
@@ -67,6 +63,7 @@ def create_production_manager() -> Agent:
             update_status,
             log_manufacturing_action,
         ],
+        stateless=True,
     )
 
     return agent
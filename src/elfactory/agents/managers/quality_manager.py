@@ -1,9 +1,14 @@
 """Quality Manager - Inspects completed gifts for safety and quality."""
 
 from datapizza.agents import Agent
-from datapizza.clients.openai import OpenAIClient
-from elfactory.config import settings
-from elfactory.tools import read_project_state, update_status, log_manufacturing_action
+from elfactory.services.llm_client import create_llm_client
+from elfactory.tools import (
+    read_project_state,
+    update_status,
+    log_manufacturing_action,
+    request_rework,
+    check_safety_rules,
+)
 from elfactory.models.quality_output import QualityOutput
 
 
@@ -58,14 +63,17 @@ DOCUMENTATION (IGNORE IN SIMULATION):
 
 DECISIONS:
 - PASS: Gift is SAFE and functional → call logistics_manager to proceed
-- REWORK: Fixable issues found → call production_manager with specific rework instructions
+- REWORK: Fixable issues found → use request_rework() on the affected component IDs
 - FAIL: Critical safety defect that cannot be fixed → reject (very rare)
 
 REWORK PROCESS (RARE - only for actual physical safety issues):
 - Only request REWORK for PHYSICAL safety problems mentioned in artisan reports
 - Examples of valid REWORK: "sharp edge on metal piece", "loose electrical wire", "unstable structure"
 - Examples of INVALID REWORK: "missing documentation", "need source code", "no purchase receipt", "missing BOM"
-- If requesting REWORK: call production_manager with specific PHYSICAL fix needed
+- If requesting REWORK: call request_rework(component_ids, instructions) with ONLY the
+  component IDs that need the fix and the specific PHYSICAL fix needed
+- request_rework() calls only the artisans who created those components
+- Rework rounds are limited; if the tool says the limit is reached, decide PASS or FAIL
 - After rework, you'll re-inspect and typically PASS
 
 SIMULATION MODE PHILOSOPHY:
@@ -84,19 +92,22 @@ DEFAULT POSITION: PASS
 - The child is waiting for their gift, don't be bureaucratic
 
 WORKFLOW:
-1. Use read_project_state() to see all components and production log
-2. Read what artisans reported - did they mention addressing safety?
-3. Check if components make a complete, coherent gift
-4. Ask yourself: "Does this simulation story make sense?"
-5. Use log_manufacturing_action() to document inspection
-6. Make decision (default: PASS) and DELEGATE:
+1. Use check_safety_rules() for the deterministic safety pre-screen (component sizes vs. child age,
+   small batteries and magnets, glass). "high" findings are real PHYSICAL safety issues: REWORK them.
+   "unknown" findings mean the rules could not decide: judge them from the artisan reports
+2. Use read_project_state() to see all components and production log
+3. Read what artisans reported - did they mention addressing safety?
+4. Check if components make a complete, coherent gift
+5. Ask yourself: "Does this simulation story make sense?"
+6. Use log_manufacturing_action() to document inspection
+7. Make decision (default: PASS) and DELEGATE:
    - TYPICAL CASE → PASS: update_status("quality_passed") then DELEGATE to logistics_manager
-   - Physical safety issue in artisan report → REWORK: DELEGATE to production_manager with specific fix
+   - Physical safety issue in artisan report → REWORK: request_rework() on the affected components, re-inspect, then decide
    - Unfixable critical defect → FAIL: update_status("failed") and stop (extremely rare)
 
 CRITICAL: You MUST delegate to the next agent after inspection:
 - On PASS: Call logistics_manager to continue the workflow (99% of cases)
-- On REWORK: Call production_manager with PHYSICAL fix needed (rare, only real safety issues)
+- On REWORK: Use request_rework() with the PHYSICAL fix needed (rare, only real safety issues), then re-inspect
 - Never end without delegation unless it's a critical FAIL
 
 GUIDELINES FOR SIMULATION MODE:
@@ -113,20 +124,20 @@ GUIDELINES FOR SIMULATION MODE:
 
 def create_quality_manager() -> Agent:
     """Create the Quality Manager agent with structured output."""
-    client = OpenAIClient(
-        api_key=settings.openai_api_key,
-        model=settings.openai_model,
-    )
+    client = create_llm_client()
 
     agent = Agent(
         name="quality_manager",
         client=client,
         system_prompt=QUALITY_SYSTEM_PROMPT,
         tools=[
+            check_safety_rules,
             read_project_state,
             update_status,
             log_manufacturing_action,
+            request_rework,
         ],
+        stateless=True,
     )
 
     return agent
@@ -1,8 +1,7 @@
 """Reception Manager - First point of contact for gift requests."""
 
 from datapizza.agents import Agent
-from datapizza.clients.openai import OpenAIClient
-from elfactory.config import settings
+from elfactory.services.llm_client import create_llm_client
 from elfactory.tools import read_project_state, update_status, log_manufacturing_action, set_child_info
 from elfactory.models import ReceptionOutput
 
@@ -24,7 +23,8 @@ RESPONSIBILITIES:
 WORKFLOW:
 1. Use read_project_state() to check current state
 2. Extract all relevant information from the request
-3. Use set_child_info() to save child's name, age, and location
+3. Use set_child_info() to save child's name, age, and location. If the request says the child
+   information is already saved, skip this step unless it is wrong or incomplete.
 4. Use update_status() to mark reception as complete
 5. Use log_manufacturing_action() to record your work
 6. IMPORTANT: After completing your work, you MUST call the design_manager agent to continue the workflow. Pass the gift request to them for feasibility analysis.
@@ -35,13 +35,34 @@ GUIDELINES:
 - The design_manager will evaluate if we can manufacture the gift
 """
 
+PREFILLED_TASK = """Child information already extracted from the letter and saved: name {name}, age {age}, location {location}.
+Only call set_child_info() if it is wrong or incomplete.
+
+{email_content}"""
+
+
+def reception_task(email_content: str, child_info: dict | None) -> str:
+    """
+    Input of the reception manager, noting the child information already saved.
+
+    Args:
+        email_content: The gift request
+        child_info: Details saved from the local pre-classifier, if any
+
+    Returns:
+        The text to run the reception manager with
+    """
+    if not child_info:
+        return email_content
+    return PREFILLED_TASK.format(
+        email_content=email_content,
+        **{key: child_info.get(key) or "unknown" for key in ("name", "age", "location")},
+    )
+
 
 def create_reception_manager() -> Agent:
     """Create the Reception Manager agent with structured output."""
-    client = OpenAIClient(
-        api_key=settings.openai_api_key,
-        model=settings.openai_model,
-    )
+    client = create_llm_client()
 
     agent = Agent(
         name="reception_manager",
@@ -53,6 +74,7 @@ def create_reception_manager() -> Agent:
             update_status,
             log_manufacturing_action,
         ],
+        stateless=True,
     )
 
     return agent
@@ -1,8 +1,7 @@
 """Santa Claus - The final approver and magical blessing giver."""
 
 from datapizza.agents import Agent
-from datapizza.clients.openai import OpenAIClient
-from elfactory.config import settings
+from elfactory.services.llm_client import create_llm_client
 from elfactory.tools import read_project_state, log_manufacturing_action
 from elfactory.models.santa_output import SantaOutput
 
@@ -115,10 +114,7 @@ Never end without calling response_composer - they complete the workflow by send
 
 def create_santa_claus() -> Agent:
     """Create Santa Claus agent with structured output."""
-    client = OpenAIClient(
-        api_key=settings.openai_api_key,
-        model=settings.openai_model,
-    )
+    client = create_llm_client()
 
     agent = Agent(
         name="santa_claus",
@@ -128,6 +124,7 @@ def create_santa_claus() -> Agent:
             read_project_state,
             log_manufacturing_action,
         ],
+        stateless=True,
     )
 
     return agent
@@ -1,8 +1,7 @@
 """Image Prompt Generator - Creates prompts for AI image generation."""
 
 from datapizza.agents import Agent
-from datapizza.clients.openai import OpenAIClient
-from elfactory.config import settings
+from elfactory.services.llm_client import create_llm_client
 from elfactory.tools import read_project_state, log_manufacturing_action, generate_gift_image
 from elfactory.models.support_outputs import ImagePromptOutput
 
@@ -88,10 +87,7 @@ Never end without calling santa_claus - the workflow continues through them.
 
 def create_image_prompt_generator() -> Agent:
     """Create the Image Prompt Generator agent with structured output."""
-    client = OpenAIClient(
-        api_key=settings.openai_api_key,
-        model=settings.openai_model,
-    )
+    client = create_llm_client()
 
     agent = Agent(
         name="image_prompt_generator",
@@ -102,6 +98,7 @@ def create_image_prompt_generator() -> Agent:
             log_manufacturing_action,
             generate_gift_image,
         ],
+        stateless=True,
     )
 
     return agent
@@ -1,10 +1,8 @@
 """Online Shopper Elf - Searches online for gifts that can't be manufactured."""
 
 from datapizza.agents import Agent
-from datapizza.clients.openai import OpenAIClient
-from datapizza.tools.duckduckgo import DuckDuckGoSearchTool
-from elfactory.config import settings
-from elfactory.tools import read_project_state, log_manufacturing_action, update_status
+from elfactory.services.llm_client import create_llm_client
+from elfactory.tools import read_project_state, log_manufacturing_action, update_status, search_products, record_purchase
 from elfactory.models.support_outputs import OnlineShopperOutput
 
 
@@ -36,12 +34,16 @@ SEARCH STRATEGY:
 
 WORKFLOW:
 1. Use read_project_state() to see gift request and child info
-2. Use DuckDuckGo search to find products online
+2. Use search_products() ONCE with all your candidate queries (exact product, close alternatives,
+   retailer or age-range variants): the workshop catalog is checked first (already filtered by
+   the child's age), the rest runs on the web in parallel, and repeated searches are cached
 3. Evaluate search results
 4. Select best option
-5. Use log_manufacturing_action() to document search
-6. Use update_status("product_selected") to mark selection complete
-7. CRITICAL: MUST DELEGATE to quality_manager to verify the selection
+5. Use record_purchase() with the product's age rating and safety marks (CE, EN71, ASTM F963...)
+   exactly as the listing states them - leave them empty if it does not
+6. Use log_manufacturing_action() to document search
+7. Use update_status("product_selected") to mark selection complete
+8. CRITICAL: MUST DELEGATE to quality_manager to verify the selection
 
 OUTPUT REQUIREMENTS:
 - Be honest if nothing suitable found
@@ -66,10 +68,7 @@ Never end without calling quality_manager - the workflow continues through them.
 
 def create_online_shopper_elf() -> Agent:
     """Create the Online Shopper Elf agent with structured output."""
-    client = OpenAIClient(
-        api_key=settings.openai_api_key,
-        model=settings.openai_model,
-    )
+    client = create_llm_client()
 
     agent = Agent(
         name="online_shopper_elf",
@@ -79,8 +78,10 @@ def create_online_shopper_elf() -> Agent:
             read_project_state,
             log_manufacturing_action,
             update_status,
-            DuckDuckGoSearchTool(),
+            search_products,
+            record_purchase,
         ],
+        stateless=True,
     )
 
     return agent
@@ -1,13 +1,11 @@
 """Response Composer - Creates final email response to the child."""
 
 from datapizza.agents import Agent
-from datapizza.clients.openai import OpenAIClient
-from elfactory.config import settings
+from elfactory.services.llm_client import create_llm_client
 from elfactory.tools import (
     read_project_state,
     log_manufacturing_action,
     send_gift_email,
-    generate_manufacturing_report,
     update_status,
 )
 from elfactory.models.support_outputs import ResponseComposerOutput
@@ -31,10 +29,11 @@ WORKFLOW:
 2. Get the recipient email from state.sender_email - this is where you send the response
 3. Craft personalized email subject and HTML body
 4. Use send_gift_email() with the sender_email from state as recipient to send the email with the gift image attached
-5. Use generate_manufacturing_report() to create the final manufacturing report
-6. Use log_manufacturing_action() to document work
-7. Use update_status("completed") to mark the workflow as complete
-8. THIS IS THE FINAL STEP - after sending email, generating report, and updating status, the workflow is complete
+   (the email is queued and delivered in the background; do not call it again for the same email)
+5. Use log_manufacturing_action() to document work
+6. Use update_status("completed") to mark the workflow as complete
+7. THIS IS THE FINAL STEP - after sending email and updating status, the workflow is complete
+   (the manufacturing report is generated automatically)
 
 EMAIL STRUCTURE:
 
@@ -133,9 +132,8 @@ GUIDELINES:
 
 CRITICAL - COMPLETE ALL STEPS IN ORDER:
 1. Send email with send_gift_email() - this sets final_response
-2. Generate report with generate_manufacturing_report()
-3. Log your work with log_manufacturing_action()
-4. Set status to completed with update_status("completed") - THIS IS MANDATORY!
+2. Log your work with log_manufacturing_action()
+3. Set status to completed with update_status("completed") - THIS IS MANDATORY!
 
 ABSOLUTELY REQUIRED: After logging your work, you MUST call update_status("completed").
 The workflow will FAIL if you don't set the status to "completed".
@@ -145,10 +143,7 @@ Do NOT end your work without calling update_status("completed") as the final ste
 
 def create_response_composer() -> Agent:
     """Create the Response Composer agent with structured output."""
-    client = OpenAIClient(
-        api_key=settings.openai_api_key,
-        model=settings.openai_model,
-    )
+    client = create_llm_client()
 
     agent = Agent(
         name="response_composer",
@@ -158,9 +153,9 @@ def create_response_composer() -> Agent:
             read_project_state,
             log_manufacturing_action,
             send_gift_email,
-            generate_manufacturing_report,
             update_status,
         ],
+        stateless=True,
     )
 
     return agent
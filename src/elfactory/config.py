@@ -1,5 +1,7 @@
 """Configuration management using Pydantic settings."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,6 +21,76 @@ class Settings(BaseSettings):
     workshop_email: str = "letterine@santas-workshop.ai"
     max_concurrent_gifts: int = 5
 
+    # Provider rate limits (shared by all agents in the process)
+    llm_requests_per_minute: int = 500
+    llm_tokens_per_minute: int = 200_000
+    llm_max_concurrency: int = 8
+    image_requests_per_minute: int = 5
+    image_max_concurrency: int = 2
+    rate_limit_max_attempts: int = 5
+    rate_limit_dir: str = ""  # Set to share buckets across processes
+
+    # Per-gift limits; when exceeded the remaining stages are cancelled
+    gift_deadline_seconds: int = 900
+    gift_max_llm_calls: int = 150
+    gift_max_tokens: int = 2_000_000
+    max_rework_iterations: int = 2
+
+    # Gmail claim labels (<prefix>-processing, -claim-<worker>, -done, -failed) let monitors share a mailbox
+    gmail_label_prefix: str = "elfactory"
+    gmail_worker_id: str = ""  # Stable name of this monitor; defaults to host and pid
+
+    # Local letter pre-classifier; emails scoring below letter_min_score are skipped without an LLM call
+    letter_min_score: float = 0.5
+    letter_classifier_path: str = ""  # Weights from scripts/train_letter_classifier.py
+
+    # Rule-based quality pre-screen; clear passes skip the LLM inspection
+    quality_prescreen: bool = True
+
+    # Render the gift image after quality PASS, during logistics and Santa's review
+    speculative_image: bool = True
+    speculative_image_workers: int = 4
+
+    # read_project_state shows this many recent log entries; older ones are summarized
+    agent_log_tail: int = 20
+    agent_log_details_chars: int = 300
+
+    # Librarian answers shared by all artisans and gifts; empty path keeps them in memory only
+    librarian_cache_path: str = "logs/librarian_cache.json"
+    librarian_cache_ttl_hours: int = 720
+    librarian_cache_size: int = 5000
+
+    # Product search for the online shopper; a canned results file makes it work offline
+    search_region: str = "it-it"
+    search_max_results: int = 8
+    search_max_workers: int = 4
+    search_cache_path: str = "logs/search_cache.json"
+    search_cache_ttl_hours: int = 24
+    search_cache_size: int = 2000
+    search_canned_path: str = ""
+    product_catalog_path: str = ""  # .jsonl or .csv products searched before the web
+
+    # Gift images are attached as an email-sized copy (needs the "images" extra, Pillow)
+    email_image_max_side: int = 768
+    email_image_max_bytes: int = 150_000
+    email_image_format: str = "jpeg"  # or "webp" (smaller, not shown by some email clients)
+    thumbnail_size: int = 256
+
+    # Response emails are queued here and sent by a background thread with retries
+    outbox_path: str = "logs/outbox.db"
+    outbox_max_attempts: int = 6
+    outbox_retry_base_seconds: float = 30.0
+    outbox_batch_size: int = 20
+
+    # Reports written in the background when a gift reaches a terminal status
+    reports_dir: str = "logs/reports"
+    report_formats: str = "md,json,html"
+    analytics_db: str = "logs/analytics.db"  # Empty to disable the season analytics store
+
+    # Per-gift event logs; empty event_log_dir keeps events in memory only
+    event_log_dir: str = "logs/events"
+    event_snapshot_interval: int = 200
+
     enable_tracing: bool = True
     log_level: str = "INFO"
 
@@ -27,4 +99,20 @@ class Settings(BaseSettings):
     test_recipient_email: str = ""
 
 
-settings = Settings()
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Load the settings from the environment on first use."""
+    return Settings()
+
+
+class _LazySettings:
+    """Proxy to get_settings(), so importing this module does not read the environment."""
+
+    def __getattr__(self, name):
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name, value):
+        setattr(get_settings(), name, value)
+
+
+settings = _LazySettings()
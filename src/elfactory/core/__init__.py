@@ -1,6 +1,28 @@
-"""Core module containing WorkshopState and orchestration logic."""
+"""Core module containing WorkshopState and orchestration logic.
 
-from .state import WorkshopState
-from .orchestrator import WorkshopOrchestrator, get_orchestrator, process_gift_request
+Members are loaded on first access: importing elfactory.core does not build
+or import any agent.
+"""
 
-__all__ = ["WorkshopState", "WorkshopOrchestrator", "get_orchestrator", "process_gift_request"]
+import importlib
+
+_MEMBERS = {
+    "WorkshopState": ".state",
+    "WorkshopOrchestrator": ".orchestrator",
+    "get_orchestrator": ".orchestrator",
+    "process_gift_request": ".orchestrator",
+}
+
+__all__ = list(_MEMBERS)
+
+
+def __getattr__(name: str):
+    if name not in _MEMBERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_MEMBERS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
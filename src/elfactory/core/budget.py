@@ -0,0 +1,84 @@
+"""Per-gift deadline and LLM budget tracking."""
+
+import threading
+import time
+from dataclasses import dataclass, field
+
+
+class BudgetExceededError(RuntimeError):
+    """Raised when a gift runs past its deadline or exhausts its LLM budget."""
+
+
+@dataclass
+class GiftBudget:
+    """Deadline plus call/token allowance for a single gift workflow."""
+
+    gift_id: str
+    deadline: float  # time.monotonic() value
+    max_llm_calls: int
+    max_tokens: int
+    llm_calls: int = 0
+    tokens_used: int = 0
+    exhausted_reason: str = ""
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def from_settings(cls, gift_id: str) -> "GiftBudget":
+        """Create a budget using the configured per-gift limits."""
+        from elfactory.config import settings
+
+        return cls(
+            gift_id=gift_id,
+            deadline=time.monotonic() + settings.gift_deadline_seconds,
+            max_llm_calls=settings.gift_max_llm_calls,
+            max_tokens=settings.gift_max_tokens,
+        )
+
+    def remaining_seconds(self) -> float:
+        """Seconds left before the deadline (never negative)."""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def check(self) -> None:
+        """
+        Raise if the gift may not start any more work.
+
+        Raises:
+            BudgetExceededError: If the deadline passed or a limit was reached
+        """
+        with self._lock:
+            if not self.exhausted_reason:
+                if time.monotonic() >= self.deadline:
+                    self.exhausted_reason = "deadline exceeded"
+                elif self.llm_calls >= self.max_llm_calls:
+                    self.exhausted_reason = f"LLM call budget exhausted ({self.max_llm_calls} calls)"
+                elif self.tokens_used >= self.max_tokens:
+                    self.exhausted_reason = f"token budget exhausted ({self.max_tokens} tokens)"
+            if self.exhausted_reason:
+                raise BudgetExceededError(f"Gift {self.gift_id}: {self.exhausted_reason}")
+
+    def charge(self, calls: int = 0, tokens: int = 0) -> None:
+        """Record LLM calls and tokens spent on this gift."""
+        with self._lock:
+            self.llm_calls += calls
+            self.tokens_used += tokens
+
+    def usage_summary(self) -> str:
+        """One-line description of what the gift consumed."""
+        return (
+            f"{self.llm_calls}/{self.max_llm_calls} LLM calls, "
+            f"{self.tokens_used}/{self.max_tokens} tokens, "
+            f"{self.remaining_seconds():.0f}s left"
+        )
+
+
+active_budgets: dict[str, GiftBudget] = {}
+
+
+def get_current_budget() -> GiftBudget | None:
+    """Budget of the gift bound to the current context, if any."""
+    from elfactory.tools.state_tools import current_gift_id
+
+    gift_id = current_gift_id.get(None)
+    if gift_id is None:
+        return None
+    return active_budgets.get(gift_id)
@@ -0,0 +1,82 @@
+"""Agent-to-agent delegation that carries the gift context into sub-agent runs."""
+
+import asyncio
+from typing import Awaitable, Callable
+
+from datapizza.agents import Agent
+from elfactory.core.budget import BudgetExceededError, get_current_budget
+from elfactory.tools.state_tools import current_gift_id
+
+
+# Wraps a delegated agent run: called with the task and the function running
+# the agent, it may answer by itself, rewrite the task or post-process the result
+Intercept = Callable[[str, Callable[[str], Awaitable[str]]], Awaitable[str]]
+
+
+def _gift_context_tool(agent: Agent, intercept: Intercept | None = None):
+    """
+    Build the tool used to call agent from another agent.
+
+    datapizza runs sub-agents as coroutines on its own event-loop thread, which
+    does not inherit the caller's contextvars. The wrapper captures the gift ID
+    when the tool is invoked, re-binds it inside the sub-agent task, checks the
+    gift budget and bounds the sub-agent run by the remaining deadline.
+    """
+    agent_tool = agent.as_tool()
+    run_agent = agent_tool.func
+
+    async def invoke_agent(input_task: str):
+        if intercept is not None:
+            return await intercept(input_task, run_agent)
+        return await run_agent(input_task)
+
+    def invoke_with_gift_context(input_task: str):
+        gift_id = current_gift_id.get(None)
+
+        async def run():
+            if gift_id is not None:
+                current_gift_id.set(gift_id)
+            budget = get_current_budget()
+            if budget is None:
+                return await invoke_agent(input_task)
+            budget.check()
+            try:
+                return await asyncio.wait_for(invoke_agent(input_task), timeout=budget.remaining_seconds())
+            except TimeoutError:
+                budget.exhausted_reason = budget.exhausted_reason or "deadline exceeded"
+                raise BudgetExceededError(
+                    f"Gift {budget.gift_id}: {budget.exhausted_reason} while running {agent.name}"
+                ) from None
+
+        return run()
+
+    agent_tool.func = invoke_with_gift_context
+    return agent_tool
+
+
+def delegate(caller: Agent, callees: list[Agent], intercept: Intercept | None = None) -> None:
+    """
+    Allow caller to call each of callees, like Agent.can_call().
+
+    Args:
+        caller: Agent that delegates
+        callees: Agents it may delegate to
+        intercept: Optional wrapper of each callee run, called inside the gift
+            context and budget (e.g. a rule-based pre-screen or a cache)
+    """
+    for callee in callees:
+        # Same registration Agent.can_call() performs, with the wrapped tool
+        caller._tools.append(_gift_context_tool(callee, intercept))
+
+
+def delegation_call(agent: Agent, intercept: Intercept | None = None) -> Callable[[str], Awaitable[str]]:
+    """
+    Coroutine function running agent the way a delegating agent would.
+
+    Lets an intercept hand over to the next agent of the workflow itself.
+
+    Args:
+        agent: Agent to run
+        intercept: Optional wrapper of the run, as in delegate()
+    """
+    return _gift_context_tool(agent, intercept).func
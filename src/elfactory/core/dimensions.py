@@ -0,0 +1,98 @@
+"""Parse free-form component dimensions into numeric millimetre extents."""
+
+import re
+from functools import lru_cache
+
+# length unit -> millimetres
+LENGTH_UNITS = {
+    **dict.fromkeys(["mm", "millimeter", "millimeters", "millimetre", "millimetres", "millimetri"], 1.0),
+    **dict.fromkeys(["cm", "centimeter", "centimeters", "centimetre", "centimetres", "centimetri"], 10.0),
+    **dict.fromkeys(["m", "meter", "meters", "metre", "metres", "metri", "metro"], 1000.0),
+    **dict.fromkeys(["in", "inch", "inches", '"'], 25.4),
+}
+DIAMETER_WORDS = {"diameter", "diametro", "dia", "ø", "⌀", "diam"}
+RADIUS_WORDS = {"radius", "raggio"}
+SEPARATORS = {"x", "×", "by", "per", "and", "e"}
+# Words that describe an extent without changing it ("30 cm tall", "5mm thick")
+EXTENT_WORDS = {
+    "tall", "high", "height", "long", "length", "wide", "width", "deep", "depth", "thick", "thickness",
+    "alto", "alta", "altezza", "lungo", "lunga", "lunghezza", "largo", "larga", "larghezza",
+    "profondo", "profondità", "spesso", "spessore", "l", "w", "h", "d",
+}
+DEFAULT_UNIT_MM = 10.0  # bare numbers are centimetres, the unit artisans use most
+
+_TOKEN = re.compile(r'\d+(?:[.,]\d+)?|[a-zà-ü]+|[ø⌀×"]')
+
+
+@lru_cache(maxsize=4096)
+def parse_dimensions(text: str) -> tuple[float, ...]:
+    """
+    Extract the extents of a component in millimetres, largest first.
+
+    Numbers take the next length unit to their right ("15x10x5cm"), else the
+    last one seen, else centimetres. A diameter counts as two extents (three
+    when it is the only measure, i.e. a ball), a radius as a doubled
+    diameter. Numbers followed by a non-length word ("2 batteries", "250 g")
+    and numbers glued to letters ("M3") are ignored. At most the three
+    largest extents are kept; an unparsable text gives ().
+
+    Examples:
+        "15x10x5cm" -> (150.0, 100.0, 50.0)
+        "10cm rod, 5mm diameter" -> (100.0, 5.0, 5.0)
+        "diameter 3cm" -> (30.0, 30.0, 30.0)
+        "same as original" -> ()
+    """
+    values: list[list] = []  # [amount, mm per unit or None, kind]
+    pending_kind = None
+    previous = ""  # "number", "unit" or ""
+    lowered = text.lower()
+    for match in _TOKEN.finditer(lowered):
+        token = match.group()
+        start = match.start()
+        if token[0].isdigit():
+            if start and lowered[start - 1].isalpha() and lowered[start - 1] != "x":
+                previous = ""
+                continue
+            values.append([float(token.replace(",", ".")), None, pending_kind or "extent"])
+            pending_kind = None
+            previous = "number"
+        elif token in LENGTH_UNITS and previous == "number":
+            for value in reversed(values):
+                if value[1] is not None:
+                    break
+                value[1] = LENGTH_UNITS[token]
+            previous = "unit"
+        elif token in DIAMETER_WORDS or token in RADIUS_WORDS:
+            kind = "radius" if token in RADIUS_WORDS else "diameter"
+            if previous in ("number", "unit") and values[-1][2] == "extent":
+                values[-1][2] = kind
+            else:
+                pending_kind = kind
+            previous = ""
+        elif token in SEPARATORS or token in EXTENT_WORDS:
+            previous = ""
+        else:
+            if previous == "number" and values and values[-1][1] is None:
+                values.pop()
+            previous = ""
+
+    extents: list[float] = []
+    diameters: list[float] = []
+    last_unit = DEFAULT_UNIT_MM
+    for amount, unit, kind in values:
+        last_unit = unit if unit is not None else last_unit
+        mm = round(amount * last_unit, 3)
+        if kind == "extent":
+            extents.append(mm)
+        else:
+            diameters.append(mm * 2 if kind == "radius" else mm)
+    for diameter in diameters:
+        extents.extend([diameter, diameter] if extents or len(diameters) > 1 else [diameter] * 3)
+    return tuple(sorted(extents, reverse=True)[:3])
+
+
+def dimension_fields(text: str) -> dict[str, float | None]:
+    """Numeric fields of a Component for a dimensions string (None when unknown)."""
+    extents = parse_dimensions(text)
+    padded = extents + (None,) * (3 - len(extents))
+    return {"max_mm": padded[0], "mid_mm": padded[1], "min_mm": padded[2]}
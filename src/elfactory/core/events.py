@@ -0,0 +1,457 @@
+"""Append-only event log behind WorkshopState, with projections and persistence."""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from pydantic import TypeAdapter
+
+from elfactory.core.state import (
+    ChildInfo,
+    Component,
+    Issue,
+    ManufacturingLogEntry,
+    QualityReport,
+    WorkshopState,
+    record_from_json,
+)
+
+logger = logging.getLogger("elfactory.events")
+
+# Persist pending events at least this often, even without a status change
+FLUSH_BATCH = 50
+
+
+@dataclass(slots=True, kw_only=True)
+class StateEvent:
+    """
+    One mutation of a gift's state.
+
+    A slotted dataclass, like the records, because one is built for every
+    write while the state lock is held. data is a dict, or for record events
+    (component_added, action_logged, issue_reported) the record itself until
+    the event is serialized; records are never mutated, so sharing is safe.
+    Events loaded from disk always hold dicts.
+    """
+    seq: int
+    type: str
+    timestamp: datetime = field(default_factory=datetime.now)
+    data: Any
+
+    def to_json(self) -> str:
+        """One JSONL line; a record payload is serialized like record_to_json() would."""
+        return _EVENT_ADAPTER.dump_json(self).decode()
+
+    @classmethod
+    def from_json(cls, line: str) -> "StateEvent":
+        """Validate a persisted event."""
+        return _EVENT_ADAPTER.validate_json(line)
+
+
+_EVENT_ADAPTER = TypeAdapter(StateEvent)
+
+
+def event_field(event: StateEvent, name: str) -> Any:
+    """A field of an event's payload, whether it is a dict or a record."""
+    return event.data[name] if isinstance(event.data, dict) else getattr(event.data, name)
+
+
+class EventLog:
+    """
+    In-memory, append-only event log of one gift.
+
+    WorkshopState records its mutations here (see WorkshopState.attach_event_log).
+    Listeners are called synchronously, in sequence order, while the log lock
+    is held: they must be quick and must not mutate the state.
+    """
+
+    def __init__(self, gift_id: str):
+        self.gift_id = gift_id
+        self.events: list[StateEvent] = []
+        self._listeners: list[Callable[[StateEvent], None]] = []
+        self._lock = threading.Lock()
+
+    def start(self, state: WorkshopState) -> None:
+        """Record the initial state and attach the log to it."""
+        self.record("gift_created", state.snapshot().model_dump(mode="json"))
+        state.attach_event_log(self)
+
+    def record(self, event_type: str, data: Any) -> StateEvent:
+        """
+        Append an event and notify the listeners.
+
+        Args:
+            event_type: One of the types handled by apply_event()
+            data: JSON-serializable payload, or the record of a record event
+
+        Returns:
+            The recorded event
+        """
+        with self._lock:
+            event = StateEvent(seq=len(self.events), type=event_type, data=data)
+            self.events.append(event)
+            for listener in self._listeners:
+                try:
+                    listener(event)
+                except Exception as e:
+                    logger.warning(f"Event listener failed on {event_type} #{event.seq}: {e}")
+        return event
+
+    def subscribe(self, listener: Callable[[StateEvent], None]) -> None:
+        """
+        Register a listener; it first receives every event recorded so far.
+
+        Args:
+            listener: Callable receiving each StateEvent
+        """
+        with self._lock:
+            for event in self.events:
+                listener(event)
+            self._listeners.append(listener)
+
+    def since(self, seq: int) -> list[StateEvent]:
+        """Events with a sequence number of at least seq."""
+        with self._lock:
+            return self.events[seq:]
+
+
+def _as_record(cls: type, data: Any) -> Any:
+    return data if isinstance(data, cls) else record_from_json(cls, data)
+
+
+def _upsert_component(state: WorkshopState, data: Any) -> None:
+    component = _as_record(Component, data)
+    for i, existing in enumerate(state.components):
+        if existing.id == component.id:
+            state.components[i] = component
+            return
+    state.components.append(component)
+
+
+def _set_components_status(state: WorkshopState, data: dict[str, Any]) -> None:
+    wanted = set(data["component_ids"])
+    for i, component in enumerate(state.components):
+        if component.id in wanted:
+            state.components[i] = replace(component, status=data["status"])
+
+
+def _resolve_issue(state: WorkshopState, data: dict[str, Any]) -> None:
+    issue = state.issues[data["index"]]
+    state.issues[data["index"]] = replace(issue, resolved=True)
+
+
+_APPLIERS: dict[str, Callable[[WorkshopState, dict[str, Any]], None]] = {
+    "component_added": _upsert_component,
+    "component_status_changed": _set_components_status,
+    "action_logged": lambda state, data: state.manufacturing_log.append(_as_record(ManufacturingLogEntry, data)),
+    "issue_reported": lambda state, data: state.issues.append(_as_record(Issue, data)),
+    "issue_resolved": _resolve_issue,
+    "status_changed": lambda state, data: setattr(state, "status", data["status"]),
+    "child_info_set": lambda state, data: setattr(state, "child_info", ChildInfo(**data)),
+    "quality_report_set": lambda state, data: setattr(state, "quality_report", QualityReport(**data)),
+    "field_set": lambda state, data: setattr(state, data["field"], data["value"]),
+}
+
+
+def apply_event(state: WorkshopState | None, event: StateEvent) -> WorkshopState:
+    """
+    Apply one event to a state that is not attached to an event log.
+
+    Args:
+        state: The state built from the previous events (None before gift_created)
+        event: The event to apply
+
+    Returns:
+        The updated state
+    """
+    if event.type == "gift_created":
+        return WorkshopState.model_validate(event.data)
+    _APPLIERS[event.type](state, event.data)
+    state.updated_at = event.timestamp
+    return state
+
+
+class StateProjection:
+    """Current state rebuilt incrementally from events, independent of the live state."""
+
+    def __init__(self):
+        self.state: WorkshopState | None = None
+        self.seq = -1
+        self._component_index: dict[str, int] = {}  # Components are never removed, so positions hold
+
+    def __call__(self, event: StateEvent) -> None:
+        if event.type == "component_added" and self.state is not None:
+            # apply_event scans the components for a replaced ID; the index keeps bulk writes linear
+            component = _as_record(Component, event.data)
+            components = self.state.components
+            position = self._component_index.setdefault(component.id, len(components))
+            if position == len(components):
+                components.append(component)
+            else:
+                components[position] = component
+            self.state.updated_at = event.timestamp
+        else:
+            self.state = apply_event(self.state, event)
+            if event.type == "gift_created":
+                self._component_index = {c.id: i for i, c in enumerate(self.state.components)}
+        self.seq = event.seq
+
+
+class MetricsProjection:
+    """Production metrics maintained incrementally from events."""
+
+    def __init__(self):
+        self.events = 0
+        self.components_by_agent: Counter = Counter()
+        self.actions_by_agent: Counter = Counter()
+        self.issues_by_severity: Counter = Counter()
+        self.status_history: list[tuple[str, datetime]] = []
+        self.started_at: datetime | None = None
+        self.last_event_at: datetime | None = None
+
+    def __call__(self, event: StateEvent) -> None:
+        self.events += 1
+        self.last_event_at = event.timestamp
+        if event.type == "gift_created":
+            self.started_at = event.timestamp
+        elif event.type == "component_added":
+            self.components_by_agent[event_field(event, "created_by")] += 1
+        elif event.type == "action_logged":
+            self.actions_by_agent[event_field(event, "agent")] += 1
+        elif event.type == "issue_reported":
+            self.issues_by_severity[event_field(event, "severity")] += 1
+        elif event.type == "status_changed":
+            self.status_history.append((event.data["status"], event.timestamp))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Metrics as a JSON-serializable dict."""
+        elapsed = (
+            (self.last_event_at - self.started_at).total_seconds()
+            if self.started_at and self.last_event_at else 0.0
+        )
+        return {
+            "events": self.events,
+            "elapsed_seconds": round(elapsed, 3),
+            "components_by_agent": dict(self.components_by_agent),
+            "actions_by_agent": dict(self.actions_by_agent),
+            "issues_by_severity": dict(self.issues_by_severity),
+            "status_history": [
+                {"status": status, "at": at.isoformat()} for status, at in self.status_history
+            ],
+        }
+
+
+class EventStore:
+    """
+    Events and snapshots on disk, one JSONL file per gift.
+
+    Layout:
+        <directory>/<gift_id>.jsonl          append-only events
+        <directory>/<gift_id>.snapshot.json  latest snapshot {"seq", "state"}
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def events_path(self, gift_id: str) -> Path:
+        return self.directory / f"{gift_id}.jsonl"
+
+    def snapshot_path(self, gift_id: str) -> Path:
+        return self.directory / f"{gift_id}.snapshot.json"
+
+    def append(self, gift_id: str, events: list[StateEvent]) -> None:
+        """Append events to the gift's log file."""
+        if not events:
+            return
+        with open(self.events_path(gift_id), "a", encoding="utf-8") as f:
+            f.write("".join(event.to_json() + "\n" for event in events))
+
+    def write_snapshot(self, gift_id: str, seq: int, state: WorkshopState) -> None:
+        """Atomically replace the gift's snapshot."""
+        path = self.snapshot_path(gift_id)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"seq": seq, "state": state.model_dump(mode="json")}),
+            encoding="utf-8",
+        )
+        os.replace(tmp, path)
+
+    def load(self, gift_id: str) -> tuple[dict | None, list[StateEvent]]:
+        """
+        Load a gift's latest snapshot and its full event list.
+
+        Returns:
+            The snapshot dict (or None) and all persisted events
+        """
+        snapshot_path = self.snapshot_path(gift_id)
+        snapshot = json.loads(snapshot_path.read_text(encoding="utf-8")) if snapshot_path.exists() else None
+        events_path = self.events_path(gift_id)
+        events = []
+        if events_path.exists():
+            with open(events_path, encoding="utf-8") as f:
+                events = [StateEvent.from_json(line) for line in f if line.strip()]
+        return snapshot, events
+
+
+class EventPersistence:
+    """
+    Listener that writes new events to an EventStore, off the state's locks.
+
+    Events are recorded while the EventLog lock and the mutated state stripe
+    are held, so the listener only appends them to a pending list; on every
+    status change and every FLUSH_BATCH events it queues one flush for the
+    process-wide EventWriter thread. There the batch is serialized and
+    appended, so each write is O(new events), and every snapshot_interval
+    events the listener's own StateProjection, a copy owned by the writer
+    thread, is written as a snapshot, exactly consistent with the last
+    persisted event.
+    """
+
+    def __init__(self, store: EventStore, gift_id: str, snapshot_interval: int, writer: "EventWriter | None" = None):
+        self.store = store
+        self.gift_id = gift_id
+        self.snapshot_interval = snapshot_interval
+        self.writer = writer or get_event_writer()
+        self.projection = StateProjection()
+        self._pending: list[StateEvent] = []
+        self._queued = False
+        self._lock = threading.Lock()
+        self._last_snapshot = -1
+
+    def __call__(self, event: StateEvent) -> None:
+        with self._lock:
+            self._pending.append(event)
+            due = not self._queued and (event.type == "status_changed" or len(self._pending) >= FLUSH_BATCH)
+            self._queued = self._queued or due
+        if due:
+            self.writer.submit(self)
+
+    def flush(self) -> None:
+        """Apply and persist pending events, and a snapshot when one is due (writer thread)."""
+        with self._lock:
+            events, self._pending = self._pending, []
+            self._queued = False
+        for event in events:
+            self.projection(event)
+        self.store.append(self.gift_id, events)
+        if self.snapshot_interval and self.projection.seq - self._last_snapshot >= self.snapshot_interval:
+            self.snapshot()
+
+    def snapshot(self) -> None:
+        if self.projection.state is not None:
+            self.store.write_snapshot(self.gift_id, self.projection.seq, self.projection.state)
+            self._last_snapshot = self.projection.seq
+
+    def finish(self) -> None:
+        """Flush everything and write a final snapshot (writer thread)."""
+        self.flush()
+        if self._last_snapshot != self.projection.seq:
+            self.snapshot()
+
+    def close(self) -> None:
+        """Wait until every event of the gift is persisted, with a final snapshot."""
+        self.writer.close(self).wait()
+
+
+class EventWriter:
+    """
+    Single background thread that persists the events of every gift.
+
+    Like the ReportWriter: submitting is O(1), so state writers never wait on
+    disk I/O; serialization, file appends and snapshot dumps all happen here.
+    """
+
+    def __init__(self):
+        self._jobs: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def _put(self, job: tuple) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="event-writer", daemon=True)
+                self._thread.start()
+        self._jobs.put(job)
+
+    def submit(self, persistence: EventPersistence) -> None:
+        """Queue a flush of a gift's pending events."""
+        self._put((persistence, None))
+
+    def close(self, persistence: EventPersistence) -> threading.Event:
+        """Queue the final flush of a gift; the returned event is set once it is on disk."""
+        done = threading.Event()
+        self._put((persistence, done))
+        return done
+
+    def _run(self) -> None:
+        while True:
+            persistence, done = self._jobs.get()
+            try:
+                if done is None:
+                    persistence.flush()
+                else:
+                    persistence.finish()
+            except Exception as e:
+                logger.warning(f"Could not persist events of {persistence.gift_id}: {e}")
+            finally:
+                if done is not None:
+                    done.set()
+                self._jobs.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued flush is written."""
+        self._jobs.join()
+
+
+_writer: EventWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_event_writer() -> EventWriter:
+    """Get the process-wide event writer, flushed at interpreter exit."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = EventWriter()
+            atexit.register(_writer.flush)
+        return _writer
+
+
+def replay(gift_id: str, store: EventStore, until_seq: int | None = None) -> WorkshopState:
+    """
+    Rebuild a gift's state from disk.
+
+    Starts from the latest snapshot when it is not past until_seq, then
+    applies the remaining events.
+
+    Args:
+        gift_id: Gift to rebuild
+        store: Where the gift's events were persisted
+        until_seq: Stop after this event (default: replay everything)
+
+    Returns:
+        The rebuilt WorkshopState
+    """
+    snapshot, events = store.load(gift_id)
+    if not events and snapshot is None:
+        raise FileNotFoundError(f"No events found for {gift_id} in {store.directory}")
+
+    state, start = None, 0
+    if snapshot and (until_seq is None or snapshot["seq"] <= until_seq):
+        state = WorkshopState.model_validate(snapshot["state"])
+        start = snapshot["seq"] + 1
+
+    for event in events[start:]:
+        if until_seq is not None and event.seq > until_seq:
+            break
+        state = apply_event(state, event)
+    return state
@@ -0,0 +1,179 @@
+"""Speculative gift image rendering, overlapped with logistics and Santa's review."""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from datapizza.agents import Agent
+from elfactory.tools.state_tools import active_gifts, current_gift_id
+
+logger = logging.getLogger("elfactory.images")
+
+SPECULATION_AGENT = "image_speculation"
+
+RENDER_TASK = """Create the gift image for gift {gift_id}. Quality inspection has PASSED and the
+components are final; packaging is being designed at the same time, so show the gift beautifully
+gift-wrapped in festive paper. Read the project state, write the image prompt, call
+generate_gift_image() once and log your work. Santa's review runs separately: do NOT delegate,
+finish after the image is generated."""
+
+SANTA_TASK = """Gift {gift_id} is packaged and ready for your final review. The gift image is being
+rendered in the background and will be attached to the response email. Review the gift, decide,
+and if you approve it DELEGATE to response_composer."""
+
+IMAGE_READY = """
+
+The gift image is ready at {image_path} - attach it with send_gift_email(image_path="{image_path}")."""
+
+IMAGE_MISSING = """
+
+No gift image could be generated ({reason}); send the email without an image."""
+
+
+def _quality_passed(state) -> bool:
+    # quality_manager marks a PASS with update_status; the pre-screen also records a report
+    report = state.quality_report
+    return state.status == "quality_passed" or (report is not None and report.overall_status == "PASS")
+
+
+@dataclass
+class _Render:
+    future: Future
+    started: float = field(default_factory=time.monotonic)
+    finished: float | None = None
+
+    def mark_finished(self, _future: Future) -> None:
+        self.finished = time.monotonic()
+
+
+class ImageSpeculation:
+    """
+    Renders the gift image while logistics and Santa work, instead of between them.
+
+    The components of a gift are final once quality passes, so the image no
+    longer needs to wait for packaging and approval. Three delegation
+    intercepts move it off the critical path:
+
+    - start (on the hand-over to logistics_manager): after a PASS, runs the
+      image prompt generator in a background thread, without delegation
+    - handover (on logistics_manager → image_prompt_generator): goes straight
+      to santa_claus while the image renders
+    - join (on santa_claus → response_composer): waits for the image and
+      gives its path to the composer
+
+    A gift that ends without reaching the composer (Santa rejected it, or
+    the budget ran out) has its image discarded.
+    """
+
+    def __init__(
+        self,
+        renderer: Agent,
+        santa: Callable[[str], Awaitable[str]],
+        image_path: Callable[[str], Path],
+        max_workers: int = 4,
+    ):
+        """
+        Args:
+            renderer: Image prompt generator agent without delegations
+            santa: Runs santa_claus (see delegation_call)
+            image_path: Where generate_gift_image saves the image of a gift
+            max_workers: Images rendered at the same time
+        """
+        self.renderer = renderer
+        self.santa = santa
+        self.image_path = image_path
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-speculation")
+        self._renders: dict[str, _Render] = {}
+        self._lock = threading.Lock()
+
+    def _render(self, gift_id: str) -> Path:
+        self.renderer.run(RENDER_TASK.format(gift_id=gift_id))
+        path = self.image_path(gift_id)
+        if not path.exists():
+            raise RuntimeError("the image prompt generator did not generate an image")
+        return path
+
+    async def start(self, input_task: str, run_agent: Callable[[str], Awaitable[str]]) -> str:
+        """Intercept for logistics_manager: start rendering after a quality PASS."""
+        gift_id = current_gift_id.get(None)
+        state = active_gifts.get(gift_id)
+        if state is not None and _quality_passed(state):
+            with self._lock:
+                if gift_id not in self._renders:
+                    # The copied context keeps the gift ID (and so its budget) in the worker thread
+                    context = contextvars.copy_context()
+                    render = _Render(self._executor.submit(context.run, self._render, gift_id))
+                    render.future.add_done_callback(render.mark_finished)
+                    self._renders[gift_id] = render
+                    state.log_action(SPECULATION_AGENT, "image_started", "Rendering the gift image during logistics")
+        return await run_agent(input_task)
+
+    async def handover(self, input_task: str, run_agent: Callable[[str], Awaitable[str]]) -> str:
+        """Intercept for image_prompt_generator: skip it while the image renders."""
+        gift_id = current_gift_id.get(None)
+        with self._lock:
+            rendering = gift_id in self._renders
+        if not rendering:
+            return await run_agent(input_task)
+        handover = await self.santa(SANTA_TASK.format(gift_id=gift_id))
+        return f"✓ Gift image rendering in the background. {handover}"
+
+    async def join(self, input_task: str, run_agent: Callable[[str], Awaitable[str]]) -> str:
+        """Intercept for response_composer: wait for the image and pass its path."""
+        gift_id = current_gift_id.get(None)
+        with self._lock:
+            render = self._renders.pop(gift_id, None)
+        if render is None:
+            return await run_agent(input_task)
+
+        state = active_gifts.get(gift_id)
+        join_started = time.monotonic()
+        try:
+            path = await asyncio.wrap_future(render.future)
+        except Exception as e:
+            logger.warning(f"{gift_id}: speculative image failed: {e}")
+            if state:
+                state.add_issue(SPECULATION_AGENT, "low", f"Gift image not generated: {e}")
+            return await run_agent(input_task + IMAGE_MISSING.format(reason=e))
+
+        waited = time.monotonic() - join_started
+        rendered = (render.finished or time.monotonic()) - render.started
+        logger.info(f"{gift_id}: image rendered in {rendered:.1f}s, composer waited {waited:.1f}s")
+        if state:
+            state.log_action(
+                SPECULATION_AGENT, "image_joined",
+                f"Image {path} rendered in {rendered:.1f}s; composer waited {waited:.1f}s for it"
+            )
+        return await run_agent(input_task + IMAGE_READY.format(image_path=path))
+
+    def discard(self, gift_id: str) -> None:
+        """
+        Drop the image of a gift that ended without reaching the composer.
+
+        A render still queued is cancelled, so it never runs without the
+        gift's state and budget. One already running is left to finish
+        (DALL-E calls cannot be taken back) and its files are deleted when
+        it does.
+        """
+        with self._lock:
+            render = self._renders.pop(gift_id, None)
+        if render is None:
+            return
+        state = active_gifts.get(gift_id)
+        if state:
+            state.log_action(SPECULATION_AGENT, "image_discarded", "Gift not sent; speculative image discarded")
+        if not render.future.cancel():
+            render.future.add_done_callback(lambda _: self._delete(gift_id))
+
+    def _delete(self, gift_id: str) -> None:
+        path = self.image_path(gift_id)
+        # The image and its email copy and thumbnail (GIFT-....png, GIFT-....email.jpg, ...)
+        for file in path.parent.glob(f"{path.stem}.*"):
+            file.unlink(missing_ok=True)
+        logger.info(f"{gift_id}: speculative image discarded")
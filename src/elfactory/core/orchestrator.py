@@ -4,7 +4,16 @@ import uuid
 from datetime import datetime
 from elfactory.config import settings
 from elfactory.core.state import WorkshopState
-from elfactory.tools.state_tools import active_gifts, current_gift_id
+from elfactory.core.budget import BudgetExceededError
+from elfactory.core.delegation import delegate, delegation_call
+from elfactory.core.image_speculation import ImageSpeculation
+from elfactory.core.quality_prescreen import QualityPrescreen
+from elfactory.core.session import GiftSession
+from elfactory.services.letter_classifier import extract_child_details
+from elfactory.services.librarian_kb import get_librarian_kb
+from elfactory.tools.image_tools import gift_image_path
+from elfactory.tools.rework_tools import register_rework_artisans
+from datapizza.agents import Agent
 from datapizza.tracing import ContextTracing
 
 # Import all agent creators
@@ -15,6 +24,7 @@ from elfactory.agents.managers import (
     create_quality_manager,
     create_logistics_manager,
 )
+from elfactory.agents.managers.reception_manager import reception_task
 from elfactory.agents.artisans import (
     create_3d_printer_elf,
     create_woodworker_elf,
@@ -45,6 +55,13 @@ from elfactory.agents.support import (
 from elfactory.agents.santa import create_santa_claus
 
 
+# Statuses set after quality inspection has passed
+POST_QUALITY_STATUSES = {
+    "quality_passed", "logistics_complete", "ready_for_santa", "approved",
+    "email_queued", "email_sent", "completed",
+}
+
+
 class WorkshopOrchestrator:
     """Orchestrates the gift production workflow with autonomous agent delegation."""
 
@@ -90,6 +107,8 @@ class WorkshopOrchestrator:
         # Tier 3: Support
         self.online_shopper_elf = create_online_shopper_elf()
         self.image_prompt_generator = create_image_prompt_generator()
+        # Same agent without delegations, for images rendered during logistics
+        self.image_renderer = create_image_prompt_generator()
         self.response_composer = create_response_composer()
 
         # Tier 0: Santa
@@ -98,8 +117,15 @@ class WorkshopOrchestrator:
         # Configure delegation relationships
         self._configure_delegations()
 
+        # Shared by every gift; each factory builds its agent stateless (scripts/check_stateless_agents.py)
+        self.agents = [value for value in vars(self).values() if isinstance(value, Agent)]
+
     def _configure_delegations(self):
-        """Configure which agents can call which other agents."""
+        """Configure which agents can call which other agents.
+
+        delegate() is used instead of Agent.can_call() so that sub-agents see
+        the gift ID and budget of the workflow that called them.
+        """
 
         # All artisan elves list
         all_artisans = [
@@ -126,51 +152,91 @@ class WorkshopOrchestrator:
         ]
 
         # Reception Manager → Design Manager
-        self.reception_manager.can_call([self.design_manager])
+        delegate(self.reception_manager, [self.design_manager])
 
         # Design Manager → Production Manager or Online Shopper
-        self.design_manager.can_call([
+        delegate(self.design_manager, [
             self.production_manager,
             self.online_shopper_elf,
         ])
 
         # Production Manager → All Artisan Elves
-        self.production_manager.can_call(all_artisans)
+        delegate(self.production_manager, all_artisans)
 
-        # Artisan Elves can call Librarian for specifications
+        # Artisan Elves can call Librarian for specifications; repeated and
+        # spec-table questions are answered from the shared knowledge base
+        self.librarian_kb = get_librarian_kb()
         for artisan in all_artisans:
             if artisan != self.librarian_elf:
-                artisan.can_call([self.librarian_elf])
+                delegate(artisan, [self.librarian_elf], intercept=self.librarian_kb)
+
+        # After a quality PASS the gift image renders in the background while
+        # the Logistics Manager and Santa work; the composer waits for it
+        self.image_speculation = (
+            ImageSpeculation(
+                self.image_renderer,
+                delegation_call(self.santa_claus),
+                gift_image_path,
+                max_workers=settings.speculative_image_workers,
+            )
+            if settings.speculative_image else None
+        )
+        start_image = self.image_speculation.start if self.image_speculation else None
+
+        # Clear passes of the rule-based pre-screen skip the LLM inspection
+        # and go straight to the Logistics Manager
+        self.quality_prescreen = (
+            QualityPrescreen(delegation_call(self.logistics_manager, intercept=start_image))
+            if settings.quality_prescreen else None
+        )
 
         # Production Manager → Quality Manager (after production)
-        self.production_manager.can_call([self.quality_manager])
+        delegate(self.production_manager, [self.quality_manager], intercept=self.quality_prescreen)
 
         # Online Shopper → Quality Manager (after finding product)
-        self.online_shopper_elf.can_call([self.quality_manager])
+        delegate(self.online_shopper_elf, [self.quality_manager], intercept=self.quality_prescreen)
 
         # Quality Manager → Logistics Manager (after PASS)
-        # Quality Manager → Production Manager (for rework if needed)
-        self.quality_manager.can_call([self.logistics_manager, self.production_manager])
+        # Rework goes straight to the artisans who built the faulty components
+        # through the request_rework tool, not through a new production pass.
+        delegate(self.quality_manager, [self.logistics_manager], intercept=start_image)
+        register_rework_artisans([a for a in all_artisans if a != self.librarian_elf])
 
         # Logistics Manager → Image Prompt Generator
-        self.logistics_manager.can_call([self.image_prompt_generator])
+        # (straight to Santa Claus when the image is already rendering)
+        speculation = self.image_speculation
+        delegate(self.logistics_manager, [self.image_prompt_generator],
+                 intercept=speculation.handover if speculation else None)
 
         # Image Prompt Generator → Santa Claus
-        self.image_prompt_generator.can_call([self.santa_claus])
+        delegate(self.image_prompt_generator, [self.santa_claus])
 
-        # Santa Claus → Response Composer
-        self.santa_claus.can_call([self.response_composer])
+        # Santa Claus → Response Composer (joins the rendered image)
+        delegate(self.santa_claus, [self.response_composer], intercept=speculation.join if speculation else None)
 
-    def process_gift_request(self, email_content: str, sender_email: str = "") -> WorkshopState:
+    def process_gift_request(
+        self, email_content: str, sender_email: str = "", child_info: dict | None = None
+    ) -> WorkshopState:
         """
         Process a gift request from start to finish.
 
         The workflow is autonomous - only the first agent (Reception Manager) is called,
-        and agents delegate to each other using can_call() relationships.
+        and agents delegate to each other using the configured delegation relationships.
+        The gift runs in its own GiftSession with a GiftBudget; when the budget
+        runs out, remaining stages are cancelled and the reason is recorded as an issue.
+        Every state change is recorded in the gift's event log, which can be
+        replayed with scripts/replay_gift.py. Safe to call concurrently from
+        several threads. A gift image rendered speculatively is discarded when
+        the gift ends without reaching the Response Composer.
+
+        The child's name, age and city found by the local letter classifier
+        are saved before the Reception Manager runs, which then only checks them.
 
         Args:
             email_content: The email/text containing the gift request
             sender_email: Email address to send the response to (optional)
+            child_info: Child details already extracted (name, age, location);
+                extracted from email_content when not given
 
         Returns:
             WorkshopState: The final state after complete processing
@@ -183,23 +249,48 @@ class WorkshopOrchestrator:
             sender_email=sender_email
         )
 
-        active_gifts[gift_id] = state
-        current_gift_id.set(gift_id)
-
-        try:
-            with ContextTracing().trace(f"gift_workflow_{gift_id}") as trace:
-                result = self.reception_manager.run(email_content)
-                print(f"✓ Gift {gift_id} processing completed")
-                print(f"Final status: {state.status}")
-
-        except Exception as e:
-            print(f"✗ Error processing gift {gift_id}: {e}")
-            state.status = "failed"
-            state.add_issue(
-                reported_by="orchestrator",
-                severity="high",
-                description=f"Processing failed: {str(e)}"
-            )
+        if child_info is None:
+            name, age, location = extract_child_details(email_content)
+            child_info = {"name": name, "age": age, "location": location} if name else None
+
+        session = GiftSession(state)
+        budget = session.budget
+
+        # Failures are recorded inside the session so they reach the event log
+        with session:
+            try:
+                if child_info:
+                    state.set_child_info(child_info)
+                with ContextTracing().trace(f"gift_workflow_{gift_id}") as trace:
+                    result = self.reception_manager.run(reception_task(email_content, child_info))
+                    print(f"✓ Gift {gift_id} processing completed")
+                    print(f"Final status: {state.status}")
+
+            except BudgetExceededError as e:
+                # Gifts that already passed quality are delivered without the remaining
+                # presentation stages; anything earlier is cancelled.
+                degraded = state.quality_report is not None or state.status in POST_QUALITY_STATUSES
+                print(f"✗ Gift {gift_id} stopped: {e}")
+                state.add_issue(
+                    reported_by="orchestrator",
+                    severity="high",
+                    description=f"{'Degraded' if degraded else 'Cancelled'}: {budget.exhausted_reason} "
+                                f"({budget.usage_summary()})"
+                )
+                state.update_status("degraded" if degraded else "cancelled")
+
+            except Exception as e:
+                print(f"✗ Error processing gift {gift_id}: {e}")
+                state.update_status("failed")
+                state.add_issue(
+                    reported_by="orchestrator",
+                    severity="high",
+                    description=f"Processing failed: {str(e)}"
+                )
+
+            finally:
+                if self.image_speculation:
+                    self.image_speculation.discard(gift_id)
 
         return state
 
@@ -216,16 +307,19 @@ def get_orchestrator() -> WorkshopOrchestrator:
     return _orchestrator
 
 
-def process_gift_request(email_content: str, sender_email: str = "") -> WorkshopState:
+def process_gift_request(
+    email_content: str, sender_email: str = "", child_info: dict | None = None
+) -> WorkshopState:
     """
     Convenience function to process a gift request.
 
     Args:
         email_content: The email/text containing the gift request
         sender_email: Email address to send the response to (optional)
+        child_info: Child details already extracted (optional)
 
     Returns:
         WorkshopState: The final state after processing
     """
     orchestrator = get_orchestrator()
-    return orchestrator.process_gift_request(email_content, sender_email)
+    return orchestrator.process_gift_request(email_content, sender_email, child_info)
@@ -0,0 +1,170 @@
+"""Pre-fork worker pool sharing the initialized orchestrator via copy-on-write."""
+
+import gc
+import logging
+import multiprocessing
+import os
+import queue
+from typing import Any, Callable
+
+from elfactory.config import settings
+
+logger = logging.getLogger("elfactory.prefork")
+
+# Shared bucket directory used when workers would otherwise each get a full quota
+DEFAULT_RATE_LIMIT_DIR = "logs/ratelimit"
+TASK_ID_BYTES = 128
+
+
+def _worker_main(worker_id: int, handler: Callable[[dict], dict], tasks, results, current) -> None:
+    """Worker loop: process tasks until a None sentinel arrives."""
+    from elfactory.services.outbox import flush_outbox
+    from elfactory.services.report_writer import get_report_writer
+    from elfactory.services.ttl_cache import flush_ttl_caches
+
+    logger.info(f"Worker {worker_id} (pid {os.getpid()}) ready")
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        # Shared memory, so the parent can tell which task was lost if this process dies
+        current.value = str(task.get("id", "")).encode()[:TASK_ID_BYTES]
+        try:
+            result = handler(task)
+        except Exception as e:
+            result = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        results.put({"task_id": task.get("id"), "worker": worker_id, **result})
+        current.value = b""
+    # Forked workers exit without running atexit handlers
+    get_report_writer().flush()
+    flush_outbox()
+    flush_ttl_caches()
+
+
+class PreforkPool:
+    """
+    Build the agents once in the parent, then fork workers that inherit them.
+
+    The parent imports every agent module and builds the orchestrator before
+    forking, then freezes the GC so that collections do not touch (and copy)
+    the shared pages. Workers start serving immediately with the inherited
+    agents, and their memory is mostly shared with the parent.
+
+    A worker that dies (OOM kill, segfault) is noticed by results(): its
+    task is reported as failed and a new worker is forked in its place.
+
+    The parent must not run any agent before start(): datapizza's event-loop
+    thread would not survive the fork.
+    """
+
+    def __init__(self, workers: int, handler: Callable[[dict], dict]):
+        """
+        Args:
+            workers: Number of worker processes
+            handler: Function run in a worker for each task; returns a result dict
+        """
+        self.workers = workers
+        self.handler = handler
+        self._ctx = multiprocessing.get_context("fork")
+        self._tasks = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        self._processes: list[Any] = []
+        self._current: list[Any] = []  # Task id each worker is running, b"" when idle
+        self._stopped = False
+        self.in_flight: set[str] = set()
+
+    def start(self) -> None:
+        """Build the orchestrator and fork the workers."""
+        from elfactory.core.orchestrator import get_orchestrator
+        from elfactory.services.product_catalog import get_product_catalog
+
+        if not settings.rate_limit_dir:
+            # Workers must share one provider quota
+            settings.rate_limit_dir = DEFAULT_RATE_LIMIT_DIR
+
+        get_orchestrator()
+        get_product_catalog()  # Loaded once, its arrays shared with the workers
+        gc.collect()
+        gc.freeze()
+
+        for worker_id in range(self.workers):
+            self._current.append(self._ctx.Array("c", TASK_ID_BYTES))
+            self._processes.append(None)
+            self._fork(worker_id)
+        logger.info(f"Forked {self.workers} workers from pid {os.getpid()}")
+
+    def _fork(self, worker_id: int) -> None:
+        self._current[worker_id].value = b""
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(worker_id, self.handler, self._tasks, self._results, self._current[worker_id]),
+            daemon=True,
+        )
+        process.start()
+        self._processes[worker_id] = process
+
+    def _replace_dead(self) -> list[dict]:
+        """Fork a new worker for each dead one; returns failed results for the tasks they held."""
+        lost = []
+        for worker_id, process in enumerate(self._processes):
+            if process.is_alive():
+                continue
+            task_id = self._current[worker_id].value.decode()
+            logger.error(f"Worker {worker_id} (pid {process.pid}) died with exit code {process.exitcode}"
+                         + (f" while processing {task_id}" if task_id else "") + "; forking a new one")
+            if task_id:
+                lost.append({"task_id": task_id, "worker": worker_id, "ok": False,
+                             "error": f"worker died with exit code {process.exitcode}"})
+            self._fork(worker_id)
+        return lost
+
+    @property
+    def pids(self) -> list[int]:
+        return [process.pid for process in self._processes]
+
+    def submit(self, task: dict) -> None:
+        """
+        Queue a task for the next free worker.
+
+        Args:
+            task: Picklable dict with a unique "id"
+        """
+        self.in_flight.add(task["id"])
+        self._tasks.put(task)
+
+    def results(self, timeout: float = 0.0) -> list[dict]:
+        """
+        Collect finished results, and failures of tasks whose worker died.
+
+        Dead workers are replaced while the pool is running.
+
+        Args:
+            timeout: Seconds to wait for the first result
+
+        Returns:
+            Result dicts with task_id, worker and the handler's fields
+        """
+        collected = []
+        try:
+            collected.append(self._results.get(timeout=timeout) if timeout else self._results.get_nowait())
+            while True:
+                collected.append(self._results.get_nowait())
+        except queue.Empty:
+            pass
+        if not self._stopped:
+            reported = {result["task_id"] for result in collected}
+            collected += [result for result in self._replace_dead() if result["task_id"] not in reported]
+        for result in collected:
+            self.in_flight.discard(result["task_id"])
+        return collected
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Ask workers to finish their current task and exit."""
+        self._stopped = True
+        for _ in self._processes:
+            self._tasks.put(None)
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        gc.unfreeze()
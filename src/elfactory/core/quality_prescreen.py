@@ -0,0 +1,220 @@
+"""Rule-based quality pre-screen that passes clear cases without the LLM inspection."""
+
+import logging
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from elfactory.core.state import WorkshopState
+from elfactory.tools.state_tools import active_gifts, current_gift_id
+
+logger = logging.getLogger("elfactory.quality")
+
+PRESCREEN_AGENT = "quality_prescreen"
+
+LOGISTICS_TASK = """Quality inspection PASSED for gift {gift_id} (rule-based pre-screen: {components} components,
+no safety findings, no unresolved high-severity issues). Proceed with packaging and logistics."""
+
+ONLINE_DECISION = "acquisto_online"
+
+# "8+", "3-12", "3 - 12 anni", "36 mesi+", "18m+"
+_AGE_RATING = re.compile(
+    r"(\d+(?:[.,]\d+)?)\s*(?:-|–|to|a)?\s*(\d+(?:[.,]\d+)?)?\s*(m\b|months?|mesi)?", re.IGNORECASE
+)
+
+
+def age_range(rating: str) -> tuple[float, float] | None:
+    """
+    Ages in years covered by a product age rating, or None when it has no number.
+
+    Examples:
+        "8+" -> (8.0, inf); "3-12 anni" -> (3.0, 12.0); "18m+" -> (1.5, inf)
+    """
+    match = _AGE_RATING.search(rating)
+    if not match:
+        return None
+    low, high, months = match.groups()
+    scale = 1 / 12 if months else 1.0
+    low_years = float(low.replace(",", ".")) * scale
+    high_years = float(high.replace(",", ".")) * scale if high else float("inf")
+    return low_years, high_years
+
+
+def _bom_shortfalls(state: WorkshopState) -> list[str]:
+    # Components each BOM artisan should have built: the count of piece lines, one per other line
+    from elfactory.services.bom_planner import parse_quantity
+
+    expected: Counter = Counter()
+    for line in state.bill_of_materials:
+        artisan = line.get("artisan")
+        if not artisan or artisan == "unassigned":
+            continue
+        amount, unit = parse_quantity(str(line.get("quantity", "1")))
+        expected[artisan] += max(1, round(amount)) if unit == "pcs" else 1
+    built = Counter(c.created_by for c in state.components)
+    return [
+        f"{artisan} {built[artisan]}/{count}"
+        for artisan, count in sorted(expected.items()) if built[artisan] < count
+    ]
+
+
+def _purchase_reasons(state: WorkshopState) -> list[str]:
+    purchase = state.purchase
+    if not purchase:
+        return ["online purchase not recorded"]
+    name = purchase.get("product_name", "product")
+    reasons = []
+    if not purchase.get("safety_certifications"):
+        reasons.append(f"online purchase without safety rating: {name}")
+    rating = str(purchase.get("age_rating") or "")
+    ages = age_range(rating)
+    if ages is None:
+        reasons.append(f"online purchase without age rating: {name}")
+    elif state.child_info and state.child_info.age is not None and not ages[0] <= state.child_info.age <= ages[1]:
+        reasons.append(f"online purchase rated {rating} for a child of {state.child_info.age}: {name}")
+    return reasons
+
+
+@dataclass
+class PrescreenResult:
+    """Outcome of the pre-screen: a clear PASS, or the reasons to escalate."""
+    components_checked: int
+    reasons: list[str] = field(default_factory=list)
+    notes: list[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return not self.reasons
+
+
+def prescreen(state: WorkshopState) -> PrescreenResult:
+    """
+    Decide whether a gift is a clear PASS without reading it with an LLM.
+
+    Escalates on unresolved high-severity issues, components not completed
+    (e.g. still in rework), BOM artisans that built fewer components than
+    their BOM lines call for, and any safety rule finding, including the
+    ones the rules cannot decide. An online purchase escalates only when it
+    was not recorded, lacks a safety or age rating, or is rated for other
+    ages than the child's.
+
+    Args:
+        state: A snapshot of the gift
+
+    Returns:
+        The result; passed is True only when nothing needs judgement
+    """
+    from elfactory.services.safety_rules import check_gift
+
+    result = PrescreenResult(components_checked=len(state.components))
+
+    for issue in state.issues:
+        if issue.resolved:
+            continue
+        if issue.severity == "high":
+            result.reasons.append(f"unresolved high-severity issue: {issue.description}")
+        else:
+            result.notes.append(f"{issue.severity} issue from {issue.reported_by}: {issue.description}")
+
+    if state.manufacturing_decision == ONLINE_DECISION or state.purchase:
+        result.reasons += _purchase_reasons(state)
+    elif not state.components:
+        result.reasons.append("no components registered")
+    pending = [c.id for c in state.components if c.status != "completed"]
+    if pending:
+        result.reasons.append(f"components not completed: {', '.join(pending)}")
+
+    shortfalls = _bom_shortfalls(state)
+    if shortfalls:
+        result.reasons.append(f"fewer components than the BOM (built/expected): {', '.join(shortfalls)}")
+
+    findings: dict[str, list[str]] = {}
+    for finding in check_gift(state):
+        findings.setdefault(f"{finding.rule} ({finding.severity})", []).append(finding.component_id)
+    result.reasons += [f"safety rule {rule}: {', '.join(ids)}" for rule, ids in findings.items()]
+    return result
+
+
+class PrescreenMetrics:
+    """Process-wide counts of pre-screen decisions."""
+
+    def __init__(self):
+        self.screened = 0
+        self.passed = 0
+        self.reasons: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, result: PrescreenResult) -> None:
+        with self._lock:
+            self.screened += 1
+            self.passed += result.passed
+            # Count the kind of reason ("safety rule glass (high)"), not its details
+            self.reasons.update({reason.split(":", 1)[0] for reason in result.reasons})
+
+    @property
+    def escalation_rate(self) -> float:
+        return (self.screened - self.passed) / self.screened if self.screened else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Metrics as a JSON-serializable dict."""
+        with self._lock:
+            return {
+                "screened": self.screened,
+                "passed": self.passed,
+                "escalated": self.screened - self.passed,
+                "escalation_rate": round(self.escalation_rate, 4),
+                "escalation_reasons": dict(self.reasons.most_common()),
+            }
+
+
+class QualityPrescreen:
+    """
+    Delegation intercept for quality_manager.
+
+    On a clear PASS it records the QualityReport, sets "quality_passed" and
+    hands over to the next agent directly, as quality_manager would have
+    done; otherwise the LLM inspection runs, told why it was escalated.
+    """
+
+    def __init__(self, next_step: Callable[[str], Awaitable[str]]):
+        """
+        Args:
+            next_step: Runs the agent that follows a PASS (see delegation_call)
+        """
+        self.next_step = next_step
+        self.metrics = PrescreenMetrics()
+
+    async def __call__(self, input_task: str, run_agent: Callable[[str], Awaitable[str]]) -> str:
+        state = active_gifts.get(current_gift_id.get(None))
+        if state is None:
+            return await run_agent(input_task)
+
+        result = prescreen(state.snapshot())
+        self.metrics.record(result)
+        if not result.passed:
+            state.log_action(PRESCREEN_AGENT, "prescreen_escalated", "; ".join(result.reasons))
+            logger.info(
+                f"{state.gift_id}: quality pre-screen escalated ({'; '.join(result.reasons)}), "
+                f"escalation rate {self.metrics.escalation_rate:.0%}"
+            )
+            reasons = "\n".join(f"- {reason}" for reason in result.reasons)
+            return await run_agent(f"{input_task}\n\nRule-based pre-screen escalated this gift because:\n{reasons}")
+
+        state.set_quality_report({
+            "inspector": PRESCREEN_AGENT,
+            "overall_status": "PASS",
+            "components_checked": result.components_checked,
+            "issues_found": result.notes,
+            "safety_approved": True,
+            "notes": "Clear pass of the rule-based pre-screen; LLM inspection skipped",
+        })
+        state.log_action(PRESCREEN_AGENT, "prescreen_passed", f"{result.components_checked} components checked")
+        state.update_status("quality_passed")
+        logger.info(f"{state.gift_id}: quality pre-screen PASS, escalation rate {self.metrics.escalation_rate:.0%}")
+
+        handover = await self.next_step(
+            LOGISTICS_TASK.format(gift_id=state.gift_id, components=result.components_checked)
+        )
+        return f"✓ Quality PASS (rule-based pre-screen). {handover}"
@@ -0,0 +1,68 @@
+"""Per-gift sessions over the shared, stateless agent definitions."""
+
+from elfactory.config import settings
+from elfactory.core.budget import GiftBudget, active_budgets
+from elfactory.core.events import EventLog, EventPersistence, EventStore, MetricsProjection
+from elfactory.services.report_writer import ReportTrigger, get_report_writer
+from elfactory.core.state import WorkshopState
+from elfactory.tools.state_tools import active_gifts, current_gift_id
+
+
+class GiftSession:
+    """
+    Execution context for one gift.
+
+    Binds the gift's WorkshopState and GiftBudget to the current context for
+    the duration of the workflow, records every state mutation in the gift's
+    EventLog (persisted under settings.event_log_dir) and queues the reports when
+    the gift reaches a terminal status. Sessions are independent of each other,
+    so concurrent gifts (one per thread) can share the same agent definitions:
+    they are built stateless, so every run starts from an empty conversation.
+
+    Usage:
+        with GiftSession(state) as session:
+            reception_manager.run(state.gift_request)
+    """
+
+    def __init__(self, state: WorkshopState):
+        """
+        Args:
+            state: The gift's state
+        """
+        self.state = state
+        self.gift_id = state.gift_id
+        self.budget = GiftBudget.from_settings(state.gift_id)
+        self._token = None
+
+        self.events = EventLog(state.gift_id)
+        self.metrics = MetricsProjection()
+        self.events.subscribe(self.metrics)
+        self.persistence = None
+        if settings.event_log_dir:
+            self.persistence = EventPersistence(
+                EventStore(settings.event_log_dir), state.gift_id, settings.event_snapshot_interval
+            )
+            self.events.subscribe(self.persistence)
+        self.reports = ReportTrigger(state, get_report_writer())
+        self.events.subscribe(self.reports)
+
+    def __enter__(self) -> "GiftSession":
+        self.events.start(self.state)
+        active_gifts[self.gift_id] = self.state
+        active_budgets[self.gift_id] = self.budget
+        self._token = current_gift_id.set(self.gift_id)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        current_gift_id.reset(self._token)
+        active_budgets.pop(self.gift_id, None)
+        active_gifts.pop(self.gift_id, None)
+
+        self.state.attach_event_log(None)
+        if not self.reports.triggered:
+            # The workflow ended without a terminal status update
+            self.reports.writer.submit(self.state)
+        if self.persistence:
+            # Write errors are logged by the event writer
+            self.persistence.close()
+
@@ -1,8 +1,12 @@
 """WorkshopState - Shared state management for gift production."""
 
+import threading
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter
+
+from elfactory.core.dimensions import dimension_fields
 
 
 class ChildInfo(BaseModel):
@@ -13,7 +17,15 @@ class ChildInfo(BaseModel):
     behavior_score: str | None = None
 
 
-class Component(BaseModel):
+# Components, log entries and issues are the high-volume records of a gift.
+# They are slotted dataclasses rather than pydantic models: WorkshopState
+# builds them from inputs that the tools already typed or validated, so
+# construction skips validation, and they are never mutated in place (use
+# dataclasses.replace). Pydantic still validates them whenever a whole
+# WorkshopState is loaded from untrusted data (snapshots, events).
+
+@dataclass(slots=True, kw_only=True)
+class Component:
     """A single component created by an artisan elf."""
     id: str
     type: str
@@ -22,26 +34,50 @@ class Component(BaseModel):
     details: str
     created_by: str
     status: str = "completed"
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=datetime.now)
+    # Extents parsed from dimensions, in millimetres, largest first (None when unknown)
+    max_mm: float | None = None
+    mid_mm: float | None = None
+    min_mm: float | None = None
+
+    def __post_init__(self):
+        if self.max_mm is None and self.dimensions:
+            extents = dimension_fields(self.dimensions)
+            self.max_mm, self.mid_mm, self.min_mm = extents["max_mm"], extents["mid_mm"], extents["min_mm"]
 
 
-class ManufacturingLogEntry(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ManufacturingLogEntry:
     """Log entry for manufacturing actions."""
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=datetime.now)
     agent: str
     action: str
     details: str
 
 
-class Issue(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Issue:
     """Issue or problem encountered during production."""
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=datetime.now)
     reported_by: str
     severity: str
     description: str
     resolved: bool = False
 
 
+_RECORD_ADAPTERS = {cls: TypeAdapter(cls) for cls in (Component, ManufacturingLogEntry, Issue)}
+
+
+def record_to_json(record: Component | ManufacturingLogEntry | Issue) -> dict[str, Any]:
+    """Serialize a record to a JSON-compatible dict."""
+    return _RECORD_ADAPTERS[type(record)].dump_python(record, mode="json")
+
+
+def record_from_json(cls: type, data: dict[str, Any]) -> Any:
+    """Validate untrusted data (e.g. a persisted event) into a record."""
+    return _RECORD_ADAPTERS[cls].validate_python(data)
+
+
 class QualityReport(BaseModel):
     """Quality inspection report."""
     inspector: str = "quality_manager"
@@ -53,8 +89,92 @@ class QualityReport(BaseModel):
     notes: str = ""
 
 
+class StateLocks:
+    """
+    One lock per independently mutated part of a WorkshopState.
+
+    Artisans writing components, the log and issues never wait on each other,
+    and readers hold a lock only while copying one list. When several stripes
+    are needed they are taken in declaration order. Locks are recreated on
+    copy and unpickling, so states stay copyable.
+    """
+
+    def __init__(self):
+        self.components = threading.Lock()
+        self.log = threading.Lock()
+        self.issues = threading.Lock()
+        self.fields = threading.Lock()
+
+    def __deepcopy__(self, memo) -> "StateLocks":
+        return StateLocks()
+
+    def __getstate__(self) -> dict:
+        return {}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__()
+
+
+class LogRollup:
+    """
+    Per-agent summaries of the manufacturing log entries older than the tail.
+
+    Folding is incremental: each entry is summarized once, when it leaves the
+    tail shown to agents. The full log itself is never modified.
+    """
+
+    def __init__(self):
+        self.folded = 0
+        self.by_agent: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def fold(self, log: list[ManufacturingLogEntry], upto: int) -> tuple[int, dict[str, dict[str, Any]]]:
+        """
+        Summarize log[:upto], continuing from the entries already folded.
+
+        Args:
+            log: The manufacturing log (or a snapshot of it)
+            upto: Number of leading entries that should be summarized
+
+        Returns:
+            Number of entries summarized so far (may exceed upto when a newer
+            snapshot was folded first) and a copy of the per-agent summaries
+        """
+        with self._lock:
+            for entry in log[self.folded:upto]:
+                summary = self.by_agent.get(entry.agent)
+                if summary is None:
+                    summary = self.by_agent[entry.agent] = {
+                        "entries": 0, "actions": {}, "first": entry.timestamp.isoformat(),
+                    }
+                summary["entries"] += 1
+                summary["actions"][entry.action] = summary["actions"].get(entry.action, 0) + 1
+                summary["last"] = entry.timestamp.isoformat()
+                summary["last_details"] = entry.details
+                self.folded += 1
+            return self.folded, {
+                agent: {**summary, "actions": dict(summary["actions"])}
+                for agent, summary in self.by_agent.items()
+            }
+
+    def __deepcopy__(self, memo) -> "LogRollup":
+        return LogRollup()
+
+    def __getstate__(self) -> dict:
+        return {}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__()
+
+
 class WorkshopState(BaseModel):
-    """Shared state for gift production workflow."""
+    """Shared state for gift production workflow.
+
+    All mutation methods are safe to call from concurrent artisans and keep
+    insertion order. Scalar fields (status, reports, updated_at) are replaced
+    with single assignments and need no lock. Serialize through snapshot()
+    so that writers are not blocked for the duration of a dump.
+    """
 
     gift_id: str | None = None
     status: str = "initialized"
@@ -68,12 +188,15 @@ class WorkshopState(BaseModel):
 
     blueprint: str = ""
     bill_of_materials: list[dict[str, Any]] = Field(default_factory=list)
+    purchase: dict[str, Any] = Field(default_factory=dict)  # Product bought online instead (see record_purchase)
 
     components: list[Component] = Field(default_factory=list)
     manufacturing_log: list[ManufacturingLogEntry] = Field(default_factory=list)
     issues: list[Issue] = Field(default_factory=list)
 
     quality_report: QualityReport | None = None
+    rework_iterations: int = 0
+    rework_latency_seconds: float = 0.0
 
     packaging_design: str = ""
     gift_card_message: str = ""
@@ -84,15 +207,95 @@ class WorkshopState(BaseModel):
     santa_approval: dict[str, Any] = Field(default_factory=dict)
 
     final_response: str = ""
+    email_delivery: str = ""  # Outbox delivery of the response: queued, retrying, sent or failed
 
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
+    _locks: StateLocks = PrivateAttr(default_factory=StateLocks)
+    _events: Any = PrivateAttr(default=None)
+    _log_rollup: LogRollup = PrivateAttr(default_factory=LogRollup)
+
+    def attach_event_log(self, event_log: Any) -> None:
+        """
+        Record every following mutation in an event log.
+
+        Args:
+            event_log: An elfactory.core.events.EventLog (or None to detach)
+        """
+        self._events = event_log
+
+    @property
+    def _stripes(self) -> StateLocks:
+        # Read private attributes directly: pydantic's __getattr__ fallback
+        # costs more than the rest of a log_action() call.
+        return self.__pydantic_private__["_locks"]
+
+    def _record(self, event_type: str, data: Any) -> None:
+        # Called while holding the lock of the mutated stripe, so events are
+        # recorded in the order the mutations were applied. Records are passed
+        # as they are: the event writer serializes them, off the locks.
+        events = self.__pydantic_private__["_events"]
+        if events is not None:
+            events.record(event_type, data)
+
+    def _touch(self) -> None:
+        self.__dict__["updated_at"] = datetime.now()
+
     def add_component(self, component_data: dict[str, Any]) -> None:
-        """Add a component to the production."""
+        """Add a component to the production, replacing a reworked one with the same ID."""
         component = Component(**component_data)
-        self.components.append(component)
-        self.updated_at = datetime.now()
+        with self._stripes.components:
+            for i, existing in enumerate(self.components):
+                if existing.id == component.id:
+                    self.components[i] = component
+                    break
+            else:
+                self.components.append(component)
+            self._record("component_added", component)
+        self._touch()
+
+    def add_components(self, components_data: list[dict[str, Any]], log_entries: list[dict[str, str]]) -> None:
+        """Add several components and their log entries in one update.
+
+        All models are built before the state is touched, so invalid input
+        leaves the state unchanged. Both stripes are held for the whole
+        update, so snapshot() never sees the components without their log
+        entries.
+        """
+        components = [Component(**data) for data in components_data]
+        entries = [ManufacturingLogEntry(**entry) for entry in log_entries]
+        stripes = self._stripes
+        with stripes.components, stripes.log:
+            by_id = {existing.id: i for i, existing in enumerate(self.components)}
+            for component in components:
+                if component.id in by_id:
+                    self.components[by_id[component.id]] = component
+                else:
+                    by_id[component.id] = len(self.components)
+                    self.components.append(component)
+                self._record("component_added", component)
+            self.manufacturing_log.extend(entries)
+            for entry in entries:
+                self._record("action_logged", entry)
+        self._touch()
+
+    def set_components_status(self, component_ids: list[str], status: str) -> list[Component]:
+        """Set the status of the given components and return the updated ones."""
+        wanted = set(component_ids)
+        updated = []
+        with self._stripes.components:
+            for i, component in enumerate(self.components):
+                if component.id in wanted:
+                    self.components[i] = replace(component, status=status)
+                    updated.append(self.components[i])
+            if updated:
+                self._record("component_status_changed", {
+                    "component_ids": [component.id for component in updated],
+                    "status": status,
+                })
+        self._touch()
+        return updated
 
     def log_action(self, agent: str, action: str, details: str) -> None:
         """Log a manufacturing action."""
@@ -101,8 +304,10 @@ class WorkshopState(BaseModel):
             action=action,
             details=details
         )
-        self.manufacturing_log.append(entry)
-        self.updated_at = datetime.now()
+        with self._stripes.log:
+            self.manufacturing_log.append(entry)
+            self._record("action_logged", entry)
+        self._touch()
 
     def add_issue(self, reported_by: str, severity: str, description: str) -> None:
         """Report an issue during production."""
@@ -111,24 +316,114 @@ class WorkshopState(BaseModel):
             severity=severity,
             description=description
         )
-        self.issues.append(issue)
-        self.updated_at = datetime.now()
+        with self._stripes.issues:
+            self.issues.append(issue)
+            self._record("issue_reported", issue)
+        self._touch()
 
     def resolve_issue(self, issue_index: int) -> None:
         """Mark an issue as resolved."""
-        if 0 <= issue_index < len(self.issues):
-            self.issues[issue_index].resolved = True
-            self.updated_at = datetime.now()
+        with self._stripes.issues:
+            if not 0 <= issue_index < len(self.issues):
+                return
+            issue = self.issues[issue_index]
+            self.issues[issue_index] = replace(issue, resolved=True)
+            self._record("issue_resolved", {"index": issue_index})
+        self._touch()
 
     def update_status(self, new_status: str) -> None:
         """Update the overall production status."""
-        self.status = new_status
-        self.updated_at = datetime.now()
+        with self._stripes.fields:
+            previous = self.status
+            self.status = new_status
+            self._record("status_changed", {"status": new_status, "previous": previous})
+        self._touch()
+
+    def set_child_info(self, child_data: dict[str, Any]) -> None:
+        """Set the information about the child requesting the gift."""
+        child_info = ChildInfo(**child_data)
+        with self._stripes.fields:
+            self.child_info = child_info
+            self._record("child_info_set", child_info.model_dump(mode="json"))
+        self._touch()
 
     def set_quality_report(self, report_data: dict[str, Any]) -> None:
         """Set the quality inspection report."""
-        self.quality_report = QualityReport(**report_data)
-        self.updated_at = datetime.now()
+        report = QualityReport(**report_data)
+        with self._stripes.fields:
+            self.quality_report = report
+            self._record("quality_report_set", report.model_dump(mode="json"))
+        self._touch()
+
+    def set_field(self, name: str, value: Any) -> None:
+        """Set any other top-level field (e.g. final_response, image_url)."""
+        if name not in SCALAR_FIELDS:
+            raise ValueError(f"{name} cannot be set with set_field()")
+        with self._stripes.fields:
+            setattr(self, name, value)
+            self._record("field_set", {"field": name, "value": self.model_dump(mode="json", include={name})[name]})
+        self._touch()
+
+    def snapshot(self) -> "WorkshopState":
+        """
+        Point-in-time copy of the state for reading and serialization.
+
+        Each list is copied under its own lock, components and log together
+        so that bulk writes are seen whole; list items are never mutated in
+        place by this class, so the copy can be dumped without any lock while
+        artisans keep writing to the live state.
+        """
+        stripes = self._stripes
+        with stripes.components, stripes.log:
+            components = list(self.components)
+            manufacturing_log = list(self.manufacturing_log)
+        with stripes.issues:
+            issues = list(self.issues)
+        copy = self.model_copy(update={
+            "components": components,
+            "manufacturing_log": manufacturing_log,
+            "issues": issues,
+            "bill_of_materials": list(self.bill_of_materials),
+        })
+        copy._locks = StateLocks()
+        copy._events = None
+        copy._log_rollup = LogRollup()
+        return copy
+
+    def agent_view(self, log_tail: int, details_chars: int) -> dict[str, Any]:
+        """
+        Bounded view of the state for agent prompts.
+
+        Only the last log_tail manufacturing log entries are included verbatim
+        (details cut to details_chars); older entries are rolled into
+        per-agent summaries, so the view does not grow with the number of
+        actions. The full log stays in the state for reports.
+
+        Args:
+            log_tail: Number of recent log entries to include
+            details_chars: Maximum length of each entry's details
+
+        Returns:
+            JSON-compatible dict
+        """
+        snapshot = self.snapshot()
+        log = snapshot.manufacturing_log
+        folded, by_agent = self.__pydantic_private__["_log_rollup"].fold(log, max(0, len(log) - log_tail))
+
+        view = snapshot.model_dump(mode="json", exclude={"manufacturing_log"})
+        view["manufacturing_log_summary"] = {
+            "total_entries": len(log),
+            "summarized_entries": folded,
+            "by_agent": by_agent,
+        }
+        recent = []
+        for entry in log[folded:]:
+            data = record_to_json(entry)
+            if len(entry.details) > details_chars:
+                data["details"] = entry.details[:details_chars] + "…"
+            recent.append(data)
+        view["manufacturing_log"] = recent
+        return view
 
     def to_summary(self) -> str:
         """Generate a human-readable summary of the current state."""
@@ -140,3 +435,15 @@ class WorkshopState(BaseModel):
         summary += f"Manufacturing Decision: {self.manufacturing_decision}\n"
         summary += f"Issues: {len([i for i in self.issues if not i.resolved])} unresolved\n"
         return summary
+
+
+# Statuses after which no agent works on the gift any more
+TERMINAL_STATUSES = {"completed", "failed", "cancelled", "degraded"}
+
+# Fields changed through set_field(); the others have a dedicated method and event
+SCALAR_FIELDS = {
+    "feasibility", "manufacturing_decision", "blueprint", "bill_of_materials", "purchase",
+    "rework_iterations", "rework_latency_seconds", "packaging_design",
+    "gift_card_message", "image_prompt", "image_url", "santa_approval",
+    "final_response", "email_delivery",
+}
@@ -0,0 +1,350 @@
+"""Season-wide analytics store (SQLite) of finished gifts."""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from elfactory.core.state import WorkshopState
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS gifts (
+    gift_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    child_name TEXT,
+    child_age INTEGER,
+    location TEXT,
+    manufacturing_decision TEXT,
+    quality_status TEXT,
+    components INTEGER NOT NULL,
+    log_entries INTEGER NOT NULL,
+    issues INTEGER NOT NULL,
+    rework_iterations INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    finished_at TEXT NOT NULL,
+    latency_seconds REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS gifts_status ON gifts (status);
+CREATE INDEX IF NOT EXISTS gifts_created_at ON gifts (created_at);
+CREATE INDEX IF NOT EXISTS gifts_latency ON gifts (latency_seconds);
+
+CREATE TABLE IF NOT EXISTS components (
+    gift_id TEXT NOT NULL,
+    component_id TEXT NOT NULL,
+    type TEXT,
+    material TEXT,
+    created_by TEXT NOT NULL,
+    status TEXT,
+    created_at TEXT NOT NULL,
+    max_mm REAL,
+    mid_mm REAL,
+    min_mm REAL,
+    PRIMARY KEY (gift_id, component_id)
+);
+CREATE INDEX IF NOT EXISTS components_created_by ON components (created_by, created_at);
+
+CREATE TABLE IF NOT EXISTS actions (
+    gift_id TEXT NOT NULL,
+    agent TEXT NOT NULL,
+    action TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS actions_gift_id ON actions (gift_id);
+CREATE INDEX IF NOT EXISTS actions_agent ON actions (agent, created_at);
+
+CREATE TABLE IF NOT EXISTS issues (
+    gift_id TEXT NOT NULL,
+    reported_by TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    description TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_gift_id ON issues (gift_id);
+CREATE INDEX IF NOT EXISTS issues_severity ON issues (severity);
+
+CREATE TABLE IF NOT EXISTS bom_lines (
+    gift_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    artisan TEXT NOT NULL,
+    name TEXT,
+    material_type TEXT NOT NULL,
+    quantity TEXT NOT NULL,
+    specifications TEXT
+);
+CREATE INDEX IF NOT EXISTS bom_lines_gift_id ON bom_lines (gift_id);
+CREATE INDEX IF NOT EXISTS bom_lines_day ON bom_lines (day);
+
+-- Rollups maintained on export, so season aggregates never scan detail rows
+CREATE TABLE IF NOT EXISTS agent_stats (
+    agent TEXT PRIMARY KEY,
+    components INTEGER NOT NULL DEFAULT 0,
+    actions INTEGER NOT NULL DEFAULT 0,
+    gifts INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS daily_stats (
+    day TEXT NOT NULL,
+    status TEXT NOT NULL,
+    gifts INTEGER NOT NULL DEFAULT 0,
+    components INTEGER NOT NULL DEFAULT 0,
+    issues INTEGER NOT NULL DEFAULT 0,
+    rework_iterations INTEGER NOT NULL DEFAULT 0,
+    latency_seconds REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, status)
+);
+"""
+
+UPSERT_DAILY = (
+    "INSERT INTO daily_stats VALUES (?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (day, status) DO UPDATE SET gifts = gifts + excluded.gifts, "
+    "components = components + excluded.components, issues = issues + excluded.issues, "
+    "rework_iterations = rework_iterations + excluded.rework_iterations, "
+    "latency_seconds = latency_seconds + excluded.latency_seconds"
+)
+
+
+def _agent_counts(state: WorkshopState) -> dict[str, list[int]]:
+    """Per agent: [components, actions, gifts]."""
+    counts: dict[str, list[int]] = {}
+    for component in state.components:
+        counts.setdefault(component.created_by, [0, 0, 0])[0] += 1
+    for entry in state.manufacturing_log:
+        counts.setdefault(entry.agent, [0, 0, 0])[1] += 1
+    for agent_counts in counts.values():
+        agent_counts[2] = 1
+    return counts
+
+
+class AnalyticsStore:
+    """
+    SQLite database with one row per finished gift plus its components,
+    actions and issues.
+
+    Exports are idempotent (re-exporting a gift replaces it) and safe from
+    several processes: the database runs in WAL mode and each export is one
+    transaction.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path: Database file, created if missing
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self.connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def connection(self) -> sqlite3.Connection:
+        """Connection of the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def export(self, state: WorkshopState) -> None:
+        """
+        Store a finished gift, replacing any previous export of it.
+
+        Args:
+            state: A snapshot of the gift's final state
+        """
+        conn = self.connection()
+        gift_id = state.gift_id
+        counts = _agent_counts(state)
+        latency = (state.updated_at - state.created_at).total_seconds()
+        with conn:
+            self._remove(conn, gift_id)
+            conn.execute(
+                "INSERT INTO gifts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    gift_id,
+                    state.status,
+                    state.child_info.name if state.child_info else None,
+                    state.child_info.age if state.child_info else None,
+                    state.child_info.location if state.child_info else None,
+                    state.manufacturing_decision,
+                    state.quality_report.overall_status if state.quality_report else None,
+                    len(state.components),
+                    len(state.manufacturing_log),
+                    len(state.issues),
+                    state.rework_iterations,
+                    state.created_at.isoformat(),
+                    state.updated_at.isoformat(),
+                    latency,
+                ),
+            )
+            conn.execute(UPSERT_DAILY, (
+                state.created_at.date().isoformat(), state.status, 1, len(state.components),
+                len(state.issues), state.rework_iterations, latency,
+            ))
+            conn.executemany(
+                "INSERT OR REPLACE INTO components VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        gift_id, c.id, c.type, c.material, c.created_by, c.status, c.timestamp.isoformat(),
+                        c.max_mm, c.mid_mm, c.min_mm,
+                    )
+                    for c in state.components
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO actions VALUES (?, ?, ?, ?)",
+                [(gift_id, e.agent, e.action, e.timestamp.isoformat()) for e in state.manufacturing_log],
+            )
+            conn.executemany(
+                "INSERT INTO issues VALUES (?, ?, ?, ?, ?)",
+                [
+                    (gift_id, i.reported_by, i.severity, i.description, i.timestamp.isoformat())
+                    for i in state.issues
+                ],
+            )
+            day = state.created_at.date().isoformat()
+            conn.executemany(
+                "INSERT INTO bom_lines VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        gift_id, day, str(line.get("artisan") or "unassigned"), str(line.get("name", "")),
+                        str(line.get("material_type") or line.get("material") or line.get("name", "")),
+                        str(line.get("quantity", "1")), str(line.get("specifications", "")),
+                    )
+                    for line in state.bill_of_materials
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO agent_stats (agent, components, actions, gifts) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (agent) DO UPDATE SET components = components + excluded.components, "
+                "actions = actions + excluded.actions, gifts = gifts + excluded.gifts",
+                [(agent, *agent_counts) for agent, agent_counts in counts.items()],
+            )
+
+    def _remove(self, conn: sqlite3.Connection, gift_id: str) -> None:
+        """Delete a previous export of a gift and undo its rollup counts."""
+        row = conn.execute(
+            "SELECT substr(created_at, 1, 10), status, components, issues, rework_iterations, latency_seconds "
+            "FROM gifts WHERE gift_id = ?",
+            (gift_id,),
+        ).fetchone()
+        if row is None:
+            return
+        day, status, components, issues, rework_iterations, latency = row
+        conn.execute(UPSERT_DAILY, (day, status, -1, -components, -issues, -rework_iterations, -latency))
+        previous: dict[str, list[int]] = {}
+        for agent, n in conn.execute(
+            "SELECT created_by, COUNT(*) FROM components WHERE gift_id = ? GROUP BY created_by", (gift_id,)
+        ):
+            previous.setdefault(agent, [0, 0, 1])[0] = n
+        for agent, n in conn.execute(
+            "SELECT agent, COUNT(*) FROM actions WHERE gift_id = ? GROUP BY agent", (gift_id,)
+        ):
+            previous.setdefault(agent, [0, 0, 1])[1] = n
+        conn.executemany(
+            "UPDATE agent_stats SET components = components - ?, actions = actions - ?, gifts = gifts - ? "
+            "WHERE agent = ?",
+            [(*agent_counts, agent) for agent, agent_counts in previous.items()],
+        )
+        for table in ("gifts", "components", "actions", "issues", "bom_lines"):
+            conn.execute(f"DELETE FROM {table} WHERE gift_id = ?", (gift_id,))
+
+    def season_summary(self) -> dict[str, Any]:
+        """Gift count, status breakdown, components per gift, latency percentiles and pre-screen escalations."""
+        conn = self.connection()
+        total, components, issues, rework = conn.execute(
+            "SELECT SUM(gifts), SUM(components), SUM(issues), SUM(rework_iterations) FROM daily_stats"
+        ).fetchone()
+        total = total or 0
+        prescreen = dict(conn.execute(
+            "SELECT action, COUNT(DISTINCT gift_id) FROM actions WHERE agent = 'quality_prescreen' GROUP BY action"
+        ))
+        screened = sum(prescreen.values())
+        return {
+            "gifts": total,
+            "by_status": dict(conn.execute(
+                "SELECT status, SUM(gifts) FROM daily_stats GROUP BY status HAVING SUM(gifts) > 0"
+            )),
+            "avg_components_per_gift": round(components / total, 2) if total else 0,
+            "avg_issues_per_gift": round(issues / total, 2) if total else 0,
+            "avg_rework_iterations": round(rework / total, 2) if total else 0,
+            "latency_seconds": {
+                "p50": self.latency_percentile(0.50),
+                "p95": self.latency_percentile(0.95),
+                "p99": self.latency_percentile(0.99),
+            },
+            "quality_prescreen": {
+                "passed": prescreen.get("prescreen_passed", 0),
+                "escalated": prescreen.get("prescreen_escalated", 0),
+                "escalation_rate": round(prescreen.get("prescreen_escalated", 0) / screened, 4) if screened else None,
+            },
+        }
+
+    def latency_percentile(self, q: float) -> float | None:
+        """Gift latency percentile, read from the latency index."""
+        conn = self.connection()
+        (total,) = conn.execute("SELECT COALESCE(SUM(gifts), 0) FROM daily_stats").fetchone()
+        if not total:
+            return None
+        row = conn.execute(
+            "SELECT latency_seconds FROM gifts ORDER BY latency_seconds LIMIT 1 OFFSET ?",
+            (min(total - 1, int(q * total)),),
+        ).fetchone()
+        return round(row[0], 3)
+
+    def busiest_agents(self, limit: int = 10) -> list[dict[str, Any]]:
+        """Agents ranked by components built, then actions logged."""
+        rows = self.connection().execute(
+            "SELECT agent, components, actions, gifts FROM agent_stats "
+            "WHERE gifts > 0 ORDER BY components DESC, actions DESC LIMIT ?",
+            (limit,),
+        )
+        return [
+            {"agent": agent, "components": components, "actions": actions, "gifts": gifts}
+            for agent, components, actions, gifts in rows
+        ]
+
+    def gifts_per_day(self, days: int = 30) -> list[dict[str, Any]]:
+        """Finished gifts per creation day, most recent first."""
+        rows = self.connection().execute(
+            "SELECT day, SUM(gifts), SUM(latency_seconds) / SUM(gifts) FROM daily_stats "
+            "GROUP BY day HAVING SUM(gifts) > 0 ORDER BY day DESC LIMIT ?",
+            (days,),
+        )
+        return [
+            {"day": day, "gifts": n, "avg_latency_seconds": round(latency, 3)}
+            for day, n, latency in rows
+        ]
+
+    def bom_columns(self) -> dict[str, list]:
+        """All BOM lines of the season as columns (day, artisan, material_type, quantity)."""
+        rows = self.connection().execute("SELECT day, artisan, material_type, quantity FROM bom_lines").fetchall()
+        columns = list(zip(*rows)) if rows else [(), (), (), ()]
+        return dict(zip(("day", "artisan", "material_type", "quantity"), map(list, columns)))
+
+    def component_columns(self) -> dict[str, list]:
+        """All components of the season as columns, with the child's age of their gift."""
+        names = ("gift_id", "component_id", "type", "material", "max_mm", "mid_mm", "min_mm", "child_age")
+        rows = self.connection().execute(
+            "SELECT c.gift_id, c.component_id, c.type, c.material, c.max_mm, c.mid_mm, c.min_mm, g.child_age "
+            "FROM components c JOIN gifts g USING (gift_id)"
+        ).fetchall()
+        columns = list(zip(*rows)) if rows else [()] * len(names)
+        return dict(zip(names, map(list, columns)))
+
+    def query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run an arbitrary read-only query."""
+        return self.connection().execute(sql, params).fetchall()
+
+
+_stores: dict[str, AnalyticsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_analytics_store(path: str | Path) -> AnalyticsStore:
+    """Get the store of a database file, opening it on first use."""
+    key = str(path)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = AnalyticsStore(path)
+        return _stores[key]
@@ -0,0 +1,255 @@
+"""Season bill-of-materials demand planner on NumPy columns."""
+
+import re
+from typing import Any, Iterable
+
+import numpy as np
+
+from elfactory.core.state import WorkshopState
+
+# unit alias -> (canonical unit, factor to canonical)
+UNITS = {
+    **dict.fromkeys(["mg"], ("g", 0.001)),
+    **dict.fromkeys(["g", "gr", "gram", "grams", "grammi", "grammo"], ("g", 1.0)),
+    **dict.fromkeys(["kg", "kilo", "kilos", "kilogram", "kilograms", "chili", "chilo"], ("g", 1000.0)),
+    **dict.fromkeys(["mm", "millimeter", "millimeters", "millimetri"], ("mm", 1.0)),
+    **dict.fromkeys(["cm", "centimeter", "centimeters", "centimetri"], ("mm", 10.0)),
+    **dict.fromkeys(["m", "meter", "meters", "metre", "metres", "metri", "metro"], ("mm", 1000.0)),
+    **dict.fromkeys(["in", "inch", "inches"], ("mm", 25.4)),
+    **dict.fromkeys(["ml", "milliliter", "milliliters", "millilitri"], ("ml", 1.0)),
+    **dict.fromkeys(["cl"], ("ml", 10.0)),
+    **dict.fromkeys(["l", "lt", "liter", "liters", "litre", "litres", "litri", "litro"], ("ml", 1000.0)),
+    **dict.fromkeys(["cm2", "cm²", "sqcm"], ("mm2", 100.0)),
+    **dict.fromkeys(["m2", "m²", "mq", "sqm"], ("mm2", 1_000_000.0)),
+    **dict.fromkeys(
+        ["", "x", "pc", "pcs", "piece", "pieces", "pz", "pezzi", "pezzo", "unit", "units", "unità", "n"],
+        ("pcs", 1.0),
+    ),
+}
+
+# word -> canonical material family
+MATERIALS = {
+    **dict.fromkeys(["pla", "abs", "petg", "plastic", "plastica", "resin", "resina", "nylon"], "plastic"),
+    **dict.fromkeys(["wood", "wooden", "legno", "oak", "pine", "beech", "plywood", "birch", "mdf"], "wood"),
+    **dict.fromkeys(["steel", "acciaio", "iron", "ferro"], "steel"),
+    **dict.fromkeys(["aluminum", "aluminium", "alluminio"], "aluminum"),
+    **dict.fromkeys(["copper", "rame", "brass", "ottone", "bronze"], "copper_alloy"),
+    **dict.fromkeys(["fabric", "tessuto", "cotton", "cotone", "felt", "feltro", "wool", "lana", "polyester"], "fabric"),
+    **dict.fromkeys(["leather", "pelle", "cuoio"], "leather"),
+    **dict.fromkeys(["glass", "vetro"], "glass"),
+    **dict.fromkeys(["ceramic", "ceramica", "clay", "argilla", "porcelain", "porcellana"], "ceramic"),
+    **dict.fromkeys(["paint", "vernice", "acrylic", "acrilico", "enamel", "smalto", "varnish", "lacquer"], "paint"),
+    **dict.fromkeys(["battery", "batteries", "batteria", "batterie", "lipo", "cell"], "battery"),
+    **dict.fromkeys(["led", "leds", "motor", "motore", "pcb", "wire", "cavo", "chip", "sensor", "speaker"], "electronics"),
+    **dict.fromkeys(["screw", "screws", "vite", "viti", "bolt", "bolts", "nut", "nuts", "bullone", "glue", "colla"], "hardware"),
+    **dict.fromkeys(["paper", "carta", "cardboard", "cartone", "vinyl", "vinile", "sticker", "decal"], "paper_vinyl"),
+}
+
+# One amount: a simple or mixed fraction, digits grouped by spaces, or digits with , . separators
+_AMOUNT = r"(?:\d+\s+)?\d+/\d+|\d{1,3}(?:[ \u00a0\u202f]\d{3})+(?!\d)|\d+(?:[.,]\d+)*"
+# Not glued to a word ("A4", "M3"); a range keeps both ends; the unit starts with a letter
+_QUANTITY = re.compile(
+    rf"(?<![a-zà-ü\d.,/])(?:x\s*)?({_AMOUNT})(?:\s*(?:-|–|to|a)\s*({_AMOUNT}))?(?![\d/]|[.,]\d)"
+    r"\s*([a-zà-ü][a-zà-ü²]*\d?)?",
+    re.IGNORECASE,
+)
+# Dimensions ("10 x 20 cm", "20x10x8cm") are sizes, not amounts
+_DIMENSIONS = re.compile(
+    r"(?<![a-z\d.,])\d+(?:[.,]\d+)?(?:\s*(?:mm|cm|m|in)?\s*[x×*]\s*\d+(?:[.,]\d+)?)+",
+    re.IGNORECASE,
+)
+_WORD = re.compile(r"[a-zà-ü]+")
+
+
+def _amount(text: str) -> float:
+    """Number from one _AMOUNT match ("1/2", "1 1/2", "1 000", "1.000", "1,5", "1,000.5")."""
+    if "/" in text:
+        *whole, fraction = text.split()
+        numerator, denominator = fraction.split("/")
+        return float(whole[0] if whole else 0) + int(numerator) / (int(denominator) or 1)
+    text = re.sub(r"\s", "", text)
+    if "," in text and "." in text:
+        decimal = "," if text.rfind(",") > text.rfind(".") else "."
+        return float(text.replace("." if decimal == "," else ",", "").replace(decimal, "."))
+    separator = "," if "," in text else "."
+    head, *groups = text.split(separator)
+    # Groups of three digits after a non-zero head are thousands ("1.000 g"), anything else is decimal
+    if len(groups) > 1 or (groups and len(groups[0]) == 3 and head != "0"):
+        return float(head + "".join(groups))
+    return float(text.replace(",", "."))
+
+
+def parse_quantity(text: str) -> tuple[float, str]:
+    """
+    Parse a free-form quantity into (amount, canonical unit).
+
+    Ranges use the upper bound; unknown units are kept as they are; a missing
+    amount counts as one piece. Dimensions and codes like "A4" are not amounts.
+
+    Examples:
+        "250 g" -> (250.0, "g"); "1,5 kg" -> (1500.0, "g"); "2-3 m" -> (3000.0, "mm");
+        "x4" -> (4.0, "pcs"); "2 sheets" -> (2.0, "sheets"); "1 000 g" -> (1000.0, "g");
+        "1/2 kg" -> (500.0, "g"); "10 x 20 cm" -> (1.0, "pcs"); "A4 sheet" -> (1.0, "pcs")
+    """
+    match = _QUANTITY.search(_DIMENSIONS.sub(" ", text.strip().lower()))
+    if not match:
+        return 1.0, "pcs"
+    low, high, unit = match.groups()
+    canonical, factor = UNITS.get(unit or "", (unit, 1.0))
+    return _amount(high or low) * factor, canonical
+
+
+def normalize_material(text: str) -> str:
+    """Map a free-form material to its family (e.g. "red PLA" -> "plastic")."""
+    words = _WORD.findall(text.lower())
+    for word in words:
+        if word in MATERIALS:
+            return MATERIALS[word]
+    return " ".join(words) or "unknown"
+
+
+def _encode(values: list[str], normalize=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Dictionary-encode strings, normalizing each distinct value once.
+
+    Returns:
+        Integer codes per value and the sorted array of (normalized) labels
+    """
+    index: dict[str, int] = {}
+    codes = np.fromiter((index.setdefault(value, len(index)) for value in values), dtype=np.int32, count=len(values))
+    distinct = list(index)
+    if normalize is not None:
+        distinct = [normalize(value) for value in distinct]
+    labels, remap = np.unique(np.array(distinct, dtype=str), return_inverse=True)
+    return remap.astype(np.int32)[codes], labels
+
+
+class BomTable:
+    """
+    Bill-of-materials lines of many gifts as parallel NumPy columns.
+
+    Strings are dictionary-encoded (day, artisan, material family, unit) and
+    quantities are converted to canonical units, so every aggregation is a
+    single np.unique/np.bincount pass over integer arrays.
+    """
+
+    def __init__(self, days: list[str], artisans: list[str], materials: list[str], quantities: list[str]):
+        """
+        Args:
+            days: ISO date of each line (gift creation day)
+            artisans: Artisan elf of each line
+            materials: Free-form material of each line
+            quantities: Free-form quantity of each line
+        """
+        self.day, self.day_labels = _encode(days)
+        self.artisan, self.artisan_labels = _encode(artisans)
+        self.material, self.material_labels = _encode(materials, normalize_material)
+
+        codes, raw = _encode(quantities)
+        parsed = [parse_quantity(value) for value in raw]
+        self.unit_labels, unit_codes = np.unique(np.array([unit for _, unit in parsed], dtype=str), return_inverse=True)
+        self.quantity = np.array([amount for amount, _ in parsed], dtype=np.float64)[codes]
+        self.unit = unit_codes.astype(np.int32)[codes]
+
+    def __len__(self) -> int:
+        return len(self.quantity)
+
+    @classmethod
+    def from_states(cls, states: Iterable[WorkshopState]) -> "BomTable":
+        """Build the table from the bill_of_materials of several gifts."""
+        days, artisans, materials, quantities = [], [], [], []
+        for state in states:
+            day = state.created_at.date().isoformat()
+            for line in state.bill_of_materials:
+                days.append(day)
+                artisans.append(str(line.get("artisan") or "unassigned"))
+                materials.append(str(line.get("material_type") or line.get("material") or line.get("name", "")))
+                quantities.append(str(line.get("quantity", "1")))
+        return cls(days, artisans, materials, quantities)
+
+    @classmethod
+    def from_analytics_store(cls, store) -> "BomTable":
+        """Build the table from every gift exported to an AnalyticsStore."""
+        columns = store.bom_columns()
+        return cls(columns["day"], columns["artisan"], columns["material_type"], columns["quantity"])
+
+    def _column(self, name: str) -> tuple[np.ndarray, np.ndarray]:
+        return getattr(self, name), getattr(self, f"{name}_labels")
+
+    def demand(self, by: tuple[str, ...] = ("material", "unit")) -> list[dict[str, Any]]:
+        """
+        Total quantity and line count grouped by columns.
+
+        Args:
+            by: Any of "day", "artisan", "material", "unit" (include "unit"
+                whenever quantities are summed, units are not mixed otherwise)
+
+        Returns:
+            One dict per group, largest quantity first
+        """
+        if not len(self):
+            return []
+        columns = [self._column(name) for name in by]
+        key = np.ravel_multi_index([codes for codes, _ in columns], [len(labels) for _, labels in columns])
+        groups, inverse = np.unique(key, return_inverse=True)
+        totals = np.bincount(inverse, weights=self.quantity)
+        lines = np.bincount(inverse)
+        group_codes = np.unravel_index(groups, [len(labels) for _, labels in columns])
+
+        order = np.argsort(-totals, kind="stable")
+        return [
+            {
+                **{name: str(labels[codes[i]]) for name, (_, labels), codes in zip(by, columns, group_codes)},
+                "quantity": round(float(totals[i]), 3),
+                "lines": int(lines[i]),
+            }
+            for i in order
+        ]
+
+    def daily_matrix(self, by: str = "artisan", unit: str | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Demand as a (labels x days) matrix.
+
+        Args:
+            by: "artisan" or "material"
+            unit: Sum quantities in this canonical unit; count lines when None
+
+        Returns:
+            Row labels, day labels and the matrix
+        """
+        codes, labels = self._column(by)
+        mask = np.ones(len(self), dtype=bool)
+        weights = None
+        if unit is not None:
+            mask = self.unit_labels[self.unit] == unit
+            weights = self.quantity[mask]
+        flat = codes[mask].astype(np.int64) * len(self.day_labels) + self.day[mask]
+        matrix = np.bincount(flat, weights=weights, minlength=len(labels) * len(self.day_labels))
+        return labels, self.day_labels, matrix.reshape(len(labels), len(self.day_labels))
+
+    def capacity_plan(self, daily_capacity: dict[str, float], default_capacity: float = float("inf")) -> dict[str, Any]:
+        """
+        Compare the BOM lines each artisan must handle per day with its capacity.
+
+        Args:
+            daily_capacity: Lines per day each artisan can handle
+            default_capacity: Capacity of artisans missing from daily_capacity
+
+        Returns:
+            Peak utilization per artisan and the overloaded (artisan, day) cells
+        """
+        artisans, days, load = self.daily_matrix("artisan")
+        capacity = np.array([daily_capacity.get(str(a), default_capacity) for a in artisans], dtype=np.float64)
+        utilization = load / capacity[:, None]
+        rows, cols = np.nonzero(utilization > 1.0)
+        return {
+            "peak_utilization": {
+                str(artisan): round(float(peak), 3)
+                for artisan, peak in zip(artisans, utilization.max(axis=1, initial=0.0))
+            },
+            "overloaded": [
+                {"artisan": str(artisans[r]), "day": str(days[c]), "lines": int(load[r, c]),
+                 "capacity": float(capacity[r])}
+                for r, c in zip(rows, cols)
+            ],
+        }
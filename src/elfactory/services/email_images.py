@@ -0,0 +1,138 @@
+"""Email-sized variants and thumbnails of generated gift images (Pillow optional)."""
+
+import io
+import logging
+from pathlib import Path
+
+logger = logging.getLogger("elfactory.images")
+
+FORMATS = {"jpeg": ("JPEG", ".jpg", "image/jpeg"), "webp": ("WEBP", ".webp", "image/webp")}
+QUALITIES = (85, 78, 70, 62, 55, 48, 40)
+MIN_SIDE = 256  # Below this the image is not worth shrinking further to meet the budget
+DOWNSCALE = 0.8
+MIME_TYPES = {".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".webp": "image/webp"}
+
+
+def _pillow():
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+
+def _fresh(variant: Path, source: Path) -> bool:
+    return variant.exists() and variant.stat().st_mtime >= source.stat().st_mtime
+
+
+def _encode(image, fmt: str, max_bytes: int) -> tuple[bytes, int]:
+    """Highest quality encoding of image under max_bytes, else the smallest one tried."""
+    data, quality = b"", 0
+    for quality in QUALITIES:
+        buffer = io.BytesIO()
+        options = {"optimize": True, "progressive": True} if fmt == "JPEG" else {"method": 4}
+        image.save(buffer, format=fmt, quality=quality, **options)
+        data = buffer.getvalue()
+        if len(data) <= max_bytes:
+            break
+    return data, quality
+
+
+def email_variant(path: str | Path, max_side: int = 768, max_bytes: int = 150_000, fmt: str = "jpeg") -> Path:
+    """
+    Email-sized copy of an image, cached next to it.
+
+    The image is scaled down to max_side, then encoded at the highest
+    quality that fits max_bytes; when even the lowest quality does not fit,
+    it is scaled down further. The copy is reused while it is newer than
+    the source. Without Pillow the source path is returned unchanged.
+
+    Args:
+        path: Source image (e.g. the 1024x1024 DALL-E PNG)
+        max_side: Largest width or height in pixels
+        max_bytes: Byte budget of the encoded image
+        fmt: "jpeg" (every email client) or "webp" (smaller, not shown by some clients)
+
+    Returns:
+        Path of the variant (e.g. logs/images/GIFT-1.email.jpg)
+    """
+    source = Path(path)
+    Image = _pillow()
+    if Image is None:
+        return source
+    pil_format, suffix, _ = FORMATS[fmt]
+    variant = source.with_name(f"{source.stem}.email{suffix}")
+    if _fresh(variant, source):
+        return variant
+
+    with Image.open(source) as opened:
+        image = opened.convert("RGB")  # Drops alpha, which JPEG cannot store
+    image.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+    data, quality = _encode(image, pil_format, max_bytes)
+    while len(data) > max_bytes and min(image.size) * DOWNSCALE >= MIN_SIDE:
+        image = image.resize(
+            (int(image.width * DOWNSCALE), int(image.height * DOWNSCALE)), Image.Resampling.LANCZOS
+        )
+        data, quality = _encode(image, pil_format, max_bytes)
+
+    tmp = variant.with_name(variant.name + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(variant)
+    logger.info(
+        f"Email image {variant}: {image.width}x{image.height} {fmt} q{quality}, "
+        f"{len(data)} bytes (source {source.stat().st_size} bytes)"
+    )
+    return variant
+
+
+def thumbnail(path: str | Path, size: int = 256) -> Path | None:
+    """
+    Small JPEG preview of an image (for reports and listings), cached next to it.
+
+    Args:
+        path: Source image
+        size: Largest width or height in pixels
+
+    Returns:
+        Path of the thumbnail, or None without Pillow
+    """
+    source = Path(path)
+    Image = _pillow()
+    if Image is None:
+        return None
+    thumb = source.with_name(f"{source.stem}.thumb.jpg")
+    if _fresh(thumb, source):
+        return thumb
+    with Image.open(source) as opened:
+        image = opened.convert("RGB")
+    image.thumbnail((size, size), Image.Resampling.LANCZOS)
+    tmp = thumb.with_name(thumb.name + ".tmp")
+    image.save(tmp, format="JPEG", quality=80, optimize=True)
+    tmp.replace(thumb)
+    return thumb
+
+
+def prepare_email_images(path: str | Path) -> tuple[Path, Path | None]:
+    """
+    Email variant and thumbnail of a gift image, as configured in settings.
+
+    Args:
+        path: Source image
+
+    Returns:
+        (email image path, thumbnail path or None)
+    """
+    from elfactory.config import settings
+
+    variant = email_variant(
+        path,
+        max_side=settings.email_image_max_side,
+        max_bytes=settings.email_image_max_bytes,
+        fmt=settings.email_image_format,
+    )
+    return variant, thumbnail(path, settings.thumbnail_size)
+
+
+def mime_subtype(path: str | Path) -> str:
+    """MIME subtype of an image file from its extension (e.g. "jpeg")."""
+    return MIME_TYPES.get(Path(path).suffix.lower(), "image/png").split("/", 1)[1]
@@ -0,0 +1,188 @@
+"""In-memory stand-in for the Gmail API client, for offline runs and claim-protocol checks."""
+
+import base64
+import itertools
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+
+class _Request:
+    """Deferred call, executed like googleapiclient's HttpRequest."""
+
+    def __init__(self, api: "FakeGmailApi", method: str, func, *args):
+        self._api = api
+        self._method = method
+        self._func = func
+        self._args = args
+
+    def execute(self) -> Any:
+        if self._api.latency:
+            time.sleep(self._api.latency)
+        with self._api.lock:
+            self._api.calls[self._method] += 1
+            return self._func(*self._args)
+
+
+class _Messages:
+    def __init__(self, api: "FakeGmailApi"):
+        self._api = api
+
+    def get(self, userId: str, id: str, format: str = "full", metadataHeaders: list[str] | None = None, **_) -> _Request:
+        return _Request(self._api, f"messages.get.{format}", self._api._get, id, format, metadataHeaders)
+
+    def modify(self, userId: str, id: str, body: dict) -> _Request:
+        return _Request(self._api, "messages.modify", self._api._modify_one, id, body)
+
+    def batchModify(self, userId: str, body: dict) -> _Request:
+        return _Request(self._api, "messages.batchModify", self._api._modify, body["ids"], body)
+
+    # Defined last: the name shadows the builtin list in the annotations above
+    def list(self, userId: str, q: str = "", maxResults: int = 100, **_) -> _Request:
+        return _Request(self._api, "messages.list", self._api._list, q, maxResults)
+
+
+class _Labels:
+    def __init__(self, api: "FakeGmailApi"):
+        self._api = api
+
+    def list(self, userId: str) -> _Request:
+        return _Request(self._api, "labels.list", lambda: {"labels": list(self._api.labels.values())})
+
+    def create(self, userId: str, body: dict) -> _Request:
+        return _Request(self._api, "labels.create", self._api._create_label, body["name"])
+
+
+class _Users:
+    def __init__(self, api: "FakeGmailApi"):
+        self._api = api
+
+    def messages(self) -> _Messages:
+        return _Messages(self._api)
+
+    def labels(self) -> _Labels:
+        return _Labels(self._api)
+
+
+class FakeGmailApi:
+    """
+    Thread-safe fake of the googleapiclient Gmail service.
+
+    Implements the calls GmailService makes (messages list/get/modify/
+    batchModify, labels list/create) and the query terms it uses: is:unread,
+    subject:word, label:name and -label:name. Every executed call is counted
+    in calls, by method (gets by format).
+
+    Usage:
+        api = FakeGmailApi()
+        api.add_message("letterina", "Caro Babbo Natale, ...")
+        gmail = GmailService(service=api)
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Args:
+            latency: Seconds each call waits before running, to interleave concurrent monitors
+        """
+        self.latency = latency
+        self.lock = threading.RLock()
+        self.messages: dict[str, dict[str, Any]] = {}
+        self.labels: dict[str, dict[str, str]] = {
+            name: {"id": name, "name": name, "type": "system"} for name in ("INBOX", "UNREAD")
+        }
+        self.calls: Counter = Counter()
+        self._ids = itertools.count(1)
+
+    def users(self) -> _Users:
+        return _Users(self)
+
+    def add_message(self, subject: str, body: str, sender: str = "child@example.com") -> str:
+        """Deliver an unread message and return its id."""
+        with self.lock:
+            message_id = f"m{next(self._ids):06d}"
+            self.messages[message_id] = {
+                "id": message_id,
+                "threadId": message_id,
+                "labelIds": ["INBOX", "UNREAD"],
+                "snippet": body[:100],
+                "headers": [
+                    {"name": "Subject", "value": subject},
+                    {"name": "From", "value": sender},
+                    {"name": "Date", "value": "Mon, 1 Dec 2025 10:00:00 +0100"},
+                ],
+                "data": base64.urlsafe_b64encode(body.encode("utf-8")).decode("ascii"),
+            }
+            return message_id
+
+    def label_names(self, message_id: str) -> set[str]:
+        """Names of the labels on a message."""
+        with self.lock:
+            return {self.labels[label_id]["name"] for label_id in self.messages[message_id]["labelIds"]}
+
+    def _matches(self, message: dict[str, Any], term: str) -> bool:
+        negate = term.startswith("-")
+        key, _, value = term.lstrip("-").partition(":")
+        value = value.lower()
+        if key == "is" and value == "unread":
+            found = "UNREAD" in message["labelIds"]
+        elif key == "subject":
+            subject = next(h["value"] for h in message["headers"] if h["name"] == "Subject")
+            found = value in subject.lower()
+        elif key == "label":
+            # Gmail matches label names with "/" and spaces written as "-"
+            names = {re.sub(r"[/ ]", "-", self.labels[i]["name"].lower()) for i in message["labelIds"]}
+            found = value in names
+        else:
+            raise ValueError(f"Unsupported query term: {term}")
+        return found != negate
+
+    def _list(self, query: str, max_results: int) -> dict[str, Any]:
+        terms = query.split()
+        found = [
+            {"id": m["id"], "threadId": m["threadId"]}
+            for m in reversed(self.messages.values())
+            if all(self._matches(m, term) for term in terms)
+        ][:max_results]
+        return {"messages": found, "resultSizeEstimate": len(found)} if found else {"resultSizeEstimate": 0}
+
+    def _get(self, message_id: str, format: str, metadata_headers: list[str] | None) -> dict[str, Any]:
+        message = self.messages[message_id]
+        result = {
+            "id": message_id,
+            "threadId": message["threadId"],
+            "labelIds": list(message["labelIds"]),
+            "snippet": message["snippet"],
+        }
+        if format == "minimal":
+            return result
+        headers = message["headers"]
+        if format == "metadata":
+            wanted = set(metadata_headers or [h["name"] for h in headers])
+            result["payload"] = {"headers": [h for h in headers if h["name"] in wanted]}
+        else:
+            result["payload"] = {"mimeType": "text/plain", "headers": headers, "body": {"data": message["data"]}}
+        return result
+
+    def _modify(self, message_ids: list[str], body: dict) -> dict[str, Any]:
+        add, remove = body.get("addLabelIds", []), body.get("removeLabelIds", [])
+        for label_id in add + remove:
+            if label_id not in self.labels:
+                raise ValueError(f"Invalid label: {label_id}")
+        for message_id in message_ids:
+            message = self.messages[message_id]
+            labels = [label for label in message["labelIds"] if label not in remove]
+            message["labelIds"] = labels + [label for label in add if label not in labels]
+        return {}
+
+    def _modify_one(self, message_id: str, body: dict) -> dict[str, Any]:
+        self._modify([message_id], body)
+        return {"id": message_id, "labelIds": list(self.messages[message_id]["labelIds"])}
+
+    def _create_label(self, name: str) -> dict[str, str]:
+        if any(label["name"] == name for label in self.labels.values()):
+            raise ValueError(f"Label name exists or conflicts: {name}")
+        label = {"id": f"Label_{len(self.labels)}", "name": name, "type": "user"}
+        self.labels[label["id"]] = label
+        return label
@@ -2,15 +2,17 @@
 
 import os
 import pickle
+import random
+import re
+import socket
+import time
 from pathlib import Path
-from typing import Any
-
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from typing import Any, Callable
 
 SCOPES = ["https://www.googleapis.com/auth/gmail.modify"]
+METADATA_HEADERS = ["Subject", "From", "Date"]
+BATCH_MODIFY_LIMIT = 1000  # Message ids per batchModify call
+CLAIM_BACKOFF_SECONDS = 1.0  # Upper bound of the random delay before retrying a contested claim
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
@@ -19,16 +21,58 @@ TOKEN_FILE = PROJECT_ROOT / "token.json"
 
 
 class GmailService:
-    """Gmail API service for reading emails."""
+    """
+    Gmail API service for reading emails.
+
+    Several monitors (or machines) can share a mailbox: a monitor claims a
+    message before processing it (see claim()) and records the outcome with
+    complete(). Claims are labels, so they survive restarts and are visible
+    in the Gmail UI:
+
+    - <prefix>-processing: claimed by some monitor; excluded by claim_query()
+    - <prefix>-claim-<owner>: which monitor claimed it
+    - <prefix>-done / <prefix>-failed: outcome of the last attempt
+    - <prefix>-review: has the subject keyword but scored too low to process
+      automatically; excluded by claim_query() until someone removes it
+    """
+
+    def __init__(self, service: Any = None, owner: str | None = None, label_prefix: str | None = None):
+        """
+        Initialize Gmail service with OAuth2 authentication.
 
-    def __init__(self):
-        """Initialize Gmail service with OAuth2 authentication."""
-        self.service = None
+        Args:
+            service: Gmail API client to use instead of authenticating
+                (e.g. services.fake_gmail.FakeGmailApi)
+            owner: Name of this monitor in claim labels (defaults to
+                settings.gmail_worker_id, or host and pid)
+            label_prefix: Prefix of the claim labels (defaults to settings.gmail_label_prefix)
+        """
+        self.service = service
         self.creds = None
-        self._authenticate()
+        if service is None:
+            self._authenticate()
+
+        from elfactory.config import settings
+
+        prefix = label_prefix or settings.gmail_label_prefix
+        owner = owner or settings.gmail_worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.owner = re.sub(r"[^a-z0-9-]+", "-", owner.lower())
+        self.processing_label = f"{prefix}-processing"
+        self.claim_prefix = f"{prefix}-claim-"
+        self.done_label = f"{prefix}-done"
+        self.failed_label = f"{prefix}-failed"
+        self.review_label = f"{prefix}-review"
+        self._label_ids: dict[str, str] = {}
 
     def _authenticate(self):
         """Authenticate with Gmail API using OAuth2."""
+        # Imported here: the Google client stack is slow to import and only
+        # needed once a service is actually created
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from googleapiclient.discovery import build
+
         # Check if token.json exists (previously authenticated)
         if TOKEN_FILE.exists():
             self.creds = Credentials.from_authorized_user_file(str(TOKEN_FILE), SCOPES)
@@ -61,12 +105,24 @@ class GmailService:
         # Build Gmail service
         self.service = build("gmail", "v1", credentials=self.creds)
 
-    def get_unread_messages(self, max_results: int = 10) -> list[dict[str, Any]]:
+    def get_unread_messages(
+        self,
+        max_results: int = 10,
+        query: str = "",
+        accept: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> list[dict[str, Any]]:
         """
         Get unread messages from inbox.
 
+        Fetches in two phases: first only the Subject, From and Date headers
+        of every listed message (format="metadata"), then the full message,
+        with body decoding, only for the ones accepted.
+
         Args:
             max_results: Maximum number of messages to retrieve
+            query: Extra Gmail search terms applied server-side (e.g. "subject:letterina")
+            accept: Called with the headers-only message (id, thread_id, subject,
+                from, date, snippet); messages it rejects are not downloaded
 
         Returns:
             List of message dictionaries with id, subject, from, body
@@ -76,7 +132,7 @@ class GmailService:
             results = (
                 self.service.users()
                 .messages()
-                .list(userId="me", q="is:unread", maxResults=max_results)
+                .list(userId="me", q=f"is:unread {query}".strip(), maxResults=max_results)
                 .execute()
             )
 
@@ -85,9 +141,22 @@ class GmailService:
             if not messages:
                 return []
 
+            # Headers only, to decide which messages are worth downloading
+            headers = [
+                self._parse_message(
+                    self.service.users()
+                    .messages()
+                    .get(userId="me", id=msg["id"], format="metadata", metadataHeaders=METADATA_HEADERS)
+                    .execute()
+                )
+                for msg in messages
+            ]
+            if accept is not None:
+                headers = [msg for msg in headers if accept(msg)]
+
             # Get full message details
             full_messages = []
-            for msg in messages:
+            for msg in headers:
                 full_msg = (
                     self.service.users()
                     .messages()
@@ -110,7 +179,7 @@ class GmailService:
         Parse Gmail API message into simplified format.
 
         Args:
-            message: Raw Gmail API message
+            message: Raw Gmail API message (format "full" or "metadata")
 
         Returns:
             Simplified message dictionary
@@ -122,7 +191,7 @@ class GmailService:
         from_email = next((h["value"] for h in headers if h["name"] == "From"), "")
         date = next((h["value"] for h in headers if h["name"] == "Date"), "")
 
-        # Extract body
+        # Extract body (empty for metadata messages)
         body = self._get_message_body(message["payload"])
 
         return {
@@ -167,20 +236,202 @@ class GmailService:
 
         return ""
 
-    def mark_as_read(self, message_id: str):
+    def _refresh_labels(self):
+        labels = self.service.users().labels().list(userId="me").execute().get("labels", [])
+        self._label_ids = {label["name"]: label["id"] for label in labels}
+
+    def label_id(self, name: str) -> str:
         """
-        Mark a message as read.
+        Id of a user label, created if missing.
 
         Args:
-            message_id: Gmail message ID
+            name: Label name
+
+        Returns:
+            Gmail label id
         """
-        try:
-            self.service.users().messages().modify(
-                userId="me", id=message_id, body={"removeLabelIds": ["UNREAD"]}
+        if name not in self._label_ids:
+            self._refresh_labels()
+        if name not in self._label_ids:
+            try:
+                label = self.service.users().labels().create(userId="me", body={"name": name}).execute()
+                self._label_ids[name] = label["id"]
+            except Exception:
+                # Created meanwhile by another monitor
+                self._refresh_labels()
+        return self._label_ids[name]
+
+    def label_names(self, label_ids: list[str]) -> set[str]:
+        """Names of label ids, reloading the labels once when one is unknown (e.g. another monitor's)."""
+        names = {label_id: name for name, label_id in self._label_ids.items()}
+        if any(label_id not in names for label_id in label_ids):
+            self._refresh_labels()
+            names = {label_id: name for name, label_id in self._label_ids.items()}
+        return {names.get(label_id, label_id) for label_id in label_ids}
+
+    def modify_labels(self, message_ids: list[str], add: list[str] = (), remove: list[str] = ()):
+        """
+        Add and remove labels on many messages with one batchModify call per 1000 messages.
+
+        Args:
+            message_ids: Gmail message IDs
+            add: Label ids to add
+            remove: Label ids to remove (e.g. "UNREAD")
+        """
+        body = {"addLabelIds": list(add), "removeLabelIds": list(remove)}
+        for start in range(0, len(message_ids), BATCH_MODIFY_LIMIT):
+            self.service.users().messages().batchModify(
+                userId="me", body={"ids": list(message_ids[start:start + BATCH_MODIFY_LIMIT]), **body}
             ).execute()
+
+    def mark_as_read(self, message_id: str | list[str]):
+        """
+        Mark messages as read.
+
+        Args:
+            message_id: Gmail message ID, or several IDs marked in one batch
+        """
+        try:
+            ids = [message_id] if isinstance(message_id, str) else list(message_id)
+            if ids:
+                self.modify_labels(ids, remove=["UNREAD"])
         except Exception as e:
             print(f"Error marking message as read: {e}")
 
+    def claim_query(self) -> str:
+        """Gmail search terms excluding messages claimed, done or held for review."""
+        return f"-label:{self.processing_label} -label:{self.done_label} -label:{self.review_label}"
+
+    def _claim_labels(self, message_id: str) -> tuple[set[str], bool]:
+        """Claim label names on a message, and whether it is done."""
+        message = self.service.users().messages().get(userId="me", id=message_id, format="minimal").execute()
+        names = self.label_names(message.get("labelIds", []))
+        return {name for name in names if name.startswith(self.claim_prefix)}, self.done_label in names
+
+    def _contested(self, message_id: str, own_name: str | None) -> bool:
+        """Whether a message is done or carries a claim label other than own_name."""
+        claims, done = self._claim_labels(message_id)
+        return done or bool(claims - {own_name})
+
+    def _release_orphans(self, message_ids: list[str]) -> list[str]:
+        """Remove the processing label from messages no monitor claims any more; returns their ids."""
+        orphans = [message_id for message_id in message_ids if not self._claim_labels(message_id)[0]]
+        if orphans:
+            self.modify_labels(orphans, remove=[self.label_id(self.processing_label)])
+        return orphans
+
+    def claim(self, message_ids: list[str], attempts: int = 3) -> list[str]:
+        """
+        Claim messages for this monitor, so that exactly one monitor processes each.
+
+        Adds the processing and owner labels in one batch, then rereads the
+        labels of each message. A message is won when no other monitor's
+        claim label and no done label is on it. On contention the monitor
+        removes its owner label; when every contender backed off (no claim
+        label left) it retries after a random delay, and after the last
+        attempt clears the processing label so a later poll picks it up.
+        Messages left to another contender are checked again at the end:
+        when that contender backed off too, the processing label is
+        removed, so the message is never hidden without an owner.
+
+        Args:
+            message_ids: Messages to claim
+            attempts: Claim rounds for messages all contenders backed off from
+
+        Returns:
+            The ids claimed by this monitor
+        """
+        if not message_ids:
+            return []
+        own_name = self.claim_prefix + self.owner
+        own = self.label_id(own_name)
+        processing = self.label_id(self.processing_label)
+
+        won, yielded = [], []
+        pending = list(message_ids)
+        for attempt in range(attempts):
+            if attempt:
+                time.sleep(random.uniform(0, CLAIM_BACKOFF_SECONDS * attempt))
+            self.modify_labels(pending, add=[processing, own])
+            lost = [message_id for message_id in pending if self._contested(message_id, own_name)]
+            won += [message_id for message_id in pending if message_id not in lost]
+            if not lost:
+                break
+            self.modify_labels(lost, remove=[own])
+            # Messages held by another monitor are theirs; the others were abandoned by everyone
+            held = [message_id for message_id in lost if self._contested(message_id, None)]
+            yielded += held
+            pending = [message_id for message_id in lost if message_id not in held]
+            if not pending:
+                break
+        else:
+            self.modify_labels(pending, remove=[processing])
+
+        # Contenders that saw each other's claim may all have yielded
+        self._release_orphans(yielded)
+        return won
+
+    def release_stale_claims(self) -> int:
+        """
+        Release the claims of a previous run of this monitor (same owner), e.g. after a crash,
+        and clear processing labels left on messages that no monitor claims.
+
+        Returns:
+            Number of messages released
+        """
+        own_name = self.claim_prefix + self.owner
+        messages = self.service.users().messages()
+        results = messages.list(userId="me", q=f"label:{own_name}", maxResults=500).execute()
+        ids = [msg["id"] for msg in results.get("messages", [])]
+        if ids:
+            self.modify_labels(ids, remove=[self.label_id(self.processing_label), self.label_id(own_name)])
+
+        query = f"label:{self.processing_label} -label:{self.done_label}"
+        results = messages.list(userId="me", q=query, maxResults=500).execute()
+        orphans = self._release_orphans([msg["id"] for msg in results.get("messages", []) if msg["id"] not in ids])
+        return len(ids) + len(orphans)
+
+    def complete(self, message_ids: list[str], ok: bool):
+        """
+        Release claimed messages, recording the outcome.
+
+        Successful messages get the done label and are marked as read;
+        failed ones get the failed label and stay unread, to be retried.
+
+        Args:
+            message_ids: Messages claimed by this monitor
+            ok: Whether processing succeeded
+        """
+        if not message_ids:
+            return
+        try:
+            own = self.label_id(self.claim_prefix + self.owner)
+            processing = self.label_id(self.processing_label)
+            done, failed = self.label_id(self.done_label), self.label_id(self.failed_label)
+            if ok:
+                self.modify_labels(message_ids, add=[done], remove=[processing, own, failed, "UNREAD"])
+            else:
+                self.modify_labels(message_ids, add=[failed], remove=[processing, own])
+        except Exception as e:
+            print(f"Error completing messages {message_ids}: {e}")
+
+    def flag_for_review(self, message_ids: list[str]):
+        """
+        Hold messages for a person to check instead of processing them.
+
+        They get the review label and stay unread; removing the label in
+        Gmail releases them to the next poll.
+
+        Args:
+            message_ids: Messages to hold
+        """
+        if not message_ids:
+            return
+        try:
+            self.modify_labels(message_ids, add=[self.label_id(self.review_label)])
+        except Exception as e:
+            print(f"Error flagging messages {message_ids} for review: {e}")
+
     def watch_mailbox(self) -> dict[str, Any]:
         """
         Set up Gmail push notifications (requires webhook endpoint).
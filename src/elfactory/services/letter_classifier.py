@@ -0,0 +1,244 @@
+"""Local letter pre-classifier: rejects junk without an LLM call and extracts the child's details."""
+
+import json
+import logging
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("elfactory.letters")
+
+SUBJECT_KEYWORDS = ("letterina", "lettera a babbo natale", "letter to santa", "letter for santa")
+
+# Phrases typical of Italian and English letters to Santa, and of mail that is not one
+_PATTERNS = {
+    "santa_greeting": r"\b(?:car[oa] babbo natale|babbo natale|dear santa|santa claus|father christmas)\b",
+    "wish_phrase": r"\b(?:vorrei|desidero|mi piacerebbe|i would like|i'd like|i want|i wish|my wish|could you bring)\b",
+    "christmas": r"\b(?:natale|christmas|xmas|renne|reindeer|elfi|elves)\b",
+    "gift_words": r"\b(?:regal[oi]|giocattol[oi]|gift|gifts|present|presents|toy|toys"
+                  r"|robot|bambol[ae]|dolls?|bici(?:cletta)?|bikes?|bicycles?|lego|pall[ae]|balls?|peluche|teddy"
+                  r"|treni(?:no)?|trains?|macchinin[ae]|cars?|puzzles?|libr[oi]|books?|videogioc(?:o|hi)"
+                  r"|video ?games?|monopattino|scooter|skateboard|costruzioni|dinosaur[oi]|dinosaurs?)\b",
+    "self_intro": r"\b(?:mi chiamo|il mio nome è|my name is|sono stat[oa] buon[oa]|i have been good|i've been good)\b",
+    "spam_words": r"\b(?:unsubscribe|disiscriviti|newsletter|offerta|sconto|promo(?:zione)?|coupon|bitcoin|crypto|casino"
+                  r"|winner|vincitore|lottery|lotteria|click here|clicca qui|fattura|invoice|password|verify your"
+                  r"|verifica il tuo|account|bonifico|wire transfer|webinar|seo)\b",
+    "money": r"(?:[€$£]\s?\d|\d\s?(?:€|eur|usd)\b|\d+\s?%)",
+    "reply_prefix": r"^\s*(?:re|r|fw|fwd|i)\s*:",
+}
+_COMPILED = {name: re.compile(pattern, re.IGNORECASE) for name, pattern in _PATTERNS.items()}
+_URL = re.compile(r"https?://|www\.", re.IGNORECASE)
+
+# Logistic regression weights; scripts/train_letter_classifier.py fits new ones from labelled mail
+DEFAULT_WEIGHTS = {
+    "bias": -2.0,
+    "subject_keyword": 2.0,
+    "santa_greeting": 2.0,
+    "wish_phrase": 1.5,
+    "christmas": 0.8,
+    "gift_words": 1.0,
+    "self_intro": 1.0,
+    "age_found": 1.0,
+    "name_found": 0.5,
+    "spam_words": -1.5,
+    "money": -1.5,
+    "links": -2.0,
+    "reply_prefix": -1.0,
+    "too_short": -0.5,  # Short letters are common ("un robot per favore"); spam is caught by the others
+    "too_long": -1.0,
+    "shouting": -1.5,
+}
+FEATURES = [name for name in DEFAULT_WEIGHTS if name != "bias"]
+
+_NUMBER_WORDS = {
+    "uno": 1, "due": 2, "tre": 3, "quattro": 4, "cinque": 5, "sei": 6, "sette": 7, "otto": 8, "nove": 9,
+    "dieci": 10, "undici": 11, "dodici": 12, "tredici": 13, "quattordici": 14,
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9,
+    "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14,
+}
+_AGE_NUMBER = r"(\d{1,2}|" + "|".join(_NUMBER_WORDS) + r")"
+_AGE = [
+    re.compile(rf"\bho (?:quasi )?{_AGE_NUMBER} anni\b", re.IGNORECASE),
+    re.compile(rf"\b(?:i am|i'm|im) (?:almost )?{_AGE_NUMBER}(?: years? old| yo)?\b(?! years? ago)", re.IGNORECASE),
+    re.compile(rf"\b{_AGE_NUMBER} (?:anni|years? old)\b", re.IGNORECASE),
+]
+_NAME_WORD = r"([A-ZÀ-Ý][a-zà-ÿ']+(?: [A-ZÀ-Ý][a-zà-ÿ']+)?)"
+_NAME = [
+    re.compile(rf"\b(?:[Mm]i chiamo|[Ii]l mio nome è|[Mm]y name is|[Mm]y name's) {_NAME_WORD}"),
+    re.compile(rf"\b(?:[Ss]ono|I am|I'm) {_NAME_WORD}(?=[,.!]| e | and | ho | I )"),
+    re.compile(
+        rf"(?:[Ff]irmato|[Uu]n abbraccio|[Tt]anti baci|[Bb]aci|[Cc]on affetto|[Cc]iao|[Ll]ove|[Ww]ith love|"
+        rf"[Ff]rom|[Yy]ours)[,!.]?\s*\n+\s*{_NAME_WORD}\s*$"
+    ),
+]
+_CITY_WORD = r"([A-ZÀ-Ý][a-zà-ÿ']+(?:[ -](?:[A-ZÀ-Ý][a-zà-ÿ']+|di|del|sul|in))*)"
+_CITY = [
+    re.compile(rf"\b(?:[Aa]bito|[Vv]ivo|[Ss]to) (?:a|ad|in) {_CITY_WORD}"),
+    re.compile(rf"\b(?:[Ss]ono di|[Vv]engo da) {_CITY_WORD}"),
+    re.compile(rf"\b(?:I live in|I'm from|I am from|we live in) {_CITY_WORD}"),
+]
+_NOT_NAMES = {"Babbo", "Natale", "Santa", "Claus", "Christmas", "Caro", "Cara", "Dear", "Papà", "Mamma", "Io", "Il"}
+
+
+@dataclass
+class LetterClassification:
+    """Gift-request likelihood of an email and the child details found in it."""
+    score: float
+    threshold: float
+    features: dict[str, float] = field(default_factory=dict)
+    reasons: list[str] = field(default_factory=list)  # Strongest features, by weight
+    name: str | None = None
+    age: int | None = None
+    location: str | None = None
+
+    @property
+    def is_gift_request(self) -> bool:
+        return self.score >= self.threshold
+
+    @property
+    def child_info(self) -> dict[str, Any] | None:
+        """Prefill for ChildInfo, None without at least a name."""
+        if not self.name:
+            return None
+        return {"name": self.name, "age": self.age, "location": self.location}
+
+
+def _age(text: str) -> int | None:
+    for pattern in _AGE:
+        match = pattern.search(text)
+        if match:
+            value = match.group(1).lower()
+            age = int(value) if value.isdigit() else _NUMBER_WORDS[value]
+            if 1 <= age <= 17:
+                return age
+    return None
+
+
+def _name(text: str) -> str | None:
+    for pattern in _NAME:
+        for match in pattern.finditer(text.strip()):
+            words = [w for w in match.group(1).split() if w not in _NOT_NAMES]
+            if words:
+                return " ".join(words)
+    return None
+
+
+def _location(text: str) -> str | None:
+    for pattern in _CITY:
+        match = pattern.search(text)
+        if match:
+            return match.group(1).strip()
+    return None
+
+
+def extract_child_details(text: str) -> tuple[str | None, int | None, str | None]:
+    """
+    Child's name, age and city from an Italian or English letter.
+
+    Only explicit phrasings are recognized ("mi chiamo Luca", "ho 7 anni",
+    "abito a Torino", "my name is Emma", "I'm seven years old", "I live in
+    Leeds", or a name signed under the closing), so a None is common and
+    left to the reception manager.
+
+    Args:
+        text: Email body
+
+    Returns:
+        (name, age, location), each None when not found
+    """
+    return _name(text), _age(text), _location(text)
+
+
+def letter_features(subject: str, body: str, name: str | None = None, age: int | None = None) -> dict[str, float]:
+    """Feature values in [0, 1] used by the classifier."""
+    text = f"{subject}\n{body}"
+    letters = [c for c in body if c.isalpha()]
+    features = {
+        "subject_keyword": float(any(keyword in subject.lower() for keyword in SUBJECT_KEYWORDS)),
+        "age_found": float(age is not None),
+        "name_found": float(name is not None),
+        "links": min(len(_URL.findall(body)), 3) / 3,
+        "reply_prefix": float(bool(_COMPILED["reply_prefix"].search(subject))),
+        "too_short": float(len(body.strip()) < 20),
+        "too_long": float(len(body) > 5000),
+        "shouting": float(len(letters) >= 20 and sum(c.isupper() for c in letters) / len(letters) > 0.6),
+    }
+    for name in ("santa_greeting", "wish_phrase", "christmas", "gift_words", "self_intro"):
+        features[name] = float(bool(_COMPILED[name].search(text)))
+    for name in ("spam_words", "money"):
+        features[name] = min(len(_COMPILED[name].findall(text)), 3) / 3
+    return features
+
+
+class LetterClassifier:
+    """
+    Logistic-regression scorer over keyword and regex features.
+
+    Takes well under a millisecond per email, so every unread message can be scored
+    before any agent sees it.
+    """
+
+    def __init__(self, weights: dict[str, float] | None = None, threshold: float = 0.5):
+        """
+        Args:
+            weights: Feature weights plus "bias" (defaults to DEFAULT_WEIGHTS)
+            threshold: Minimum score of a gift request
+        """
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.threshold = threshold
+
+    @classmethod
+    def load(cls, path: str | Path, threshold: float = 0.5) -> "LetterClassifier":
+        """Classifier with the weights written by scripts/train_letter_classifier.py."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(data["weights"], threshold=data.get("threshold", threshold))
+
+    def score(self, features: dict[str, float]) -> float:
+        z = self.weights["bias"] + sum(self.weights.get(name, 0.0) * value for name, value in features.items())
+        return 1 / (1 + math.exp(-z))
+
+    def classify(self, subject: str, body: str) -> LetterClassification:
+        """
+        Score an email and extract the child details.
+
+        Args:
+            subject: Email subject
+            body: Email body (plain text)
+
+        Returns:
+            The classification; is_gift_request tells whether to process it
+        """
+        name, age, location = extract_child_details(body)
+        features = letter_features(subject, body, name, age)
+        contributions = {name: value * self.weights.get(name, 0.0) for name, value in features.items() if value}
+        return LetterClassification(
+            score=round(self.score(features), 3),
+            threshold=self.threshold,
+            features=features,
+            reasons=sorted(contributions, key=lambda name: -abs(contributions[name]))[:3],
+            name=name,
+            age=age,
+            location=location,
+        )
+
+
+_classifier: LetterClassifier | None = None
+_classifier_lock = threading.Lock()
+
+
+def get_letter_classifier() -> LetterClassifier:
+    """Process-wide classifier configured from settings."""
+    global _classifier
+    with _classifier_lock:
+        if _classifier is None:
+            from elfactory.config import settings
+
+            if settings.letter_classifier_path:
+                _classifier = LetterClassifier.load(settings.letter_classifier_path, settings.letter_min_score)
+                logger.info(f"Loaded letter classifier weights from {settings.letter_classifier_path}")
+            else:
+                _classifier = LetterClassifier(threshold=settings.letter_min_score)
+        return _classifier
@@ -0,0 +1,161 @@
+"""Librarian knowledge base: spec table lookups plus a persistent answer cache."""
+
+import re
+import threading
+from collections import Counter
+from typing import Any, Awaitable, Callable
+
+from elfactory.services.material_specs import SPECS, SpecEntry, age_band
+from elfactory.services.ttl_cache import TTLCache
+
+STOPWORDS = {
+    "a", "an", "the", "of", "for", "to", "in", "on", "with", "and", "or", "is", "are", "be", "it", "its",
+    "what", "which", "how", "should", "can", "i", "we", "my", "our", "this", "that", "do", "does", "need",
+    "please", "about", "by", "as", "at", "from", "any", "me", "tell", "give",
+    "il", "lo", "la", "i", "gli", "le", "un", "uno", "una", "di", "da", "per", "con", "su", "e", "o", "che",
+    "quale", "quali", "come", "del", "della", "dei", "delle", "al", "alla", "nel", "nella", "mi", "serve",
+}
+# Words that do not change what the question is about
+GENERIC_WORDS = {
+    "safety", "safe", "sicurezza", "sicuro", "sicura", "spec", "specs", "specification", "specifications",
+    "specifiche", "properties", "property", "proprietà", "standard", "standards", "norma", "norme", "normativa",
+    "requirements", "requirement", "requisiti", "guidelines", "guideline", "linee", "guida", "child", "children",
+    "kid", "kids", "toddler", "toddlers", "bambino", "bambina", "bambini", "toy", "toys", "giocattolo", "giocattoli", "age", "età",
+    "recommended", "best", "use", "using", "usare", "gift", "regalo", "material", "materials", "materiale",
+    "materiali", "certified", "certification", "certificazione", "compliance", "info", "information",
+    "informazioni", "considerations", "notes", "toxic", "tossico", "suitable", "adatto", "adatta", "approved",
+}
+_AGE = re.compile(r"(\d{1,2})\s*-?\s*(?:years?|yrs?|y/o|yo|anni|anno)(?:\s*-?\s*olds?)?", re.IGNORECASE)
+_WORD = re.compile(r"[a-zà-ü0-9]+")
+
+
+def normalize_question(text: str) -> tuple[tuple[str, ...], int | None]:
+    """
+    Reduce a question to its sorted topic words and the age it mentions.
+
+    "PLA safety for 6-year-olds?" and "Is PLA safe for a 6 year old" both
+    give (("pla",), 6): word order, case, punctuation, stopwords and generic
+    words do not matter.
+    """
+    age_match = _AGE.search(text)
+    text = _AGE.sub(" ", text.lower())
+    words = {word for word in _WORD.findall(text) if word not in STOPWORDS and word not in GENERIC_WORDS}
+    return tuple(sorted(words)), int(age_match.group(1)) if age_match else None
+
+
+class SpecIndex:
+    """Inverted index from keywords to spec entries."""
+
+    def __init__(self, specs: list[SpecEntry]):
+        self.by_keyword: dict[str, list[SpecEntry]] = {}
+        for spec in specs:
+            for keyword in spec.keywords:
+                self.by_keyword.setdefault(keyword, []).append(spec)
+
+    def lookup(self, words: tuple[str, ...]) -> tuple[list[SpecEntry], list[str]]:
+        """
+        Returns:
+            Matching entries (no duplicates) and the words that are neither
+            spec keywords nor numbers
+        """
+        entries: dict[str, SpecEntry] = {}
+        unknown = []
+        for word in words:
+            matches = self.by_keyword.get(word)
+            if matches:
+                entries.update((spec.key, spec) for spec in matches)
+            elif not word.isdigit():
+                unknown.append(word)
+        return list(entries.values()), unknown
+
+
+class LibrarianKnowledgeBase:
+    """
+    Delegation intercept for librarian_elf.
+
+    Questions are keyed by their normalized words plus the child's age band.
+    A cached answer is returned directly; a question about known materials or
+    standards only is answered from the spec table; anything else goes to the
+    LLM librarian and its answer is cached for every artisan and gift.
+    """
+
+    def __init__(self, cache: TTLCache, specs: list[SpecEntry] = SPECS):
+        self.cache = cache
+        self.index = SpecIndex(specs)
+        self.stats: Counter = Counter()
+        self._stats_lock = threading.Lock()
+
+    def _count(self, outcome: str) -> None:
+        with self._stats_lock:
+            self.stats[outcome] += 1
+
+    def answer(self, question: str, age: int | None = None) -> tuple[str | None, str]:
+        """
+        Answer from memory when possible.
+
+        Args:
+            question: The artisan's question
+            age: The child's age (overrides an age in the question)
+
+        Returns:
+            (answer or None, cache key for the LLM answer)
+        """
+        words, question_age = normalize_question(question)
+        band = age_band(age if age is not None else question_age)
+        key = f"{band}|{' '.join(words)}"
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._count("cache_hits")
+            return cached, key
+        entries, unknown = self.index.lookup(words)
+        if entries and not unknown:
+            self._count("spec_table")
+            return "\n".join(entry.answer(band) for entry in entries[:3]), key
+        return None, key
+
+    async def __call__(self, input_task: str, run_agent: Callable[[str], Awaitable[str]]) -> str:
+        from elfactory.tools.state_tools import active_gifts, current_gift_id
+
+        state = active_gifts.get(current_gift_id.get(None))
+        age = state.child_info.age if state is not None and state.child_info else None
+        answer, key = self.answer(input_task, age)
+        if answer is not None:
+            if state is not None:
+                state.log_action("librarian_elf", "consultation_from_memory", input_task[:100])
+            return answer
+
+        self._count("llm")
+        answer = await run_agent(input_task)
+        if isinstance(answer, str) and answer.strip():
+            self.cache.put(key, answer)
+        return answer
+
+    def as_dict(self) -> dict[str, Any]:
+        """Outcome counts and cache size, JSON-serializable."""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        served = sum(stats.values())
+        return {
+            **stats,
+            "served_from_memory_rate": round((served - stats.get("llm", 0)) / served, 4) if served else 0.0,
+            "cached_answers": len(self.cache),
+        }
+
+
+_knowledge_base: LibrarianKnowledgeBase | None = None
+_knowledge_base_lock = threading.Lock()
+
+
+def get_librarian_kb() -> LibrarianKnowledgeBase:
+    """Process-wide knowledge base configured from settings."""
+    global _knowledge_base
+    with _knowledge_base_lock:
+        if _knowledge_base is None:
+            from elfactory.config import settings
+
+            _knowledge_base = LibrarianKnowledgeBase(TTLCache(
+                settings.librarian_cache_path or None,
+                ttl_seconds=settings.librarian_cache_ttl_hours * 3600,
+                max_entries=settings.librarian_cache_size,
+            ))
+        return _knowledge_base
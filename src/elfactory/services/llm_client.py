@@ -0,0 +1,150 @@
+"""Shared LLM client factory with process-wide rate limiting."""
+
+from datapizza.clients.openai import OpenAIClient
+from datapizza.memory import Memory
+from elfactory.config import settings
+from elfactory.services.rate_limiter import get_rate_limiter
+
+
+def _estimate_tokens(args: tuple, kwargs: dict) -> int:
+    """Rough prompt size (4 chars per token) used to reserve token budget."""
+    chars = 0
+    for value in (*args, *kwargs.values()):
+        if isinstance(value, Memory):
+            chars += sum(len(str(block)) for block in value.iter_blocks())
+        elif isinstance(value, (str, list)):
+            chars += len(str(value))
+    return chars // 4 + (kwargs.get("max_tokens") or 1024)
+
+
+def _response_tokens(response) -> int | None:
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+    return usage.prompt_tokens + usage.completion_tokens
+
+
+def _current_budget():
+    # Imported lazily: elfactory.core imports the agents, which import this module
+    from elfactory.core.budget import get_current_budget
+
+    return get_current_budget()
+
+
+def _with_gift_budget(func):
+    """Check and charge the current gift's budget around each attempt of func."""
+    budget = _current_budget()
+    if budget is None:
+        return func
+
+    def run(*args, **kwargs):
+        budget.check()
+        response = func(*args, timeout=max(1.0, budget.remaining_seconds()), **kwargs)
+        budget.charge(calls=1, tokens=_response_tokens(response) or 0)
+        return response
+
+    return run
+
+
+def _a_with_gift_budget(func):
+    """Async variant of _with_gift_budget()."""
+    budget = _current_budget()
+    if budget is None:
+        return func
+
+    async def run(*args, **kwargs):
+        budget.check()
+        response = await func(*args, timeout=max(1.0, budget.remaining_seconds()), **kwargs)
+        budget.charge(calls=1, tokens=_response_tokens(response) or 0)
+        return response
+
+    return run
+
+
+class RateLimitedOpenAIClient(OpenAIClient):
+    """OpenAIClient whose requests share the process-wide "llm" rate limiter.
+
+    Calls made on behalf of a gift are also checked against, and charged to,
+    that gift's GiftBudget, and time out at the gift deadline.
+    """
+
+    def _invoke(self, *args, **kwargs):
+        return get_rate_limiter("llm").call(
+            _with_gift_budget(super()._invoke), *args,
+            estimated_tokens=_estimate_tokens(args, kwargs), usage=_response_tokens, **kwargs
+        )
+
+    async def _a_invoke(self, *args, **kwargs):
+        return await get_rate_limiter("llm").a_call(
+            _a_with_gift_budget(super()._a_invoke), *args,
+            estimated_tokens=_estimate_tokens(args, kwargs), usage=_response_tokens, **kwargs
+        )
+
+    def _structured_response(self, *args, **kwargs):
+        return get_rate_limiter("llm").call(
+            _with_gift_budget(super()._structured_response), *args,
+            estimated_tokens=_estimate_tokens(args, kwargs), usage=_response_tokens, **kwargs
+        )
+
+    async def _a_structured_response(self, *args, **kwargs):
+        return await get_rate_limiter("llm").a_call(
+            _a_with_gift_budget(super()._a_structured_response), *args,
+            estimated_tokens=_estimate_tokens(args, kwargs), usage=_response_tokens, **kwargs
+        )
+
+    def _stream_invoke(self, *args, **kwargs):
+        limiter = get_rate_limiter("llm")
+        estimated = _estimate_tokens(args, kwargs)
+        budget = _current_budget()
+        if budget is not None:
+            budget.check()
+        limiter.acquire(estimated)
+        last = None
+        try:
+            for chunk in super()._stream_invoke(*args, **kwargs):
+                last = chunk
+                yield chunk
+        except BaseException as e:
+            limiter.release(estimated, error=e)
+            raise
+        tokens = _response_tokens(last) if last is not None else None
+        limiter.release(estimated, tokens)
+        if budget is not None:
+            budget.charge(calls=1, tokens=tokens or 0)
+
+    async def _a_stream_invoke(self, *args, **kwargs):
+        limiter = get_rate_limiter("llm")
+        estimated = _estimate_tokens(args, kwargs)
+        budget = _current_budget()
+        if budget is not None:
+            budget.check()
+        await limiter.a_acquire(estimated)
+        last = None
+        try:
+            async for chunk in super()._a_stream_invoke(*args, **kwargs):
+                last = chunk
+                yield chunk
+        except BaseException as e:
+            await limiter.a_release(estimated, error=e)
+            raise
+        tokens = _response_tokens(last) if last is not None else None
+        await limiter.a_release(estimated, tokens)
+        if budget is not None:
+            budget.charge(calls=1, tokens=tokens or 0)
+
+
+def create_llm_client() -> OpenAIClient:
+    """
+    Create the OpenAI client used by every agent.
+
+    Retries are handled by the shared limiter (with jitter and AIMD backoff),
+    so the SDK's own retry loop is disabled to avoid retry storms.
+
+    Returns:
+        A rate-limited OpenAIClient configured from settings
+    """
+    return RateLimitedOpenAIClient(
+        api_key=settings.openai_api_key,
+        model=settings.openai_model,
+        max_retries=0,
+    )
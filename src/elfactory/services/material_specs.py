@@ -0,0 +1,153 @@
+"""Local table of material and safety-standard specs served by the librarian knowledge base."""
+
+from dataclasses import dataclass, field
+
+# Child age bands used by spec notes and librarian cache keys
+AGE_BANDS = ((0, 2, "0-2"), (3, 5, "3-5"), (6, 8, "6-8"), (9, 12, "9-12"), (13, 200, "13+"))
+
+
+def age_band(age: int | None) -> str:
+    """Band of an age ("0-2", "3-5", "6-8", "9-12", "13+"), "any" when unknown."""
+    if age is None:
+        return "any"
+    for low, high, band in AGE_BANDS:
+        if low <= age <= high:
+            return band
+    return "any"
+
+
+@dataclass(frozen=True)
+class SpecEntry:
+    """One material or standard."""
+    key: str
+    keywords: frozenset[str]
+    summary: str
+    standards: tuple[str, ...] = ()
+    # Age band -> safety note; "*" applies to every band without its own note
+    age_notes: dict[str, str] = field(default_factory=dict)
+
+    def answer(self, band: str) -> str:
+        """Concise librarian answer for an age band."""
+        parts = [self.summary]
+        if self.standards:
+            parts.append(f"Standards: {', '.join(self.standards)}.")
+        note = self.age_notes.get(band) or self.age_notes.get("*")
+        if note:
+            parts.append(note)
+        return " ".join(parts)
+
+
+SPECS = [
+    SpecEntry(
+        "pla", frozenset({"pla", "polylactic", "acido", "polilattico"}),
+        "PLA: rigid bio-based thermoplastic, prints at 190-220°C, softens above ~55°C; good for shells and figures.",
+        ("EN71-3 (migration of elements)", "ASTM F963"),
+        {"0-2": "Use food-contact-grade filament, 100% infill for parts that fit the small-parts cylinder or avoid them.",
+         "*": "Non-toxic when printed from certified filament; sand layer edges smooth."},
+    ),
+    SpecEntry(
+        "abs", frozenset({"abs", "acrylonitrile"}),
+        "ABS: tough, impact-resistant thermoplastic (LEGO-type), prints at 230-250°C with an enclosed printer.",
+        ("EN71-3", "ASTM F963"),
+        {"*": "Ventilate while printing (styrene fumes); finished parts are child-safe."},
+    ),
+    SpecEntry(
+        "petg", frozenset({"petg"}),
+        "PETG: tough, slightly flexible thermoplastic, prints at 230-245°C, food-safe grades available.",
+        ("EN71-3",),
+        {"*": "Less brittle than PLA, preferred for parts that flex or get dropped."},
+    ),
+    SpecEntry(
+        "wood", frozenset({"wood", "wooden", "legno", "beech", "faggio", "maple", "acero", "birch", "betulla",
+                           "oak", "rovere", "plywood", "compensato", "pine", "pino"}),
+        "Hardwood (beech, maple, birch): durable and splinter-resistant; plywood for flat parts.",
+        ("EN71-1 (mechanical)", "EN71-3 for finishes", "ASTM F963"),
+        {"0-2": "Round all edges (r >= 2 mm), finish with food-safe oil or EN71-3 paint, no small detachable parts.",
+         "*": "Sand to 220 grit and round edges; finish with EN71-3 certified coatings."},
+    ),
+    SpecEntry(
+        "paint", frozenset({"paint", "paints", "vernice", "vernici", "colore", "colori", "acrylic", "acrilico",
+                            "lacquer", "lacca", "varnish", "enamel", "smalto", "coating", "finish"}),
+        "Toy paints and finishes: water-based acrylics and lacquers, cured fully before packaging.",
+        ("EN71-3 (heavy-metal migration)", "ASTM F963 §4.3.5 (lead < 90 ppm)"),
+        {"0-2": "Only EN71-3 certified, saliva-resistant paints; toddlers mouth toys.",
+         "*": "Use EN71-3 certified paint; no solvent-based enamels."},
+    ),
+    SpecEntry(
+        "fabric", frozenset({"fabric", "tessuto", "cotton", "cotone", "felt", "feltro", "plush", "peluche",
+                             "polyester", "poliestere", "fleece", "stuffing", "imbottitura"}),
+        "Toy fabrics: cotton, felt, minky/polyester plush with polyester fibre stuffing.",
+        ("EN71-2 (flammability)", "EN71-1", "OEKO-TEX Standard 100"),
+        {"0-2": "Embroider eyes and noses instead of buttons; double-stitch seams, no loose fibres.",
+         "*": "Double-stitched seams; attached parts must withstand a 90 N pull test."},
+    ),
+    SpecEntry(
+        "leather", frozenset({"leather", "pelle", "cuoio", "suede", "scamosciato"}),
+        "Leather: vegetable-tanned for toys, sealed edges; 1.5-3 mm thickness for straps and cases.",
+        ("EN71-3", "REACH chromium VI < 3 mg/kg"),
+        {"0-2": "Not recommended for toys that get mouthed.", "*": "Use vegetable-tanned, chrome-free leather."},
+    ),
+    SpecEntry(
+        "glass", frozenset({"glass", "vetro", "crystal", "cristallo"}),
+        "Glass: brittle, only tempered or borosilicate glass in gifts; acrylic (PMMA) is the safe substitute.",
+        ("EN71-1 §8.5 (glass)",),
+        {"0-2": "Not allowed: use acrylic.", "3-5": "Not allowed: use acrylic.",
+         "6-8": "Avoid: use acrylic or polycarbonate.", "*": "Tempered glass only, no accessible sharp edges."},
+    ),
+    SpecEntry(
+        "ceramic", frozenset({"ceramic", "ceramica", "clay", "argilla", "porcelain", "porcellana", "terracotta"}),
+        "Ceramics: kiln-fired at 1000-1250°C, lead-free glazes; fragile when dropped.",
+        ("EN71-3", "lead/cadmium-free glazes (EU 84/500/EEC)"),
+        {"0-2": "Avoid: breaks into sharp shards.", "*": "Lead-free glaze, thick walls, smoothed rims."},
+    ),
+    SpecEntry(
+        "metal", frozenset({"metal", "metallo", "steel", "acciaio", "iron", "ferro", "aluminum", "aluminium",
+                            "alluminio", "brass", "ottone", "copper", "rame"}),
+        "Metals: stainless steel and aluminium for toys, deburred and rust-proofed; brass for decorative parts.",
+        ("EN71-1 (sharp edges/points)", "EN71-3", "ASTM F963 §4.7-4.9"),
+        {"0-2": "Avoid small metal parts; all edges rolled or covered.",
+         "*": "Deburr all edges and points; nickel-free plating for skin contact."},
+    ),
+    SpecEntry(
+        "battery", frozenset({"battery", "batteries", "batteria", "batterie", "pila", "pile", "lipo", "cell",
+                              "aa", "aaa", "cr2032"}),
+        "Batteries: AA/AAA alkaline or protected Li-ion packs; button cells only when unavoidable.",
+        ("EN62115 (electric toys)", "ASTM F963 §4.25", "16 CFR 1263 (button cells)"),
+        {"0-2": "Screw-secured compartment mandatory; no button cells.",
+         "3-5": "Screw-secured compartment mandatory; no button cells.",
+         "6-8": "Screw-secured compartment mandatory.",
+         "*": "Protected cells with charging circuit; compartment closed with a screw under 14."},
+    ),
+    SpecEntry(
+        "magnet", frozenset({"magnet", "magnets", "magnete", "magneti", "calamita", "calamite", "magnetic"}),
+        "Magnets: neodymium magnets fully enclosed and glued/overmoulded in the part.",
+        ("EN71-1 §8.37 (magnets)", "ASTM F963 §4.38", "16 CFR 1262"),
+        {"0-2": "No loose or small magnets.", "*": "Magnets must not detach; magnetic flux index < 50 kG²mm² if accessible."},
+    ),
+    SpecEntry(
+        "electronics", frozenset({"electronics", "elettronica", "led", "leds", "pcb", "circuit", "circuito", "motor",
+                                  "motore", "wire", "wiring", "cavo", "speaker", "sensor", "arduino", "microcontroller"}),
+        "Toy electronics: ≤ 24 V DC supply, insulated wiring, strain-relieved cables, enclosed PCBs.",
+        ("EN62115", "EN IEC 62368-1 for chargers", "RoHS", "CE/FCC marking"),
+        {"0-2": "Only fully sealed units without accessible wires.", "*": "Enclose PCBs; surface temperature < 60°C."},
+    ),
+    SpecEntry(
+        "en71", frozenset({"en71", "en", "71", "ce"}),
+        "EN71: EU toy safety standard. Part 1 mechanical/physical, part 2 flammability, part 3 migration of elements.",
+        ("EN71-1", "EN71-2", "EN71-3", "Toy Safety Directive 2009/48/EC"),
+        {"0-2": "Under 36 months: no parts that fit the small-parts cylinder (EN71-1 §8.2)."},
+    ),
+    SpecEntry(
+        "astm", frozenset({"astm", "f963", "cpsia", "cpsc"}),
+        "ASTM F963: US toy safety specification (mechanical, flammability, heavy metals, batteries, magnets).",
+        ("ASTM F963-23", "CPSIA lead limits"),
+        {"0-2": "Small-parts rule 16 CFR 1501 applies under 3."},
+    ),
+    SpecEntry(
+        "small_parts", frozenset({"choking", "soffocamento", "cylinder", "1501"}),
+        "Small-parts test: a part fitting a 31.7 mm diameter, 57.1 mm deep cylinder is a choking hazard.",
+        ("16 CFR 1501", "EN71-1 §8.2"),
+        {"0-2": "Not allowed under 36 months.", "3-5": "Allowed with a choking-hazard warning label.",
+         "*": "No restriction, warning label if the gift may reach younger siblings."},
+    ),
+]
@@ -0,0 +1,457 @@
+"""Durable outbox (SQLite) for response emails, delivered by a background sender."""
+
+import atexit
+import base64
+import io
+import logging
+import random
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from email.mime.image import MIMEImage
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from pathlib import Path
+from typing import Any, Callable
+
+from elfactory.core.state import WorkshopState
+
+logger = logging.getLogger("elfactory.outbox")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    gift_id TEXT,
+    recipient TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    html_body TEXT NOT NULL,
+    image_path TEXT,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    lease_until REAL,
+    last_error TEXT,
+    gmail_id TEXT,
+    created_at TEXT NOT NULL,
+    sent_at TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS outbox_gift_id ON outbox (gift_id);
+CREATE TABLE IF NOT EXISTS outbox_deliveries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    outbox_id INTEGER NOT NULL,
+    gift_id TEXT,
+    status TEXT NOT NULL,
+    details TEXT NOT NULL,
+    at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_deliveries_gift_id ON outbox_deliveries (gift_id);
+"""
+
+# queued/retrying: waiting to be sent; sending: leased by a sender; sent/failed: final
+PENDING_STATUSES = ("queued", "retrying")
+LEASE_SECONDS = 120  # A sender that crashed mid-batch releases its messages after this
+PERMANENT_HTTP_ERRORS = {400, 404}
+# Larger messages are sent as a media upload (the MIME bytes as they are) instead of a base64 "raw" field
+MEDIA_UPLOAD_MIN_BYTES = 64 * 1024
+RESUMABLE_UPLOAD_MIN_BYTES = 5 * 1024 * 1024
+
+Transport = Callable[[bytes], str]
+
+
+def build_message(recipient: str, subject: str, html_body: str, image_path: str | None = None) -> bytes:
+    """
+    MIME message of a gift response, with the gift image inline when it exists.
+
+    Args:
+        recipient: Email address of the recipient
+        subject: Email subject line
+        html_body: HTML body; [IMAGE_PLACEHOLDER] is replaced by the image
+        image_path: Optional image to embed (PNG, JPEG or WebP)
+
+    Returns:
+        The message bytes
+    """
+    from elfactory.services.email_images import mime_subtype
+
+    message = MIMEMultipart('related')
+    message['To'] = recipient
+    message['Subject'] = subject
+
+    has_image = bool(image_path) and Path(image_path).exists()
+    if has_image:
+        html_body = html_body.replace(
+            '[IMAGE_PLACEHOLDER]', '<img src="cid:gift_image" style="max-width: 600px; height: auto;" />'
+        )
+
+    # IMPORTANT: Attach HTML BEFORE images for proper inline display
+    message.attach(MIMEText(html_body, 'html'))
+
+    if has_image:
+        image = MIMEImage(Path(image_path).read_bytes(), _subtype=mime_subtype(image_path))
+        image.add_header('Content-ID', '<gift_image>')
+        image.add_header('Content-Disposition', 'inline', filename=f'gift{Path(image_path).suffix}')
+        message.attach(image)
+    return message.as_bytes()
+
+
+class GmailTransport:
+    """
+    Sends messages with one GmailService, authenticated on first use and then reused.
+
+    Small messages go in the base64url "raw" field. Larger ones (usually with
+    an image, already base64 inside the MIME message) are sent through the
+    media upload endpoint as they are, which avoids encoding them a second
+    time and saves about a third of the upload.
+    """
+
+    def __init__(self):
+        self._gmail = None
+
+    def __call__(self, raw: bytes) -> str:
+        if self._gmail is None:
+            from elfactory.services.gmail_service import GmailService
+
+            self._gmail = GmailService()
+        messages = self._gmail.service.users().messages()
+        if len(raw) >= MEDIA_UPLOAD_MIN_BYTES:
+            from googleapiclient.http import MediaIoBaseUpload
+
+            media = MediaIoBaseUpload(
+                io.BytesIO(raw), mimetype="message/rfc822", resumable=len(raw) >= RESUMABLE_UPLOAD_MIN_BYTES
+            )
+            request = messages.send(userId="me", body={}, media_body=media)
+        else:
+            request = messages.send(userId="me", body={"raw": base64.urlsafe_b64encode(raw).decode("utf-8")})
+        return request.execute().get("id", "")
+
+
+def _is_permanent(error: Exception) -> bool:
+    """Errors that a retry cannot fix (e.g. an invalid recipient)."""
+    status = getattr(getattr(error, "resp", None), "status", None)
+    if status is not None:
+        return int(status) in PERMANENT_HTTP_ERRORS
+    return isinstance(error, (ValueError, FileNotFoundError))
+
+
+class Outbox:
+    """
+    Response emails queued in SQLite and delivered by a background thread.
+
+    enqueue() only inserts a row, so the composer's tool call returns at
+    once. The sender leases due messages in batches (safe with several
+    processes on the same database), sends them over one Gmail connection,
+    and retries failures with exponential backoff and jitter until
+    max_attempts.
+
+    Every outcome is recorded in outbox_deliveries in the same transaction
+    as the message's status, so the delivery history of a gift survives
+    restarts (see deliveries()). While the gift's session is still running
+    the outcome is also written to its WorkshopState (email_delivery, a log
+    entry and, on failure, an issue), where the event log persists it; a
+    closed session's state is not touched.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        transport: Transport | None = None,
+        max_attempts: int = 6,
+        retry_base_seconds: float = 30.0,
+        batch_size: int = 20,
+    ):
+        """
+        Args:
+            path: Database file, created if missing
+            transport: Sends raw MIME bytes and returns the provider message id
+                (defaults to GmailTransport)
+            max_attempts: Attempts before a message is marked failed
+            retry_base_seconds: Delay before the first retry, doubled on each attempt
+            batch_size: Messages leased per round
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.transport = transport or GmailTransport()
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.batch_size = batch_size
+        self._local = threading.local()
+        self._states: dict[int, WorkshopState] = {}
+        self._states_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._idle = threading.Condition()
+        self._busy = False
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        with self.connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def connection(self) -> sqlite3.Connection:
+        """Connection of the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def enqueue(
+        self,
+        recipient: str,
+        subject: str,
+        html_body: str,
+        image_path: str | None = None,
+        state: WorkshopState | None = None,
+    ) -> int:
+        """
+        Queue an email and wake the sender.
+
+        Args:
+            recipient: Email address of the recipient
+            subject: Email subject line
+            html_body: HTML formatted email body
+            image_path: Optional gift image to embed
+            state: Gift to write the delivery status back to
+
+        Returns:
+            Outbox id of the message
+        """
+        if state is not None:
+            state.set_field("email_delivery", "queued")
+        gift_id = state.gift_id if state else None
+        # Registered before the sender can report on the message
+        with self._states_lock, self._transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO outbox (gift_id, recipient, subject, html_body, image_path, next_attempt_at, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (gift_id, recipient, subject, html_body, image_path, time.time(), datetime.now().isoformat()),
+            )
+            outbox_id = cursor.lastrowid
+            self._record_delivery(conn, outbox_id, gift_id, "queued", f"Queued for {recipient}: {subject}")
+            if state is not None:
+                self._states[outbox_id] = state
+        self.start()
+        self._wake.set()
+        return outbox_id
+
+    @contextmanager
+    def _transaction(self):
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _record_delivery(conn: sqlite3.Connection, outbox_id: int, gift_id: str | None, status: str,
+                         details: str) -> None:
+        conn.execute(
+            "INSERT INTO outbox_deliveries (outbox_id, gift_id, status, details, at) VALUES (?, ?, ?, ?, ?)",
+            (outbox_id, gift_id, status, details, datetime.now().isoformat()),
+        )
+
+    def start(self) -> None:
+        """Start the sender thread if it is not running."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="outbox-sender", daemon=True)
+                self._thread.start()
+
+    def _lease(self) -> list[tuple]:
+        """Mark a batch of due messages as sending by this process and return them."""
+        now = time.time()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, gift_id, recipient, subject, html_body, image_path, attempts FROM outbox"
+                " WHERE (status IN (?, ?) AND next_attempt_at <= ?) OR (status = 'sending' AND lease_until < ?)"
+                " ORDER BY next_attempt_at LIMIT ?",
+                (*PENDING_STATUSES, now, now, self.batch_size),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE outbox SET status = 'sending', lease_until = ? WHERE id = ?",
+                [(now + LEASE_SECONDS, row[0]) for row in rows],
+            )
+        return rows
+
+    def _next_due(self) -> float | None:
+        row = self.connection().execute(
+            "SELECT MIN(next_attempt_at) FROM outbox WHERE status IN (?, ?)", PENDING_STATUSES
+        ).fetchone()
+        return row[0]
+
+    def _deliver(self, row: tuple) -> str:
+        outbox_id, gift_id, recipient, subject, html_body, image_path, attempts = row
+        attempts += 1
+        try:
+            if image_path and Path(image_path).exists():
+                image_path = self._email_image(image_path)
+            gmail_id = self.transport(build_message(recipient, subject, html_body, image_path))
+        except Exception as e:
+            final = attempts >= self.max_attempts or _is_permanent(e)
+            status = "failed" if final else "retrying"
+            delay = self.retry_base_seconds * 2 ** (attempts - 1) * random.uniform(0.8, 1.2)
+            details = f"Attempt {attempts} to {recipient} failed: {e}" + ("" if final else f"; retrying in {delay:.0f}s")
+            with self._transaction() as conn:
+                conn.execute(
+                    "UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, lease_until = NULL,"
+                    " last_error = ? WHERE id = ?",
+                    (status, attempts, time.time() + delay, f"{type(e).__name__}: {e}", outbox_id),
+                )
+                self._record_delivery(conn, outbox_id, gift_id, status, details)
+            logger.warning(f"Email {outbox_id} to {recipient} ({gift_id}) attempt {attempts} failed: {e}")
+            self._report(outbox_id, status, details)
+            return status
+
+        details = f"Email sent to {recipient} with subject: {subject}"
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE outbox SET status = 'sent', attempts = ?, lease_until = NULL, gmail_id = ?, sent_at = ?"
+                " WHERE id = ?",
+                (attempts, gmail_id, datetime.now().isoformat(), outbox_id),
+            )
+            self._record_delivery(conn, outbox_id, gift_id, "sent", details)
+        logger.info(f"Email {outbox_id} sent to {recipient} ({gift_id})")
+        self._report(outbox_id, "sent", details)
+        return "sent"
+
+    @staticmethod
+    def _email_image(image_path: str) -> str:
+        """Email-sized copy of the image (cached after generate_gift_image), else the image itself."""
+        from elfactory.services.email_images import prepare_email_images
+
+        try:
+            return str(prepare_email_images(image_path)[0])
+        except Exception as e:
+            logger.warning(f"Attaching the original image {image_path}: {e}")
+            return image_path
+
+    def _report(self, outbox_id: int, status: str, details: str) -> None:
+        from elfactory.tools.state_tools import active_gifts
+
+        with self._states_lock:
+            state = self._states.pop(outbox_id, None) if status in ("sent", "failed") else self._states.get(outbox_id)
+        if state is None or active_gifts.get(state.gift_id) is not state:
+            # The session has closed: its event log is detached, outbox_deliveries has the outcome
+            return
+        state.set_field("email_delivery", status)
+        state.log_action(agent="email_outbox", action=f"email_{status}", details=details)
+        if status == "failed":
+            state.add_issue(reported_by="email_outbox", severity="high", description=details)
+
+    def deliver_due(self) -> dict[str, int]:
+        """
+        Send every message due now, batch by batch.
+
+        Returns:
+            Number of messages per outcome (sent, retrying, failed)
+        """
+        outcomes: dict[str, int] = {}
+        while True:
+            rows = self._lease()
+            if not rows:
+                return outcomes
+            for row in rows:
+                status = self._deliver(row)
+                outcomes[status] = outcomes.get(status, 0) + 1
+
+    def _run(self) -> None:
+        while True:
+            with self._idle:
+                self._busy = True
+            try:
+                self.deliver_due()
+                next_due = self._next_due()
+            except Exception as e:
+                logger.error(f"Outbox sender error: {e}")
+                next_due = time.time() + self.retry_base_seconds
+            finally:
+                with self._idle:
+                    self._busy = False
+                    self._idle.notify_all()
+            timeout = None if next_due is None else max(0.0, next_due - time.time())
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """
+        Block until the messages due now have had a delivery attempt.
+
+        Args:
+            timeout: Seconds to wait at most
+
+        Returns:
+            True when nothing is due any more (retries scheduled later do not count)
+        """
+        if self._thread is None:
+            return True
+        deadline = time.monotonic() + timeout
+        self._wake.set()
+        with self._idle:
+            while time.monotonic() < deadline:
+                next_due = self._next_due()
+                if not self._busy and (next_due is None or next_due > time.time()):
+                    return True
+                self._idle.wait(min(0.1, max(0.0, deadline - time.monotonic())))
+        return False
+
+    def status(self, outbox_id: int) -> dict[str, Any] | None:
+        """Delivery record of a message."""
+        cursor = self.connection().execute("SELECT * FROM outbox WHERE id = ?", (outbox_id,))
+        row = cursor.fetchone()
+        return dict(zip([c[0] for c in cursor.description], row)) if row else None
+
+    def deliveries(self, gift_id: str) -> list[dict[str, Any]]:
+        """
+        Delivery history of a gift's emails, oldest first.
+
+        Args:
+            gift_id: Gift ID
+
+        Returns:
+            Records with outbox_id, status (queued, retrying, sent or failed), details and at
+        """
+        rows = self.connection().execute(
+            "SELECT outbox_id, status, details, at FROM outbox_deliveries WHERE gift_id = ? ORDER BY id",
+            (gift_id,),
+        ).fetchall()
+        return [dict(zip(("outbox_id", "status", "details", "at"), row)) for row in rows]
+
+    def counts(self) -> dict[str, int]:
+        """Number of messages per status."""
+        return dict(self.connection().execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall())
+
+
+_outbox: Outbox | None = None
+_outbox_lock = threading.Lock()
+
+
+def get_outbox() -> Outbox:
+    """Process-wide outbox configured from settings, flushed at interpreter exit."""
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            from elfactory.config import settings
+
+            _outbox = Outbox(
+                settings.outbox_path,
+                max_attempts=settings.outbox_max_attempts,
+                retry_base_seconds=settings.outbox_retry_base_seconds,
+                batch_size=settings.outbox_batch_size,
+            )
+            atexit.register(_outbox.flush)
+            if _outbox._next_due() is not None:
+                # Messages left by a previous run
+                _outbox.start()
+        return _outbox
+
+
+def flush_outbox(timeout: float = 30.0) -> None:
+    """Flush the process-wide outbox if this process used it."""
+    if _outbox is not None:
+        _outbox.flush(timeout)
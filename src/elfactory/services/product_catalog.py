@@ -0,0 +1,187 @@
+"""Local product catalog searched before the web on the online-shopping path."""
+
+import csv
+import json
+import logging
+import math
+import re
+import threading
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+
+logger = logging.getLogger("elfactory.catalog")
+
+STOPWORDS = {
+    "a", "an", "the", "of", "for", "and", "with", "to", "in", "year", "years", "old", "kids", "kid",
+    "il", "lo", "la", "i", "gli", "le", "un", "uno", "una", "di", "da", "per", "con", "e", "anni", "bambino",
+    "bambina", "bambini",
+}
+NO_MAX_AGE = 99
+_WORD = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase words without stopwords, in order, without duplicates."""
+    return list(dict.fromkeys(w for w in _WORD.findall(text.lower()) if w not in STOPWORDS))
+
+
+def _number(value: Any, default: float) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value).replace(",", ".").replace("€", "").strip())
+    except (TypeError, ValueError):
+        return default
+
+
+class ProductCatalog:
+    """
+    Products with an inverted index over name and category words, plus age
+    and price columns.
+
+    Postings are NumPy arrays of row numbers. A query adds the IDF of each
+    query word to the score of the rows posting it, keeps the rows matching
+    enough of the query's weight and applies the age and price filters on
+    those candidates only.
+    """
+
+    FIELDS = ("id", "name", "category", "url", "retailer", "currency")
+
+    def __init__(self, items: Iterable[dict[str, Any]]):
+        """
+        Args:
+            items: Dicts with name (or title), and optionally id/sku, category,
+                age_min, age_max, price, currency, url, retailer
+        """
+        columns: dict[str, list[str]] = {field: [] for field in self.FIELDS}
+        age_min, age_max, price = [], [], []
+        postings: dict[str, list[int]] = {}
+        row = 0
+        for item in items:
+            name = str(item.get("name") or item.get("title") or "").strip()
+            if not name:
+                continue
+            category = str(item.get("category") or "")
+            columns["id"].append(str(item.get("id") or item.get("sku") or row))
+            columns["name"].append(name)
+            columns["category"].append(category)
+            columns["url"].append(str(item.get("url") or item.get("href") or ""))
+            columns["retailer"].append(str(item.get("retailer") or ""))
+            columns["currency"].append(str(item.get("currency") or "EUR"))
+            age_min.append(_number(item.get("age_min", item.get("min_age")), 0))
+            age_max.append(_number(item.get("age_max", item.get("max_age")), NO_MAX_AGE))
+            price.append(_number(item.get("price"), math.nan))
+            for word in set(_WORD.findall(f"{name} {category}".lower())) - STOPWORDS:
+                postings.setdefault(word, []).append(row)
+            row += 1
+
+        self.columns = columns
+        self.size = row
+        self.age_min = np.array(age_min, dtype=np.float32)
+        self.age_max = np.array(age_max, dtype=np.float32)
+        self.price = np.array(price, dtype=np.float32)
+        self.index = {word: np.array(rows, dtype=np.int32) for word, rows in postings.items()}
+        self.max_idf = math.log(self.size + 1)
+        self.idf = {word: math.log((self.size + 1) / len(rows)) for word, rows in self.index.items()}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def row(self, i: int) -> dict[str, Any]:
+        """Product at row i."""
+        return {
+            **{field: self.columns[field][i] for field in self.FIELDS},
+            "age_min": int(self.age_min[i]),
+            "age_max": int(self.age_max[i]),
+            "price": None if math.isnan(self.price[i]) else round(float(self.price[i]), 2),
+        }
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ProductCatalog":
+        """Load a .jsonl (one product per line) or .csv (header row) catalog."""
+        path = Path(path)
+        with path.open(encoding="utf-8", newline="") as f:
+            if path.suffix.lower() == ".csv":
+                catalog = cls(csv.DictReader(f))
+            else:
+                catalog = cls(json.loads(line) for line in f if line.strip())
+        logger.info(f"Loaded {len(catalog)} catalog products from {path}")
+        return catalog
+
+    def search(
+        self,
+        query: str,
+        age: int | None = None,
+        max_price: float | None = None,
+        limit: int = 5,
+        min_match: float = 0.6,
+    ) -> list[dict[str, Any]]:
+        """
+        Best products for a query.
+
+        Args:
+            query: Product query (e.g. "LEGO Star Wars astronave")
+            age: Only products whose age range includes this age
+            max_price: Only products up to this price (unpriced ones excluded)
+            limit: Maximum number of products
+            min_match: Share of the query's word weight (IDF) a product must
+                match; unknown words count with the maximum weight
+
+        Returns:
+            Products with their score, best first; [] is a miss
+        """
+        words = tokenize(query)
+        known = [word for word in words if word in self.index]
+        if not known:
+            return []
+        total = sum(self.idf.get(word, self.max_idf) for word in words)
+
+        scores = np.zeros(self.size, dtype=np.float32)
+        for word in known:
+            scores[self.index[word]] += self.idf[word]  # postings have no duplicates
+        candidates = np.flatnonzero(scores >= min_match * total - 1e-6)
+        if age is not None:
+            candidates = candidates[(self.age_min[candidates] <= age) & (self.age_max[candidates] >= age)]
+        if max_price is not None:
+            candidates = candidates[self.price[candidates] <= max_price]
+        if not len(candidates):
+            return []
+
+        candidate_scores = scores[candidates]
+        if len(candidates) > limit:
+            top = np.argpartition(-candidate_scores, limit - 1)[:limit]
+            candidates, candidate_scores = candidates[top], candidate_scores[top]
+        # Best score first, cheaper first on ties
+        order = np.lexsort((np.nan_to_num(self.price[candidates], nan=np.inf), -candidate_scores))
+        return [
+            {**self.row(int(candidates[i])), "score": round(float(candidate_scores[i]) / total, 3)}
+            for i in order
+        ]
+
+
+_catalog: ProductCatalog | None = None
+_catalog_loaded = False
+_catalog_lock = threading.Lock()
+
+
+def get_product_catalog() -> ProductCatalog | None:
+    """
+    Process-wide catalog from settings.product_catalog_path.
+
+    None when not configured, or when the file cannot be loaded (logged
+    once): searches then go to the web only.
+    """
+    global _catalog, _catalog_loaded
+    with _catalog_lock:
+        if not _catalog_loaded:
+            from elfactory.config import settings
+
+            if settings.product_catalog_path:
+                try:
+                    _catalog = ProductCatalog.load(settings.product_catalog_path)
+                except (OSError, ValueError, csv.Error) as e:
+                    logger.error(f"Catalog {settings.product_catalog_path} not loaded, searching the web only: {e}")
+            _catalog_loaded = True
+        return _catalog
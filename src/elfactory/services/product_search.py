@@ -0,0 +1,187 @@
+"""Product search for the online-shopping path: cached, concurrent, pluggable backend."""
+
+import asyncio
+import json
+import logging
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Protocol
+
+from elfactory.services.ttl_cache import TTLCache
+
+logger = logging.getLogger("elfactory.search")
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, punctuation-free, sorted words: "LEGO Star-Wars!" -> "lego star wars"."""
+    return " ".join(sorted(set(_WORD.findall(query.lower()))))
+
+
+class SearchBackend(Protocol):
+    """Something that runs one web search."""
+
+    def search(self, query: str, region: str, max_results: int) -> list[dict[str, str]]:
+        """Results as dicts with title, href and body."""
+        ...
+
+
+class DuckDuckGoBackend:
+    """Live DuckDuckGo text search."""
+
+    def search(self, query: str, region: str, max_results: int) -> list[dict[str, str]]:
+        from ddgs import DDGS
+
+        with DDGS() as ddg:
+            return [
+                {"title": r.get("title", ""), "href": r.get("href", ""), "body": r.get("body", "")}
+                for r in ddg.text(query, region=region, max_results=max_results)
+            ]
+
+
+class CannedBackend:
+    """
+    Offline results from a JSON file {query: [{"title", "href", "body"}, ...]}.
+
+    Queries are matched after normalization; a query without an exact entry
+    gets the entry sharing the most words with it, or no results.
+    """
+
+    def __init__(self, path: str | Path):
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        self.results = {normalize_query(query): results for query, results in data.items()}
+
+    def search(self, query: str, region: str, max_results: int) -> list[dict[str, str]]:
+        key = normalize_query(query)
+        if key not in self.results:
+            words = set(key.split())
+            overlap, key = max(
+                ((len(words & set(candidate.split())), candidate) for candidate in self.results),
+                default=(0, key),
+            )
+            if not overlap:
+                return []
+        return self.results[key][:max_results]
+
+
+class ProductSearch:
+    """
+    Web search with a TTL result cache and concurrent queries.
+
+    Results are cached per normalized query and region, so the same product
+    searched for another child costs nothing. Misses of one batch run in
+    parallel, and identical queries already in flight (from concurrent gifts)
+    are joined instead of issued twice.
+    """
+
+    def __init__(self, backend: SearchBackend, cache: TTLCache, region: str, max_results: int, max_workers: int):
+        """
+        Args:
+            backend: Search implementation (DuckDuckGoBackend, CannedBackend)
+            cache: Result cache
+            region: Search region/locale (e.g. "it-it")
+            max_results: Results per query
+            max_workers: Queries run concurrently
+        """
+        self.backend = backend
+        self.cache = cache
+        self.region = region
+        self.max_results = max_results
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="product-search")
+        self._in_flight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, query: str, region: str) -> str:
+        return f"{region}|{normalize_query(query)}"
+
+    def _run(self, key: str, query: str, region: str) -> list[dict[str, str]]:
+        try:
+            results = self.backend.search(query, region, self.max_results)
+            self.cache.put(key, json.dumps(results, ensure_ascii=False))
+            return results
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def _submit(self, query: str, region: str) -> Future:
+        key = self._key(query, region)
+        cached = self.cache.get(key)
+        with self._lock:
+            if cached is not None:
+                future: Future = Future()
+                future.set_result(json.loads(cached))
+                return future
+            future = self._in_flight.get(key)
+            if future is None:
+                future = self._in_flight[key] = self._pool.submit(self._run, key, query, region)
+            return future
+
+    def search_many(self, queries: list[str], region: str | None = None) -> dict[str, list[dict[str, str]] | str]:
+        """
+        Run several queries at once.
+
+        Args:
+            queries: Candidate queries; duplicates after normalization run once
+            region: Overrides the default region
+
+        Returns:
+            Results per query, or the error message of a failed query
+        """
+        region = region or self.region
+        futures = {query: self._submit(query, region) for query in dict.fromkeys(queries)}
+        results: dict[str, Any] = {}
+        for query, future in futures.items():
+            try:
+                results[query] = future.result()
+            except Exception as e:
+                logger.warning(f"Search failed for {query!r}: {e}")
+                results[query] = f"search failed: {e}"
+        return results
+
+    async def a_search_many(
+        self, queries: list[str], region: str | None = None
+    ) -> dict[str, list[dict[str, str]] | str]:
+        """search_many() for an event loop: awaits the pool's futures instead of blocking on them."""
+        region = region or self.region
+        futures = {query: self._submit(query, region) for query in dict.fromkeys(queries)}
+        outcomes = await asyncio.gather(*map(asyncio.wrap_future, futures.values()), return_exceptions=True)
+        results: dict[str, Any] = {}
+        for query, outcome in zip(futures, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Search failed for {query!r}: {outcome}")
+                outcome = f"search failed: {outcome}"
+            results[query] = outcome
+        return results
+
+    def search(self, query: str, region: str | None = None) -> list[dict[str, str]]:
+        """Results of one query (raises when the backend fails)."""
+        return self._submit(query, region or self.region).result()
+
+
+_product_search: ProductSearch | None = None
+_product_search_lock = threading.Lock()
+
+
+def get_product_search() -> ProductSearch:
+    """Process-wide product search configured from settings."""
+    global _product_search
+    with _product_search_lock:
+        if _product_search is None:
+            from elfactory.config import settings
+
+            backend = CannedBackend(settings.search_canned_path) if settings.search_canned_path else DuckDuckGoBackend()
+            _product_search = ProductSearch(
+                backend,
+                TTLCache(
+                    settings.search_cache_path or None,
+                    ttl_seconds=settings.search_cache_ttl_hours * 3600,
+                    max_entries=settings.search_cache_size,
+                ),
+                region=settings.search_region,
+                max_results=settings.search_max_results,
+                max_workers=settings.search_max_workers,
+            )
+        return _product_search
@@ -0,0 +1,356 @@
+"""Token-bucket rate limiting with adaptive concurrency for provider calls.
+
+All LLM and image calls go through a named RateLimiter ("llm", "image") so
+that the 26 agents share one request/token budget per process. When
+RATE_LIMIT_DIR is set the buckets are kept in lock-protected files in that
+directory, which coordinates every process on the same host.
+"""
+
+import asyncio
+import fcntl
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable
+
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+logger = logging.getLogger("elfactory.rate_limiter")
+
+
+class TokenBucket:
+    """In-process token bucket refilled continuously at rate_per_minute."""
+
+    def __init__(self, rate_per_minute: float, capacity: float | None = None):
+        """
+        Args:
+            rate_per_minute: Sustained refill rate
+            capacity: Maximum burst size (defaults to 10 seconds of refill)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or max(1.0, self.rate * 10)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, amount: float) -> float:
+        """
+        Take amount tokens if available.
+
+        Requests larger than the bucket are admitted once the bucket is full,
+        leaving it in debt, so oversized prompts cannot starve forever.
+
+        Returns:
+            0.0 if the tokens were taken, otherwise seconds to wait before retrying
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            needed = min(amount, self.capacity)
+            if self._tokens >= needed:
+                self._tokens -= amount
+                return 0.0
+            return (needed - self._tokens) / self.rate
+
+    def adjust(self, delta: float) -> None:
+        """Charge (positive) or refund (negative) tokens after the real cost is known."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.capacity, self._tokens - delta)
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket whose state lives in a file shared by several processes."""
+
+    def __init__(self, path: Path, rate_per_minute: float, capacity: float | None = None):
+        """
+        Args:
+            path: State file, created on first use
+            rate_per_minute: Sustained refill rate shared by all processes
+            capacity: Maximum burst size (defaults to 10 seconds of refill)
+        """
+        super().__init__(rate_per_minute, capacity)
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+
+    @contextmanager
+    def _locked_state(self):
+        with self._lock, open(self.path, "r+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                raw = f.read()
+                data = json.loads(raw) if raw else {}
+                self._tokens = data.get("tokens", self.capacity)
+                self._updated = data.get("updated", time.time())
+                self._refill(time.time())
+                yield
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps({"tokens": self._tokens, "updated": self._updated}))
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def try_acquire(self, amount: float) -> float:
+        with self._locked_state():
+            needed = min(amount, self.capacity)
+            if self._tokens >= needed:
+                self._tokens -= amount
+                return 0.0
+            return (needed - self._tokens) / self.rate
+
+    def adjust(self, delta: float) -> None:
+        with self._locked_state():
+            self._tokens = min(self.capacity, self._tokens - delta)
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limit: +1/limit per success, halved on overload."""
+
+    def __init__(self, initial: int, maximum: int, minimum: int = 1):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def try_enter(self) -> bool:
+        """Reserve a slot if the current limit allows it."""
+        with self._lock:
+            if self.in_flight < int(self.limit):
+                self.in_flight += 1
+                return True
+            return False
+
+    def exit(self, overloaded: bool = False) -> None:
+        """
+        Release a slot and adapt the limit.
+
+        Args:
+            overloaded: True when the call failed with 429/5xx
+        """
+        with self._lock:
+            self.in_flight -= 1
+            if overloaded:
+                self.limit = max(self.minimum, self.limit / 2)
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+
+def _status_code(exc: BaseException) -> int | None:
+    return getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+
+
+def is_overload_error(exc: BaseException) -> bool:
+    """True for provider throttling (429) and server errors (5xx)."""
+    status = _status_code(exc)
+    return status is not None and (status == 429 or status >= 500)
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """True for errors worth retrying: overloads, timeouts and connection drops."""
+    if is_overload_error(exc):
+        return True
+    return type(exc).__name__ in ("APIConnectionError", "APITimeoutError", "ConnectionError", "Timeout")
+
+
+class RateLimiter:
+    """Request and token budgets plus adaptive concurrency for one provider endpoint."""
+
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: float,
+        tokens_per_minute: float | None = None,
+        max_concurrency: int = 8,
+        max_attempts: int = 5,
+        state_dir: str = "",
+    ):
+        """
+        Args:
+            name: Limiter name, used for logging and state file names
+            requests_per_minute: Request quota
+            tokens_per_minute: Token quota (None disables token accounting)
+            max_concurrency: Upper bound for the adaptive concurrency limit
+            max_attempts: Attempts per call, including the first one
+            state_dir: Directory for cross-process bucket files (empty = in-process)
+        """
+        self.name = name
+        self.max_attempts = max_attempts
+        # File buckets wait on flock, which must not run on an event loop thread
+        self.shared = bool(state_dir)
+        if state_dir:
+            base = Path(state_dir)
+            self.requests = FileTokenBucket(base / f"{name}_requests.json", requests_per_minute)
+            self.tokens = (
+                FileTokenBucket(base / f"{name}_tokens.json", tokens_per_minute)
+                if tokens_per_minute else None
+            )
+        else:
+            self.requests = TokenBucket(requests_per_minute)
+            self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.concurrency = AdaptiveConcurrency(
+            initial=max(1, max_concurrency // 2), maximum=max_concurrency
+        )
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Take a concurrency slot, a request and tokens, or return the wait time."""
+        if not self.concurrency.try_enter():
+            return self.POLL_INTERVAL
+        wait = self.requests.try_acquire(1)
+        if wait == 0.0 and self.tokens is not None:
+            wait = self.tokens.try_acquire(tokens)
+            if wait > 0.0:
+                self.requests.adjust(-1)
+        if wait > 0.0:
+            self.concurrency.exit()
+            # Jitter so that waiting callers do not wake up in lockstep
+            return wait * random.uniform(1.0, 1.2)
+        return 0.0
+
+    def acquire(self, tokens: int = 0) -> None:
+        """
+        Block until the call may proceed.
+
+        Only for threads of their own: on datapizza's shared event loop (sub-agents
+        and their tools) this would stall every gift, use a_acquire() there.
+        """
+        while (wait := self._try_acquire(tokens)) > 0.0:
+            time.sleep(wait)
+
+    async def a_acquire(self, tokens: int = 0) -> None:
+        """Wait without blocking the event loop until the call may proceed."""
+        while (wait := await self._a_try_acquire(tokens)) > 0.0:
+            await asyncio.sleep(wait)
+
+    async def _a_try_acquire(self, tokens: int) -> float:
+        if self.shared:
+            return await asyncio.to_thread(self._try_acquire, tokens)
+        return self._try_acquire(tokens)
+
+    async def a_release(self, estimated_tokens: int = 0, actual_tokens: int | None = None,
+                        error: BaseException | None = None) -> None:
+        """release() without blocking the event loop on the shared bucket files."""
+        if self.shared:
+            await asyncio.to_thread(self.release, estimated_tokens, actual_tokens, error)
+        else:
+            self.release(estimated_tokens, actual_tokens, error)
+
+    def release(self, estimated_tokens: int = 0, actual_tokens: int | None = None,
+                error: BaseException | None = None) -> None:
+        """
+        Release the concurrency slot and reconcile the token estimate.
+
+        Args:
+            estimated_tokens: Tokens reserved by acquire()
+            actual_tokens: Tokens reported by the provider, if known
+            error: Exception raised by the call, if any
+        """
+        overloaded = error is not None and is_overload_error(error)
+        self.concurrency.exit(overloaded=overloaded)
+        if overloaded:
+            logger.warning(
+                f"[{self.name}] Provider overloaded ({type(error).__name__}), "
+                f"concurrency limit now {self.concurrency.limit:.1f}"
+            )
+        if self.tokens is not None and actual_tokens is not None:
+            self.tokens.adjust(actual_tokens - estimated_tokens)
+
+    def _retrying_kwargs(self) -> dict[str, Any]:
+        return {
+            "retry": retry_if_exception(is_retryable_error),
+            "wait": wait_random_exponential(multiplier=1, max=30),
+            "stop": stop_after_attempt(self.max_attempts),
+            "reraise": True,
+        }
+
+    def call(self, func: Callable[..., Any], *args, estimated_tokens: int = 0,
+             usage: Callable[[Any], int | None] | None = None, **kwargs) -> Any:
+        """
+        Run func under the limiter, retrying throttled or failed attempts with jitter.
+
+        Args:
+            func: Function performing the provider call
+            estimated_tokens: Tokens to reserve before the call
+            usage: Optional function returning the real token count from the result
+
+        Returns:
+            The result of func
+        """
+        for attempt in Retrying(**self._retrying_kwargs()):
+            with attempt:
+                self.acquire(estimated_tokens)
+                try:
+                    result = func(*args, **kwargs)
+                except BaseException as e:
+                    self.release(estimated_tokens, error=e)
+                    raise
+                self.release(estimated_tokens, usage(result) if usage else None)
+        return result
+
+    async def a_call(self, func: Callable[..., Any], *args, estimated_tokens: int = 0,
+                     usage: Callable[[Any], int | None] | None = None, **kwargs) -> Any:
+        """Async variant of call() for coroutine functions."""
+        async for attempt in AsyncRetrying(**self._retrying_kwargs()):
+            with attempt:
+                await self.a_acquire(estimated_tokens)
+                try:
+                    result = await func(*args, **kwargs)
+                except BaseException as e:
+                    await self.a_release(estimated_tokens, error=e)
+                    raise
+                await self.a_release(estimated_tokens, usage(result) if usage else None)
+        return result
+
+
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str) -> RateLimiter:
+    """
+    Get or create the process-wide limiter for an endpoint.
+
+    Args:
+        name: "llm" for chat/agent calls, "image" for image generation
+
+    Returns:
+        The shared RateLimiter configured from settings
+    """
+    with _limiters_lock:
+        if name not in _limiters:
+            from elfactory.config import settings
+
+            if name == "image":
+                _limiters[name] = RateLimiter(
+                    name,
+                    requests_per_minute=settings.image_requests_per_minute,
+                    max_concurrency=settings.image_max_concurrency,
+                    max_attempts=settings.rate_limit_max_attempts,
+                    state_dir=settings.rate_limit_dir,
+                )
+            else:
+                _limiters[name] = RateLimiter(
+                    name,
+                    requests_per_minute=settings.llm_requests_per_minute,
+                    tokens_per_minute=settings.llm_tokens_per_minute,
+                    max_concurrency=settings.llm_max_concurrency,
+                    max_attempts=settings.rate_limit_max_attempts,
+                    state_dir=settings.rate_limit_dir,
+                )
+        return _limiters[name]
@@ -0,0 +1,292 @@
+"""Background manufacturing report writer (Markdown, JSON and HTML)."""
+
+import atexit
+import html
+import json
+import logging
+import os
+import queue
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator
+
+from elfactory.config import settings
+from elfactory.core.state import TERMINAL_STATUSES, WorkshopState
+
+logger = logging.getLogger("elfactory.reports")
+
+FORMATS = ("md", "json", "html")
+
+
+def _agents(state: WorkshopState) -> list[str]:
+    agents = {component.created_by for component in state.components if component.created_by}
+    agents.update(entry.agent for entry in state.manufacturing_log if entry.agent)
+    return sorted(agents)
+
+
+def markdown_sections(state: WorkshopState) -> Iterator[str]:
+    """Yield the Markdown report one section at a time."""
+    child = state.child_info
+    yield (
+        f"# Manufacturing Report - Gift {state.gift_id}\n"
+        f"\n**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        f"\n**Status:** {state.status}\n"
+        "\n---\n\n"
+    )
+    yield (
+        "## Child Information\n"
+        f"- **Name:** {child.name if child else 'Unknown'}\n"
+        f"- **Age:** {child.age if child else 'Unknown'}\n"
+        f"- **Location:** {child.location if child else 'Unknown'}\n"
+        "\n---\n\n"
+    )
+    yield f"## Gift Request\n\n{state.gift_request}\n\n---\n\n"
+
+    yield "## Components Created\n"
+    if state.components:
+        yield f"\n**Total Components:** {len(state.components)}\n"
+        for i, component in enumerate(state.components, 1):
+            yield (
+                f"\n### {i}. {component.id}\n"
+                f"- **Type:** {component.type}\n"
+                f"- **Material:** {component.material}\n"
+                f"- **Dimensions:** {component.dimensions}\n"
+                f"- **Created by:** {component.created_by}\n"
+                f"- **Status:** {component.status}\n"
+                + (f"- **Details:** {component.details}\n" if component.details else "")
+            )
+    else:
+        yield "\n*No components registered*\n"
+    yield "\n---\n\n"
+
+    agents = _agents(state)
+    yield "## Collaborating Agents\n" f"\n**Total Agents:** {len(agents)}\n\n"
+    yield "".join(f"- {agent}\n" for agent in agents)
+    yield "\n---\n\n"
+
+    yield "## Manufacturing Log\n"
+    if state.manufacturing_log:
+        yield f"\n**Total Actions:** {len(state.manufacturing_log)}\n"
+        for i, entry in enumerate(state.manufacturing_log, 1):
+            yield f"\n{i}. **[{entry.timestamp}]** {entry.agent} - {entry.action}\n" + (
+                f"   - {entry.details}\n" if entry.details else ""
+            )
+    else:
+        yield "\n*No actions logged*\n"
+    yield "\n---\n\n"
+
+    if state.issues:
+        yield "## Issues Reported\n" f"\n**Total Issues:** {len(state.issues)}\n"
+        for i, issue in enumerate(state.issues, 1):
+            yield (
+                f"\n{i}. **[{issue.severity.upper()}]** {issue.reported_by}\n"
+                f"   - {issue.description}\n"
+                f"   - *Reported at: {issue.timestamp}*\n"
+            )
+        yield "\n---\n\n"
+
+    yield "*Report generated by Elfactory Manufacturing System*\n"
+
+
+def html_sections(state: WorkshopState) -> Iterator[str]:
+    """Yield the HTML report one section at a time."""
+    e = html.escape
+    child = state.child_info
+    yield (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+        f"<title>Manufacturing Report - Gift {e(str(state.gift_id))}</title></head><body>\n"
+        f"<h1>Manufacturing Report - Gift {e(str(state.gift_id))}</h1>\n"
+        f"<p><strong>Date:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>"
+        f"<strong>Status:</strong> {e(state.status)}</p>\n"
+    )
+    yield (
+        "<h2>Child Information</h2><ul>"
+        f"<li><strong>Name:</strong> {e(child.name) if child else 'Unknown'}</li>"
+        f"<li><strong>Age:</strong> {child.age if child else 'Unknown'}</li>"
+        f"<li><strong>Location:</strong> {e(str(child.location)) if child else 'Unknown'}</li></ul>\n"
+    )
+    yield f"<h2>Gift Request</h2><p>{e(state.gift_request)}</p>\n"
+
+    yield (
+        f"<h2>Components Created ({len(state.components)})</h2>\n<table border=\"1\">"
+        "<tr><th>ID</th><th>Type</th><th>Material</th><th>Dimensions</th>"
+        "<th>Created by</th><th>Status</th><th>Details</th></tr>\n"
+    )
+    for c in state.components:
+        yield (
+            f"<tr><td>{e(c.id)}</td><td>{e(c.type)}</td><td>{e(c.material)}</td>"
+            f"<td>{e(c.dimensions)}</td><td>{e(c.created_by)}</td><td>{e(c.status)}</td>"
+            f"<td>{e(c.details)}</td></tr>\n"
+        )
+    yield "</table>\n"
+
+    agents = _agents(state)
+    yield f"<h2>Collaborating Agents ({len(agents)})</h2><ul>" + "".join(
+        f"<li>{e(agent)}</li>" for agent in agents
+    ) + "</ul>\n"
+
+    yield f"<h2>Manufacturing Log ({len(state.manufacturing_log)})</h2>\n<ol>\n"
+    for entry in state.manufacturing_log:
+        yield (
+            f"<li><code>{entry.timestamp}</code> <strong>{e(entry.agent)}</strong> - "
+            f"{e(entry.action)}<br>{e(entry.details)}</li>\n"
+        )
+    yield "</ol>\n"
+
+    if state.issues:
+        yield f"<h2>Issues Reported ({len(state.issues)})</h2>\n<ol>\n"
+        for issue in state.issues:
+            yield (
+                f"<li><strong>[{e(issue.severity.upper())}]</strong> {e(issue.reported_by)}: "
+                f"{e(issue.description)} <em>({issue.timestamp})</em></li>\n"
+            )
+        yield "</ol>\n"
+
+    yield "<p><em>Report generated by Elfactory Manufacturing System</em></p>\n</body></html>\n"
+
+
+def json_sections(state: WorkshopState) -> Iterator[str]:
+    """Yield the JSON report one top-level field at a time."""
+    data = state.model_dump(mode="json")
+    data["collaborating_agents"] = _agents(state)
+    yield "{\n"
+    for i, (key, value) in enumerate(data.items()):
+        separator = ",\n" if i < len(data) - 1 else "\n"
+        yield f"  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}{separator}"
+    yield "}\n"
+
+
+RENDERERS = {
+    "md": markdown_sections,
+    "json": json_sections,
+    "html": html_sections,
+}
+
+
+def write_report(state: WorkshopState, fmt: str, path: str | Path) -> Path:
+    """
+    Render a report and stream it to disk section by section.
+
+    The file is written next to its final path and renamed when complete, so
+    readers never see a partial report.
+
+    Args:
+        state: State to report on (a snapshot; it is not modified)
+        fmt: One of "md", "json", "html"
+        path: Destination file
+
+    Returns:
+        The written path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for section in RENDERERS[fmt](state):
+            f.write(section)
+    os.replace(tmp, path)
+    return path
+
+
+def report_paths(gift_id: str, formats: tuple[str, ...] | None = None) -> dict[str, Path]:
+    """Default report paths of a gift, keyed by format."""
+    formats = formats or configured_formats()
+    return {fmt: Path(settings.reports_dir) / f"{gift_id}_report.{fmt}" for fmt in formats}
+
+
+def configured_formats() -> tuple[str, ...]:
+    formats = tuple(f.strip() for f in settings.report_formats.split(",") if f.strip())
+    unknown = [f for f in formats if f not in RENDERERS]
+    if unknown:
+        raise ValueError(f"Unknown report formats: {unknown} (supported: {', '.join(FORMATS)})")
+    return formats
+
+
+class ReportWriter:
+    """
+    Single background thread that writes reports off the gift's critical path.
+
+    Jobs hold the live state; the writer takes its own snapshot when the job
+    runs, so submitting is O(1) and never blocks the workflow. After the
+    reports, the snapshot is handed to each exporter (e.g. the analytics store).
+    """
+
+    def __init__(self):
+        self._jobs: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.written: dict[str, dict[str, Path]] = {}
+        self.exporters: list[Callable[[WorkshopState], None]] = []
+
+    def submit(self, state: WorkshopState) -> None:
+        """Queue the reports of a gift in every configured format."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="report-writer", daemon=True)
+                self._thread.start()
+        self._jobs.put(state)
+
+    def _run(self) -> None:
+        while True:
+            state = self._jobs.get()
+            try:
+                self._process(state)
+            finally:
+                self._jobs.task_done()
+
+    def _process(self, state: WorkshopState) -> None:
+        snapshot = state.snapshot()
+        try:
+            paths = report_paths(snapshot.gift_id)
+            for fmt, path in paths.items():
+                write_report(snapshot, fmt, path)
+            self.written[snapshot.gift_id] = paths
+            logger.info(f"Reports for {snapshot.gift_id} written: {', '.join(map(str, paths.values()))}")
+        except Exception as e:
+            logger.error(f"Report generation failed for {snapshot.gift_id}: {e}")
+        for exporter in self.exporters:
+            try:
+                exporter(snapshot)
+            except Exception as e:
+                logger.error(f"Export of {snapshot.gift_id} failed: {e}")
+
+    def flush(self) -> None:
+        """Block until every queued report is written."""
+        self._jobs.join()
+
+
+class ReportTrigger:
+    """
+    Event listener that queues the reports when a gift reaches a terminal status.
+
+    Runs inside the event log lock, so it only enqueues.
+    """
+
+    def __init__(self, state: WorkshopState, writer: "ReportWriter"):
+        self.state = state
+        self.writer = writer
+        self.triggered = False
+
+    def __call__(self, event) -> None:
+        if event.type == "status_changed" and event.data["status"] in TERMINAL_STATUSES:
+            self.triggered = True
+            self.writer.submit(self.state)
+
+
+_writer: ReportWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_report_writer() -> ReportWriter:
+    """Get the process-wide report writer, flushed at interpreter exit."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ReportWriter()
+            if settings.analytics_db:
+                from elfactory.services.analytics_store import get_analytics_store
+
+                _writer.exporters.append(get_analytics_store(settings.analytics_db).export)
+            atexit.register(_writer.flush)
+        return _writer
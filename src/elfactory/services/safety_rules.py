@@ -0,0 +1,164 @@
+"""Deterministic child-safety rules over component columns."""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable
+
+import numpy as np
+
+from elfactory.core.state import WorkshopState
+
+# Small-parts test cylinder (16 CFR 1501): parts that fit are choking hazards under 3
+SMALL_PARTS_DIAMETER_MM = 31.7
+SMALL_PARTS_DEPTH_MM = 57.1
+SMALL_PARTS_MAX_AGE = 3
+# Swallowed button cells and small magnets are dangerous for every child
+INGESTION_MAX_AGE = 14
+# Below this age batteries need a screw-secured compartment and glass is not allowed
+BATTERY_COMPARTMENT_MAX_AGE = 8
+GLASS_MAX_AGE = 8
+
+GLASS_WORDS = {"glass", "vetro", "crystal", "cristallo"}
+NOT_GLASS_WORDS = {"acrylic", "acrilico", "plexiglass", "plexiglas", "plexi", "perspex", "polycarbonate", "policarbonato"}
+BATTERY_WORDS = {
+    "battery", "batteries", "batteria", "batterie", "pila", "pile", "lipo", "accumulator",
+    "accumulatore", "aa", "aaa", "cr2032", "lr44",
+}
+MAGNET_WORDS = {"magnet", "magnets", "magnetic", "magnete", "magneti", "calamita", "calamite"}
+
+_WORD = re.compile(r"[a-zà-ü0-9]+")
+
+
+@dataclass(slots=True)
+class SafetyFinding:
+    """A rule violation, or a case the rules cannot decide (severity "unknown")."""
+    gift_id: str | None
+    component_id: str
+    rule: str
+    severity: str
+    message: str
+
+
+@lru_cache(maxsize=4096)
+def material_flags(text: str) -> tuple[bool, bool, bool]:
+    """(glass, battery, magnet) for a component's type and material text."""
+    words = set(_WORD.findall(text.lower()))
+    glass = bool(words & GLASS_WORDS) and not words & NOT_GLASS_WORDS
+    return glass, bool(words & BATTERY_WORDS), bool(words & MAGNET_WORDS)
+
+
+class ComponentColumns:
+    """Components of one or many gifts as NumPy columns, with the child's age per row."""
+
+    def __init__(
+        self,
+        gift_ids: list[str | None],
+        component_ids: list[str],
+        ages: list[int | None],
+        extents: list[tuple[float | None, float | None, float | None]],
+        materials: list[str],
+    ):
+        """
+        Args:
+            gift_ids: Gift of each component
+            component_ids: Component IDs
+            ages: Age of the child of each component's gift (None when unknown)
+            extents: (max_mm, mid_mm, min_mm) of each component
+            materials: Type and material text of each component
+        """
+        self.gift_ids = gift_ids
+        self.component_ids = component_ids
+        self.age = np.array([np.nan if age is None else age for age in ages], dtype=np.float64)
+        size = np.array(extents, dtype=np.float64).reshape(len(component_ids), 3)
+        self.max_mm, self.mid_mm = size[:, 0], size[:, 1]
+
+        index: dict[str, int] = {}
+        codes = np.fromiter((index.setdefault(m, len(index)) for m in materials), dtype=np.int32, count=len(materials))
+        flags = np.array([material_flags(m) for m in index], dtype=bool).reshape(len(index), 3)[codes]
+        self.glass, self.battery, self.magnet = flags[:, 0], flags[:, 1], flags[:, 2]
+
+    def __len__(self) -> int:
+        return len(self.component_ids)
+
+    @classmethod
+    def from_states(cls, states: Iterable[WorkshopState]) -> "ComponentColumns":
+        """Build the columns from the components of several gifts."""
+        gift_ids, component_ids, ages, extents, materials = [], [], [], [], []
+        for state in states:
+            age = state.child_info.age if state.child_info else None
+            for component in state.components:
+                gift_ids.append(state.gift_id)
+                component_ids.append(component.id)
+                ages.append(age)
+                extents.append((component.max_mm, component.mid_mm, component.min_mm))
+                materials.append(f"{component.type} {component.material}")
+        return cls(gift_ids, component_ids, ages, extents, materials)
+
+    @classmethod
+    def from_analytics_store(cls, store) -> "ComponentColumns":
+        """Build the columns from every gift exported to an AnalyticsStore."""
+        columns = store.component_columns()
+        return cls(
+            columns["gift_id"], columns["component_id"], columns["child_age"],
+            list(zip(columns["max_mm"], columns["mid_mm"], columns["min_mm"])),
+            [f"{t} {m}" for t, m in zip(columns["type"], columns["material"])],
+        )
+
+
+def check_components(columns: ComponentColumns) -> list[SafetyFinding]:
+    """
+    Run every safety rule over all components at once.
+
+    A part fits the small-parts cylinder when its largest extent is within
+    the cylinder depth and its middle extent within the diameter (a part
+    whose largest extent is within the diameter fits whatever the others).
+    Rules that depend on unknown data (unparsed dimensions, unknown age)
+    produce "unknown" findings instead of passing silently.
+
+    Args:
+        columns: Components of one gift or of the whole season
+
+    Returns:
+        Findings, ordered by rule then component
+    """
+    age, max_mm = columns.age, columns.max_mm
+    mid_mm = np.where(np.isnan(columns.mid_mm), max_mm, columns.mid_mm)
+    fits = ((max_mm <= SMALL_PARTS_DEPTH_MM) & (mid_mm <= SMALL_PARTS_DIAMETER_MM)) | (max_mm <= SMALL_PARTS_DIAMETER_MM)
+    unsized = np.isnan(max_mm)
+    age_unknown = np.isnan(age)
+    ingestible = (columns.battery | columns.magnet) & (fits | unsized)
+
+    rules = [
+        ("choking_hazard", "high", (age < SMALL_PARTS_MAX_AGE) & fits,
+         "fits the small-parts cylinder, choking hazard under 3"),
+        ("small_battery", "high", (age < INGESTION_MAX_AGE) & columns.battery & fits,
+         "small battery (button cell) can be swallowed"),
+        ("small_magnet", "high", (age < INGESTION_MAX_AGE) & columns.magnet & fits,
+         "small magnet can be swallowed"),
+        ("glass", "high", (age < GLASS_MAX_AGE) & columns.glass,
+         f"glass part for a child under {GLASS_MAX_AGE}, use acrylic"),
+        ("battery_compartment", "medium", (age < BATTERY_COMPARTMENT_MAX_AGE) & columns.battery & ~fits,
+         "batteries need a screw-secured compartment"),
+        ("unparsed_dimensions", "unknown", unsized & ((age < SMALL_PARTS_MAX_AGE) | ingestible),
+         "dimensions could not be parsed, size rules undecided"),
+        ("age_unknown", "unknown", age_unknown & (fits | unsized | columns.glass | columns.battery | columns.magnet),
+         "child's age unknown, age rules undecided"),
+    ]
+
+    findings = []
+    for rule, severity, mask, message in rules:
+        for i in np.flatnonzero(mask):
+            findings.append(SafetyFinding(
+                gift_id=columns.gift_ids[i],
+                component_id=columns.component_ids[i],
+                rule=rule,
+                severity=severity,
+                message=message,
+            ))
+    return findings
+
+
+def check_gift(state: WorkshopState) -> list[SafetyFinding]:
+    """Safety findings for the components of one gift."""
+    return check_components(ComponentColumns.from_states([state]))
@@ -0,0 +1,125 @@
+"""Thread-safe LRU cache with a TTL, shared through a JSON file across restarts and workers."""
+
+import atexit
+import json
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+
+_persisted: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+
+class TTLCache:
+    """
+    LRU cache of strings with a TTL, optionally persisted to a JSON file.
+
+    put() only updates memory and schedules a flush on a timer thread, so
+    callers on the event loop never wait on disk. The flush merges what other
+    processes saved meanwhile and rewrites the file atomically, so workers
+    sharing the file converge.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None,
+        ttl_seconds: float,
+        max_entries: int,
+        flush_delay_seconds: float = 2.0,
+    ):
+        """
+        Args:
+            path: JSON file (None keeps the cache in memory only)
+            ttl_seconds: Age after which an entry is dropped
+            max_entries: Least recently used entries beyond this are dropped
+            flush_delay_seconds: Puts within this window are written together
+        """
+        self.path = Path(path) if path else None
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.flush_delay_seconds = flush_delay_seconds
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()  # key -> (value, expires_at)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # One writer at a time; held across the file I/O
+        self._timer: threading.Timer | None = None
+        self._dirty = False
+        if self.path:
+            self._entries.update(self._read())
+            _persisted.add(self)
+
+    def _read(self) -> dict[str, tuple[str, float]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+        now = time.time()
+        return {key: (value, expires) for key, (value, expires) in data.items() if expires > now}
+
+    def get(self, key: str) -> str | None:
+        """Cached value, refreshed as most recently used, or None."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if item[1] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return item[0]
+
+    def put(self, key: str, value: str) -> None:
+        """Store a value; the file is written later by flush()."""
+        with self._lock:
+            self._entries[key] = (value, time.time() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if not self.path:
+                return
+            self._dirty = True
+            # A timer inherited through fork is not running in this process
+            if self._timer is None or not self._timer.is_alive():
+                self._timer = threading.Timer(self.flush_delay_seconds, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Merge the file with the entries put since the last flush and rewrite it."""
+        if not self.path:
+            return
+        with self._flush_lock:
+            with self._lock:
+                self._timer = None  # Puts from now on schedule the next flush
+                if not self._dirty:
+                    return
+                self._dirty = False
+            saved = self._read()
+            with self._lock:
+                for other, item in saved.items():
+                    if other not in self._entries:
+                        self._entries[other] = item
+                        self._entries.move_to_end(other, last=False)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                data = json.dumps(self._entries, ensure_ascii=False)
+            self._write(data)
+
+    def _write(self, data: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(data, encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def flush_ttl_caches() -> None:
+    """Write every persisted cache's pending entries (at exit, or before a forked worker leaves)."""
+    for cache in list(_persisted):
+        cache.flush()
+
+
+atexit.register(flush_ttl_caches)
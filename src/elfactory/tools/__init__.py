@@ -1,25 +1,39 @@
-"""Tools module for agent interactions."""
-
-from .state_tools import (
-    read_project_state,
-    write_component,
-    report_issue,
-    update_status,
-    log_manufacturing_action,
-    set_child_info,
-)
-from .image_tools import generate_gift_image
-from .email_tools import send_gift_email
-from .report_tools import generate_manufacturing_report
-
-__all__ = [
-    "read_project_state",
-    "write_component",
-    "report_issue",
-    "update_status",
-    "log_manufacturing_action",
-    "set_child_info",
-    "generate_gift_image",
-    "send_gift_email",
-    "generate_manufacturing_report",
-]
+"""Tools module for agent interactions.
+
+Tools are loaded on first access, so importing one tool does not pull in the
+Gmail or OpenAI stacks needed by the others.
+"""
+
+import importlib
+
+_TOOL_MODULES = {
+    "read_project_state": ".state_tools",
+    "write_component": ".state_tools",
+    "write_components": ".state_tools",
+    "report_issue": ".state_tools",
+    "update_status": ".state_tools",
+    "log_manufacturing_action": ".state_tools",
+    "set_child_info": ".state_tools",
+    "set_design": ".state_tools",
+    "generate_gift_image": ".image_tools",
+    "send_gift_email": ".email_tools",
+    "generate_manufacturing_report": ".report_tools",
+    "request_rework": ".rework_tools",
+    "check_safety_rules": ".quality_tools",
+    "search_products": ".search_tools",
+    "record_purchase": ".search_tools",
+}
+
+__all__ = list(_TOOL_MODULES)
+
+
+def __getattr__(name: str):
+    if name not in _TOOL_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_TOOL_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
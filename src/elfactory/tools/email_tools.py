@@ -1,12 +1,8 @@
 """Email sending tools for final gift responses."""
 
-import base64
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.image import MIMEImage
 from pathlib import Path
 from datapizza.tools import tool
-from elfactory.services.gmail_service import GmailService
+from elfactory.services.outbox import get_outbox
 from elfactory.tools.state_tools import active_gifts, current_gift_id
 
 
@@ -20,6 +16,9 @@ def send_gift_email(
     """
     Send the final gift response email to the child.
 
+    The email is queued in the workshop outbox and delivered in the
+    background, with retries; this returns as soon as it is queued.
+
     Args:
         recipient_email: Email address of the recipient
         subject: Email subject line
@@ -31,49 +30,26 @@ def send_gift_email(
     """
     gift_id = current_gift_id.get()
 
-    try:
-        gmail = GmailService()
-
-        message = MIMEMultipart('related')
-        message['To'] = recipient_email
-        message['Subject'] = subject
-
-        # Replace image placeholder if image exists
-        if image_path and Path(image_path).exists():
-            html_body = html_body.replace('[IMAGE_PLACEHOLDER]', '<img src="cid:gift_image" style="max-width: 600px; height: auto;" />')
-
-        # IMPORTANT: Attach HTML BEFORE images for proper inline display
-        html_part = MIMEText(html_body, 'html')
-        message.attach(html_part)
-
-        # Attach image after HTML
-        if image_path and Path(image_path).exists():
-            with open(image_path, 'rb') as f:
-                img_data = f.read()
-            image = MIMEImage(img_data)
-            image.add_header('Content-ID', '<gift_image>')
-            image.add_header('Content-Disposition', 'inline', filename='gift.png')
-            message.attach(image)
-
-        raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
-
-        gmail.service.users().messages().send(
-            userId='me',
-            body={'raw': raw_message}
-        ).execute()
+    if not recipient_email or "@" not in recipient_email:
+        return f"✗ Invalid recipient email: {recipient_email!r}"
+    if image_path and not Path(image_path).exists():
+        return f"✗ Image not found: {image_path}"
 
+    try:
         state = active_gifts.get(gift_id)
+        outbox_id = get_outbox().enqueue(recipient_email, subject, html_body, image_path, state=state)
+
         if state:
             state.log_action(
                 agent="email_sender",
-                action="send_email",
-                details=f"Email sent to {recipient_email} with subject: {subject}"
+                action="queue_email",
+                details=f"Email #{outbox_id} queued for {recipient_email} with subject: {subject}"
             )
             # Store the final response email content
-            state.final_response = f"Subject: {subject}\n\n{html_body}"
-            state.update_status("email_sent")
+            state.set_field("final_response", f"Subject: {subject}\n\n{html_body}")
+            state.update_status("email_queued")
 
-        return f"✓ Email sent successfully to {recipient_email}"
+        return f"✓ Email queued for delivery to {recipient_email} (outbox #{outbox_id})"
 
     except Exception as e:
-        return f"✗ Error sending email: {str(e)}"
+        return f"✗ Error queuing email: {str(e)}"
@@ -1,12 +1,18 @@
 """Image generation tools using DALL-E."""
 
+import asyncio
 from pathlib import Path
 from datapizza.tools import tool
-from openai import OpenAI
 from elfactory.config import settings
+from elfactory.services.rate_limiter import get_rate_limiter
 from elfactory.tools.state_tools import active_gifts, current_gift_id
 
 
+def gift_image_path(gift_id: str) -> Path:
+    """Default location of the image of a gift."""
+    return Path("logs/images") / f"{gift_id}.png"
+
+
 @tool
 def generate_gift_image(image_prompt: str, save_path: str = None) -> str:
     """
@@ -19,17 +25,30 @@ def generate_gift_image(image_prompt: str, save_path: str = None) -> str:
     Returns:
         Path to the generated image file
     """
-    gift_id = current_gift_id.get()
+    # The generation is awaited on datapizza's event loop, shared by every
+    # sub-agent, which does not see the caller's contextvars: bind the gift now
+    return _generate_gift_image(current_gift_id.get(), image_prompt, save_path)
+
+
+async def _generate_gift_image(gift_id: str, image_prompt: str, save_path: str | None) -> str:
+    from openai import AsyncOpenAI
+    from elfactory.core.budget import active_budgets
+
+    budget = active_budgets.get(gift_id)
+    if budget:
+        budget.check()
 
     if not save_path:
-        images_dir = Path("logs/images")
-        images_dir.mkdir(parents=True, exist_ok=True)
-        save_path = str(images_dir / f"{gift_id}.png")
+        image_path = gift_image_path(gift_id)
+        image_path.parent.mkdir(parents=True, exist_ok=True)
+        save_path = str(image_path)
 
     try:
-        client = OpenAI(api_key=settings.openai_api_key)
-
-        response = client.images.generate(
+        # Retries are handled by the shared image limiter; every wait is
+        # awaited so a throttled image does not stall the other gifts
+        client = AsyncOpenAI(api_key=settings.openai_api_key, max_retries=0)
+        response = await get_rate_limiter("image").a_call(
+            client.images.generate,
             model="dall-e-3",
             prompt=image_prompt,
             size="1024x1024",
@@ -40,17 +59,26 @@ def generate_gift_image(image_prompt: str, save_path: str = None) -> str:
         image_url = response.data[0].url
 
         import requests
-        img_data = requests.get(image_url).content
+        img_data = (await asyncio.to_thread(requests.get, image_url, timeout=60)).content
+        await asyncio.to_thread(Path(save_path).write_bytes, img_data)
+
+        # Email-sized copy and thumbnail, so the outbox attaches ~150 KB instead of the full PNG
+        from elfactory.services.email_images import prepare_email_images
 
-        with open(save_path, 'wb') as f:
-            f.write(img_data)
+        variants = ""
+        try:
+            email_image, thumb = await asyncio.to_thread(prepare_email_images, save_path)
+            if email_image != Path(save_path):
+                variants = f" (email copy: {email_image}, thumbnail: {thumb})"
+        except Exception as e:
+            variants = f" (email copy not created: {e})"
 
         state = active_gifts.get(gift_id)
         if state:
             state.log_action(
                 agent="image_generator",
                 action="image_generation",
-                details=f"Generated gift image using DALL-E. Saved to: {save_path}"
+                details=f"Generated gift image using DALL-E. Saved to: {save_path}{variants}"
             )
 
         return f"✓ Gift image generated successfully and saved to: {save_path}"
@@ -0,0 +1,34 @@
+"""Deterministic inspection tools used by the Quality Manager."""
+
+from datapizza.tools import tool
+from elfactory.services.safety_rules import check_gift
+from elfactory.tools.state_tools import active_gifts, current_gift_id
+
+
+@tool
+def check_safety_rules() -> str:
+    """
+    Run the workshop's deterministic child-safety rules on every component.
+
+    Checks parsed component sizes against the small-parts cylinder for the
+    child's age, small batteries and magnets, glass parts and battery
+    compartments. Runs in microseconds; use it before reading the full state.
+
+    Returns:
+        "✓" when no rule fires, otherwise one line per finding with the
+        component ID, rule and severity ("unknown" = rules could not decide)
+    """
+    gift_id = current_gift_id.get()
+    state = active_gifts.get(gift_id)
+
+    if not state:
+        return "Error: No active gift project found"
+
+    snapshot = state.snapshot()
+    findings = check_gift(snapshot)
+    if not findings:
+        return f"✓ All {len(snapshot.components)} components pass the safety rules"
+
+    lines = [f"✗ {len(findings)} safety rule findings:"]
+    lines += [f"- {f.component_id}: {f.rule} ({f.severity}) - {f.message}" for f in findings]
+    return "\n".join(lines)
@@ -0,0 +1,165 @@
+"""Targeted rework tools used by the Quality Manager."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+from datapizza.tools import tool
+from elfactory.config import settings
+from elfactory.tools.state_tools import active_gifts, current_gift_id
+from elfactory.utils.agent_logger import get_agent_logger
+
+if TYPE_CHECKING:
+    from datapizza.agents import Agent
+
+# Artisan agents by name, registered by the orchestrator
+rework_artisans: dict[str, "Agent"] = {}
+
+
+def register_rework_artisans(artisans: list["Agent"]) -> None:
+    """
+    Make artisans available for targeted rework.
+
+    Args:
+        artisans: Artisan agents; matched against Component.created_by by name
+    """
+    rework_artisans.update({artisan.name: artisan for artisan in artisans})
+
+
+REWORK_TASK = """REWORK REQUEST from quality_manager (gift {gift_id}, rework {iteration}/{max_iterations}).
+
+Fix ONLY these components you created:
+{components}
+
+Required fix: {instructions}
+
+Re-register each fixed component with write_component() using the SAME component_id,
+log the fix briefly with log_manufacturing_action(), and reply in one sentence.
+SIMULATION MODE: all materials are in stock."""
+
+
+@tool
+async def request_rework(component_ids: list[str], instructions: str) -> str:
+    """
+    Send specific components back to the artisans who created them.
+
+    Only the artisans listed in each component's created_by field are called,
+    so a rework costs one artisan turn per affected artisan instead of a full
+    production pass. The number of rework rounds per gift is capped.
+
+    Args:
+        component_ids: IDs of the components that need fixing (from read_project_state)
+        instructions: The specific PHYSICAL fix required
+
+    Returns:
+        Summary of the rework performed, or why it was refused
+    """
+    from elfactory.core.budget import BudgetExceededError, get_current_budget
+    from elfactory.core.delegation import delegation_call
+
+    gift_id = current_gift_id.get()
+    state = active_gifts.get(gift_id)
+
+    if not state:
+        return "Error: No active gift project found"
+
+    max_iterations = settings.max_rework_iterations
+    if state.rework_iterations >= max_iterations:
+        state.add_issue(
+            reported_by="quality_manager",
+            severity="medium",
+            description=f"Rework limit ({max_iterations}) reached; unresolved: {instructions}",
+        )
+        return (
+            f"✗ Rework limit reached ({max_iterations} rounds). "
+            "Make a final PASS or FAIL decision with the components as they are."
+        )
+
+    budget = get_current_budget()
+    if budget:
+        budget.check()
+
+    by_artisan: dict[str, list] = {}
+    unknown = []
+    components = {component.id: component for component in state.snapshot().components}
+    reworkable = []
+    for component_id in component_ids:
+        component = components.get(component_id)
+        if component is None or component.created_by not in rework_artisans:
+            unknown.append(component_id)
+            continue
+        reworkable.append(component_id)
+    for component in state.set_components_status(reworkable, "rework_requested"):
+        by_artisan.setdefault(component.created_by, []).append(component)
+
+    if not by_artisan:
+        return f"✗ No reworkable components found for IDs: {', '.join(unknown)}"
+
+    iteration = state.rework_iterations + 1
+    state.set_field("rework_iterations", iteration)
+    started = time.monotonic()
+    logger = get_agent_logger()
+
+    async def rework(artisan_name: str, parts: list) -> str:
+        task = REWORK_TASK.format(
+            gift_id=gift_id,
+            iteration=iteration,
+            max_iterations=max_iterations,
+            components="\n".join(
+                f"- {c.id} ({c.type}, {c.material}, {c.dimensions}): {c.details}" for c in parts
+            ),
+            instructions=instructions,
+        )
+        logger.log_delegation("quality_manager", artisan_name, f"rework {[c.id for c in parts]}")
+        # Same path as a delegation: gift context, budget check, deadline
+        result = await delegation_call(rework_artisans[artisan_name])(task)
+        return f"{artisan_name}: {result or 'no response'}"
+
+    results: list = []
+    try:
+        results = await asyncio.gather(
+            *(rework(name, parts) for name, parts in by_artisan.items()), return_exceptions=True
+        )
+    finally:
+        elapsed = time.monotonic() - started
+        state.set_field("rework_latency_seconds", state.rework_latency_seconds + elapsed)
+        if len(results) == len(by_artisan):
+            failed = {name: r for name, r in zip(by_artisan, results) if isinstance(r, BaseException)}
+        else:  # Cancelled before the artisans finished
+            failed = dict.fromkeys(by_artisan, "cancelled")
+        for name, error in failed.items():
+            if isinstance(error, BaseException):
+                logger.log_error(name, error)
+            state.add_issue(
+                reported_by="quality_manager",
+                severity="medium",
+                description=f"Rework {iteration}/{max_iterations} by {name} failed: {error}",
+            )
+        # Components not re-registered by their artisan go back to their previous status
+        left = {c.id for c in state.snapshot().components if c.id in reworkable and c.status == "rework_requested"}
+        previous: dict[str, list[str]] = {}
+        for component_id in left:
+            previous.setdefault(components[component_id].status, []).append(component_id)
+        for status, ids in previous.items():
+            state.set_components_status(ids, status)
+        state.log_action(
+            agent="quality_manager",
+            action="rework",
+            details=(
+                f"Rework {iteration}/{max_iterations} of {sum(len(p) for p in by_artisan.values())} "
+                f"component(s) by {', '.join(by_artisan)} in {elapsed:.1f}s"
+                f"{f' ({len(failed)} failed)' if failed else ''}: {instructions}"
+            ),
+        )
+
+    for error in results:
+        if isinstance(error, BudgetExceededError):
+            raise error
+    summary = "\n".join(
+        f"{name}: ✗ failed ({type(result).__name__}: {result})" if isinstance(result, BaseException) else result
+        for name, result in zip(by_artisan, results)
+    )
+    if unknown:
+        summary += f"\nSkipped unknown components: {', '.join(unknown)}"
+    if len(failed) == len(by_artisan):
+        return f"✗ Rework {iteration}/{max_iterations} failed; the components are unchanged.\n{summary}"
+    return f"✓ Rework {iteration}/{max_iterations} completed. Re-inspect the fixed components.\n{summary}"
@@ -0,0 +1,108 @@
+"""Product search tools used by the Online Shopper Elf."""
+
+from datapizza.tools import tool
+from elfactory.services.product_catalog import get_product_catalog
+from elfactory.services.product_search import get_product_search
+from elfactory.tools.state_tools import active_gifts, current_gift_id
+
+
+def _format_catalog_item(item: dict) -> str:
+    price = f"{item['price']:.2f} {item['currency']}" if item["price"] is not None else "price n/a"
+    ages = f"ages {item['age_min']}+" if item["age_max"] >= 99 else f"ages {item['age_min']}-{item['age_max']}"
+    details = ", ".join(part for part in (item["category"], ages, price, item["retailer"]) if part)
+    return f"[{item['name']}]({item['url']})\n{details}"
+
+
+@tool
+def search_products(queries: list[str]) -> str:
+    """
+    Search for products, running all candidate queries at once.
+
+    Pass every query you want to try in ONE call (e.g. the exact product, a
+    close alternative and a query with the retailer or age range). Each query
+    is first looked up in the workshop's product catalog (filtered by the
+    child's age); the others run on the web in parallel, and results of
+    queries searched before are returned instantly from the cache.
+
+    Args:
+        queries: Search queries (e.g. ["LEGO Star Wars Millennium Falcon 75375", "LEGO Star Wars 8 anni"])
+
+    Returns:
+        Products (title, link, details) grouped by query, catalog hits marked
+    """
+    if not queries:
+        return "✗ No queries given"
+
+    # The search is awaited on datapizza's event loop, shared by every
+    # sub-agent, which does not see the caller's contextvars: read the gift now
+    state = active_gifts.get(current_gift_id.get(None))
+    age = state.child_info.age if state is not None and state.child_info else None
+    return _search_products(queries, age)
+
+
+async def _search_products(queries: list[str], age: int | None) -> str:
+    catalog = get_product_catalog()
+
+    sections = {}
+    found = 0
+    web_queries = []
+    for query in dict.fromkeys(queries):
+        items = catalog.search(query, age=age) if catalog is not None else []
+        if items:
+            found += len(items)
+            sections[query] = "(workshop catalog)\n\n" + "\n\n".join(map(_format_catalog_item, items))
+        else:
+            web_queries.append(query)
+
+    if web_queries:
+        for query, results in (await get_product_search().a_search_many(web_queries)).items():
+            if isinstance(results, str):
+                sections[query] = f"✗ {results}"
+                continue
+            found += len(results)
+            sections[query] = "\n\n".join(f"[{r['title']}]({r['href']})\n{r['body']}" for r in results) or "No results"
+
+    status = f"✓ {found} results" if found else "✗ No results"
+    body = "\n\n".join(f"## {query}\n\n{sections[query]}" for query in dict.fromkeys(queries))
+    return f"{status} for {len(sections)} queries\n\n{body}"
+
+
+@tool
+def record_purchase(
+    product_name: str,
+    product_url: str,
+    price: str,
+    age_rating: str,
+    safety_certifications: list[str],
+) -> str:
+    """
+    Record the product selected for the gift, with its safety and age rating.
+
+    Copy the age rating and safety marks from the product page or catalog
+    entry; leave them empty when the listing does not state them, never
+    guess. Quality inspection checks them before the gift goes on.
+
+    Args:
+        product_name: Name of the selected product
+        product_url: Link to buy it
+        price: Price with currency (e.g., "39.99 EUR")
+        age_rating: Manufacturer age rating (e.g., "8+", "3-12"), empty if not stated
+        safety_certifications: Safety marks stated for the product (e.g., ["CE", "EN71"]), empty if none
+
+    Returns:
+        Confirmation message
+    """
+    state = active_gifts.get(current_gift_id.get(None))
+    if state is None:
+        return "Error: No active gift project found"
+
+    certifications = [mark.strip() for mark in safety_certifications if mark.strip()]
+    state.set_field("purchase", {
+        "product_name": product_name,
+        "product_url": product_url,
+        "price": price,
+        "age_rating": age_rating.strip(),
+        "safety_certifications": certifications,
+    })
+    state.log_action("online_shopper_elf", "purchase_recorded", f"{product_name} ({product_url})")
+    return f"✓ Purchase recorded: {product_name}"
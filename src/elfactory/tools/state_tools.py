@@ -3,6 +3,9 @@
 import json
 from contextvars import ContextVar
 from datapizza.tools import tool
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from pydantic_core import to_json
+from elfactory.config import settings
 from elfactory.utils.agent_logger import get_agent_logger
 
 active_gifts: dict[str, "WorkshopState"] = {}
@@ -14,11 +17,11 @@ def read_project_state() -> str:
     """
     Read the current state of the gift project.
 
-    Returns a JSON representation of the complete WorkshopState including:
+    Returns a JSON representation of the WorkshopState including:
     - Child information
     - Gift request details
     - All components created so far
-    - Manufacturing log
+    - Manufacturing log: the most recent entries, older ones summarized per agent
     - Issues and quality reports
     - Current status
 
@@ -30,7 +33,8 @@ def read_project_state() -> str:
     if not state:
         return json.dumps({"error": "No active gift project found"})
 
-    return state.model_dump_json(indent=2)
+    # pydantic_core's encoder is several times faster than json.dumps on large views
+    return to_json(state.agent_view(settings.agent_log_tail, settings.agent_log_details_chars)).decode()
 
 
 @tool
@@ -79,6 +83,98 @@ def write_component(
     return f"✓ Component '{component_id}' successfully registered by {created_by}"
 
 
+def _list_parameter(model: type[BaseModel], description: str) -> dict:
+    """
+    Plain JSON schema of a tool parameter holding a list of model.
+
+    Tool parameters are declared as list[dict] and validated inside the tool:
+    datapizza builds the schema of a pydantic annotation with jsonref, whose
+    proxies the LLM clients cannot serialize. Flat models have no $ref, so
+    their own schema can be used as the item schema.
+    """
+    items = model.model_json_schema()
+    items.pop("title", None)
+    return {"type": "array", "items": items, "description": description}
+
+
+class ComponentSpec(BaseModel):
+    """One part registered through write_components()."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    component_id: str = Field(description="Unique identifier (e.g., \"wheel_left\")")
+    component_type: str = Field(description="Type of component (e.g., \"wheel\", \"shell\")")
+    material: str = Field(description="Material used (e.g., \"red PLA\", \"steel\")")
+    dimensions: str = Field(description="Size specifications (e.g., \"15x10x5cm\")")
+    details: str = Field(description="Additional details about the component")
+    action: str = Field(description="Manufacturing action for the log (e.g., \"printing\", \"forging\")")
+
+
+_component_specs = TypeAdapter(list[ComponentSpec])
+
+
+@tool
+def write_components(components: list[dict], created_by: str) -> str:
+    """
+    Register several newly created components at once and log their manufacturing.
+
+    Prefer this over repeated write_component() + log_manufacturing_action() calls
+    when you produce more than one part: everything is registered in one step.
+
+    Args:
+        components: All the parts you produced, each with its log action
+        created_by: Name of the elf agent who created them (e.g., "blacksmith_elf")
+
+    Returns:
+        Confirmation message with the registered component IDs
+    """
+    gift_id = current_gift_id.get()
+    state = active_gifts.get(gift_id)
+
+    if not state:
+        return "Error: No active gift project found"
+
+    try:
+        specs = _component_specs.validate_python(components)
+    except ValidationError as e:
+        return f"✗ No components registered, invalid input: {e}"
+
+    state.add_components(
+        [
+            {
+                "id": spec.component_id,
+                "type": spec.component_type,
+                "material": spec.material,
+                "dimensions": spec.dimensions,
+                "details": spec.details,
+                "created_by": created_by,
+                "status": "completed",
+            }
+            for spec in specs
+        ],
+        [
+            {
+                "agent": created_by,
+                "action": spec.action,
+                "details": f"{spec.component_type} '{spec.component_id}' in {spec.material} ({spec.dimensions})",
+            }
+            for spec in specs
+        ],
+    )
+
+    logger = get_agent_logger()
+    for spec in specs:
+        logger.log_component_created(spec.component_id, spec.component_type, created_by)
+
+    ids = ", ".join(spec.component_id for spec in specs)
+    return f"✓ {len(specs)} components registered and logged by {created_by}: {ids}"
+
+
+write_components.properties["components"] = _list_parameter(
+    ComponentSpec, "All the parts you produced, each with its log action"
+)
+
+
 @tool
 def report_issue(
     reported_by: str,
@@ -191,18 +287,74 @@ def set_child_info(
     Returns:
         Confirmation message
     """
-    from elfactory.core.state import ChildInfo
-
     gift_id = current_gift_id.get()
     state = active_gifts.get(gift_id)
 
     if not state:
         return "Error: No active gift project found"
 
-    state.child_info = ChildInfo(
-        name=name,
-        age=age,
-        location=location,
-    )
+    state.set_child_info({
+        "name": name,
+        "age": age,
+        "location": location,
+    })
 
     return f"✓ Child information set: {name}, age {age}, from {location}"
+
+
+class BomLine(BaseModel):
+    """One bill-of-materials line recorded through set_design()."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    name: str = Field(description="Part or material name (e.g., \"body shell\")")
+    material_type: str = Field(description="Material (e.g., \"PLA\", \"oak wood\", \"steel\")")
+    quantity: str = Field(description="Amount with unit (e.g., \"250 g\", \"4 pcs\", \"1.2 m\")")
+    specifications: str = Field(description="Size, color or other specifications")
+    artisan: str = Field(description="Artisan elf who will use it (e.g., \"3d_printer_elf\")")
+
+
+_bom_lines = TypeAdapter(list[BomLine])
+
+
+@tool
+def set_design(
+    feasibility: str,
+    manufacturing_decision: str,
+    blueprint: str,
+    bill_of_materials: list[dict],
+) -> str:
+    """
+    Save the design decision, blueprint and bill of materials in the workshop state.
+
+    Args:
+        feasibility: fattibile or impossibile
+        manufacturing_decision: manufattura or acquisto_online
+        blueprint: Concise blueprint (main components, materials, assembly steps)
+        bill_of_materials: Materials needed, one line per material and artisan
+
+    Returns:
+        Confirmation message
+    """
+    gift_id = current_gift_id.get()
+    state = active_gifts.get(gift_id)
+
+    if not state:
+        return "Error: No active gift project found"
+
+    try:
+        lines = _bom_lines.validate_python(bill_of_materials)
+    except ValidationError as e:
+        return f"✗ Design not saved, invalid bill of materials: {e}"
+
+    state.set_field("feasibility", feasibility)
+    state.set_field("manufacturing_decision", manufacturing_decision)
+    state.set_field("blueprint", blueprint)
+    state.set_field("bill_of_materials", [line.model_dump() for line in lines])
+
+    return f"✓ Design saved: {feasibility}, {manufacturing_decision}, {len(lines)} BOM lines"
+
+
+set_design.properties["bill_of_materials"] = _list_parameter(
+    BomLine, "Materials needed, one line per material and artisan"
+)